@@ -0,0 +1,129 @@
+from typing import TYPE_CHECKING
+from typing import Optional
+
+from apu.registers import CHANNELS_END
+from apu.registers import CHANNELS_START
+from apu.registers import NR52
+from apu.registers import WAVE_RAM_END
+from apu.registers import WAVE_RAM_START
+from apu.registers import channel_register
+from apu.status import ChannelStatus
+from apu.status import next_sweep_clock
+from mmu.memory import Memory
+from ppu.ppu import FRAME_CYCLES
+
+if TYPE_CHECKING:
+    from apu.output import AudioOutput
+
+# Samples are synthesized once per LCD frame
+FRAME_EVENT = 'apu.frame'
+SWEEP_EVENT = 'apu.sweep'
+# Length counter of each channel running out
+LENGTH_EVENTS = tuple(f'apu.length{number}' for number in range(4))
+
+
+class APU:
+    """Sound controller.
+
+    NR52 always reads which channels are on: the length counters are worked out from the time they were
+    written at, with an event when one runs out. The sweep, which can also turn channel 1 off, is clocked
+    only while it is active.
+
+    Samples are only generated with an output, by apu.synthesizer.Synthesizer, which needs NumPy.
+    """
+
+    def __init__(self, memory: Memory, output: Optional['AudioOutput'] = None):
+        self._memory = memory
+        self._scheduler = memory.scheduler
+        self._channels = tuple(ChannelStatus(number) for number in range(4))
+        self._powered = True
+        self._next_sweep = 0
+        memory.content[NR52] = 0x80
+
+        for address in range(CHANNELS_START, NR52 + 1):
+            memory.add_write_hook(address, lambda value, address=address: self._write(address, value))
+
+        self._synthesizer = None
+        if output is not None:
+            from apu.synthesizer import Synthesizer
+
+            self._synthesizer = Synthesizer(output, self._scheduler.cycles)
+            for address in range(WAVE_RAM_START, WAVE_RAM_END):
+                memory.add_write_hook(address, lambda value, address=address: self._write(address, value))
+            self._scheduler.schedule(FRAME_EVENT, FRAME_CYCLES, self._end_frame)
+
+    def flush(self) -> None:
+        """Synthesizes the samples up to now."""
+        if self._synthesizer:
+            self._synthesizer.flush(self._scheduler.cycles)
+
+    def close(self) -> None:
+        if self._synthesizer:
+            self._synthesizer.close(self._scheduler.cycles)
+
+    def _end_frame(self) -> None:
+        self.flush()
+        self._scheduler.schedule(FRAME_EVENT, FRAME_CYCLES, self._end_frame)
+
+    def _write(self, address: int, value: int) -> None:
+        if not self._powered and address < NR52:
+            # Ignored until the APU is powered on again
+            self._memory.content[address] = 0
+            return
+
+        cycles = self._scheduler.cycles
+        if self._synthesizer:
+            self._synthesizer.write(cycles, address, value)
+
+        if address == NR52:
+            self._set_power(bool(value & 0x80))
+        elif address < CHANNELS_END:
+            number, register = channel_register(address)
+            channel = self._channels[number]
+            channel.write(register, value, cycles)
+            self._schedule_length_expiry(channel)
+            if channel.sweep:
+                self._schedule_sweep()
+
+        self._update_nr52()
+
+    def _set_power(self, powered: bool) -> None:
+        if self._powered and not powered:
+            self._memory.content[CHANNELS_START:NR52] = bytes(NR52 - CHANNELS_START)
+            self._channels = tuple(ChannelStatus(number) for number in range(4))
+            for event in LENGTH_EVENTS:
+                self._scheduler.cancel(event)
+            self._scheduler.cancel(SWEEP_EVENT)
+        self._powered = powered
+
+    def _update_nr52(self) -> None:
+        status = sum(1 << channel.number for channel in self._channels if channel.enabled)
+        self._memory.content[NR52] = (0x80 if self._powered else 0) | status
+
+    def _schedule_length_expiry(self, channel: ChannelStatus) -> None:
+        expiry = channel.length_expiry()
+        if expiry is None:
+            self._scheduler.cancel(LENGTH_EVENTS[channel.number])
+        else:
+            self._scheduler.schedule_at(LENGTH_EVENTS[channel.number], expiry, lambda: self._expire(channel))
+
+    def _expire(self, channel: ChannelStatus) -> None:
+        channel.enabled = False
+        self._update_nr52()
+
+    def _schedule_sweep(self) -> None:
+        channel = self._channels[0]
+        if channel.enabled and channel.sweep.enabled:
+            if not self._scheduler.is_scheduled(SWEEP_EVENT):
+                self._next_sweep = next_sweep_clock(self._scheduler.cycles)
+                self._scheduler.schedule_at(SWEEP_EVENT, self._next_sweep, self._clock_sweep)
+        else:
+            self._scheduler.cancel(SWEEP_EVENT)
+
+    def _clock_sweep(self) -> None:
+        channel = self._channels[0]
+        channel.clock_sweep()
+        self._update_nr52()
+        if channel.enabled and channel.sweep.enabled:
+            self._next_sweep = next_sweep_clock(self._next_sweep)
+            self._scheduler.schedule_at(SWEEP_EVENT, self._next_sweep, self._clock_sweep)
@@ -0,0 +1,238 @@
+from typing import Optional
+
+import numpy as np
+
+from apu.registers import is_dac_enabled
+from apu.status import Sweep
+
+# Waveforms of the pulse channels for each duty cycle: 12.5%, 25%, 50% and 75%
+DUTY_CYCLES = np.array([
+    [0, 0, 0, 0, 0, 0, 0, 1],
+    [1, 0, 0, 0, 0, 0, 0, 1],
+    [1, 0, 0, 0, 0, 1, 1, 1],
+    [0, 1, 1, 1, 1, 1, 1, 0],
+], dtype=np.int64)
+
+# Cycles between two LFSR shifts for each divisor code of NR43, before the clock shift
+NOISE_DIVISORS = (8, 16, 32, 48, 64, 80, 96, 112)
+
+# Right shift of the wave samples for each volume code of NR32: mute, 100%, 50% and 25%
+WAVE_VOLUME_SHIFTS = (4, 0, 1, 2)
+
+_lfsr_sequences = {}
+
+
+def lfsr_sequence(short: bool) -> np.ndarray:
+    """Returns the output of the noise LFSR from its reset state over a full period: 127 shifts in 7-bit
+    mode, 32767 otherwise.
+
+    Rendering noise is then a lookup at the number of shifts since the channel was triggered.
+    """
+    if short not in _lfsr_sequences:
+        lfsr = 0x7fff
+        output = []
+        for _ in range(127 if short else 32767):
+            feedback = (lfsr ^ (lfsr >> 1)) & 1
+            lfsr = (lfsr >> 1) | (feedback << 14)
+            if short:
+                lfsr = lfsr & ~(1 << 6) | (feedback << 6)
+            output.append(~lfsr & 1)
+        _lfsr_sequences[short] = np.array(output, dtype=np.int64)
+
+    return _lfsr_sequences[short]
+
+
+class Envelope:
+    def __init__(self):
+        self.register = 0
+        self.volume = 0
+        self._timer = 0
+
+    def trigger(self) -> None:
+        self.volume = self.register >> 4
+        self._timer = self.register & 0x7
+
+    def clock(self) -> None:
+        period = self.register & 0x7
+        if not period:
+            return
+
+        self._timer -= 1
+        if self._timer <= 0:
+            self._timer = period
+            if self.register & 0x8:
+                self.volume = min(self.volume + 1, 15)
+            else:
+                self.volume = max(self.volume - 1, 0)
+
+
+class Channel:
+    """State shared by the four channels: the DAC, the length counter and the position in the waveform.
+
+    Registers are written with their index in the channel, from 0 (NRx0) to 4 (NRx4).
+    """
+
+    LENGTH_MAX = 64
+    STEPS = 8
+
+    def __init__(self, number: int):
+        self.number = number
+        self.enabled = False
+        self.dac_enabled = False
+        self.length_enabled = False
+        self.length_counter = 0
+        self.frequency = 0
+        # Steps into the waveform, the fractional part is how far the current step went
+        self.position = 0.0
+
+    def write(self, register: int, value: int) -> None:
+        if register == 1:
+            self.length_counter = self.LENGTH_MAX - (value & (self.LENGTH_MAX - 1))
+        elif register == 2:
+            self.dac_enabled = is_dac_enabled(self.number, value)
+            self.enabled = self.enabled and self.dac_enabled
+        elif register == 3:
+            self.frequency = self.frequency & 0x700 | value
+        elif register == 4:
+            self.frequency = self.frequency & 0xff | (value & 0x7) << 8
+            self.length_enabled = bool(value & 0x40)
+            if value & 0x80:
+                self.trigger()
+
+    def trigger(self) -> None:
+        self.enabled = self.dac_enabled
+        if not self.length_counter:
+            self.length_counter = self.LENGTH_MAX
+        self.position = 0.0
+
+    def clock_length(self) -> None:
+        if self.length_enabled and self.length_counter:
+            self.length_counter -= 1
+            if not self.length_counter:
+                self.enabled = False
+
+    def period(self) -> int:
+        """Returns the number of cycles of a step of the waveform."""
+        raise NotImplementedError
+
+    def steps(self) -> int:
+        """Returns the number of steps of the waveform."""
+        return self.STEPS
+
+    def amplitudes(self, steps: np.ndarray) -> np.ndarray:
+        """Returns the output of the channel (0 to 15) at each given position in the waveform."""
+        raise NotImplementedError
+
+    def render(self, offsets: np.ndarray, cycles: int) -> Optional[np.ndarray]:
+        """Returns the output of the channel at the given cycle offsets, or None when it is silent,
+        and moves it forward by the given number of cycles.
+        """
+        period = self.period()
+        steps = self.position + offsets / period
+        self.position = (self.position + cycles / period) % self.steps()
+
+        if not self.enabled:
+            return None
+        return self.amplitudes(steps.astype(np.int64))
+
+
+class PulseChannel(Channel):
+    def __init__(self, number: int):
+        super().__init__(number)
+        self.envelope = Envelope()
+        self._duty = 0
+        # Channel 1 only
+        self._sweep = Sweep() if number == 0 else None
+
+    def write(self, register: int, value: int) -> None:
+        if register == 0 and self._sweep:
+            self._sweep.register = value
+        elif register == 1:
+            self._duty = value >> 6
+        elif register == 2:
+            self.envelope.register = value
+        super().write(register, value)
+
+    def trigger(self) -> None:
+        super().trigger()
+        self.envelope.trigger()
+
+        if self._sweep:
+            self._sweep.trigger(self.frequency)
+            self.enabled = self.enabled and not self._sweep.overflow
+
+    def clock_sweep(self) -> None:
+        if self._sweep.clock():
+            self.frequency = self._sweep.frequency
+        if self._sweep.overflow:
+            self.enabled = False
+
+    def period(self) -> int:
+        return (2048 - self.frequency) * 4
+
+    def amplitudes(self, steps: np.ndarray) -> np.ndarray:
+        return DUTY_CYCLES[self._duty][steps % self.STEPS] * self.envelope.volume
+
+
+class WaveChannel(Channel):
+    LENGTH_MAX = 256
+    STEPS = 32
+
+    def __init__(self):
+        super().__init__(2)
+        self._volume_shift = WAVE_VOLUME_SHIFTS[0]
+        # Two 4-bit samples per byte, high nibble first
+        self._samples = np.zeros(self.STEPS, dtype=np.int64)
+
+    def write(self, register: int, value: int) -> None:
+        if register == 0:
+            # NR30 holds the DAC bit, there is no envelope
+            super().write(2, value)
+            return
+        if register == 2:
+            self._volume_shift = WAVE_VOLUME_SHIFTS[(value >> 5) & 0x3]
+            return
+        super().write(register, value)
+
+    def write_wave(self, index: int, value: int) -> None:
+        self._samples[2 * index] = value >> 4
+        self._samples[2 * index + 1] = value & 0xf
+
+    def period(self) -> int:
+        return (2048 - self.frequency) * 2
+
+    def amplitudes(self, steps: np.ndarray) -> np.ndarray:
+        return self._samples[steps % self.STEPS] >> self._volume_shift
+
+
+class NoiseChannel(Channel):
+    def __init__(self):
+        super().__init__(3)
+        self.envelope = Envelope()
+        self._polynomial = 0
+
+    def write(self, register: int, value: int) -> None:
+        if register == 2:
+            self.envelope.register = value
+        elif register == 3:
+            # NR43 configures the LFSR, there is no frequency
+            self._polynomial = value
+            return
+        super().write(register, value)
+
+    def trigger(self) -> None:
+        super().trigger()
+        self.envelope.trigger()
+
+    def period(self) -> int:
+        return NOISE_DIVISORS[self._polynomial & 0x7] << (self._polynomial >> 4)
+
+    def steps(self) -> int:
+        return len(lfsr_sequence(self._is_short()))
+
+    def amplitudes(self, steps: np.ndarray) -> np.ndarray:
+        sequence = lfsr_sequence(self._is_short())
+        return sequence[steps % len(sequence)] * self.envelope.volume
+
+    def _is_short(self) -> bool:
+        return bool(self._polynomial & 0x8)
@@ -0,0 +1,66 @@
+import wave
+from typing import Union
+
+import numpy as np
+
+SAMPLE_RATE = 48_000
+
+
+class RingBuffer:
+    """Keeps the latest samples for a consumer pulling them at its own pace, the oldest are dropped
+    when it falls behind.
+
+    Samples are signed 16-bit stereo frames, in arrays of shape (count, 2).
+    """
+
+    def __init__(self, capacity: int = SAMPLE_RATE, sample_rate: int = SAMPLE_RATE):
+        self.sample_rate = sample_rate
+        self._samples = np.zeros((capacity, 2), dtype=np.int16)
+        self._start = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def write(self, samples: np.ndarray) -> None:
+        capacity = len(self._samples)
+        if len(samples) > capacity:
+            samples = samples[-capacity:]
+
+        end = (self._start + self._size) % capacity
+        first = min(len(samples), capacity - end)
+        self._samples[end:end + first] = samples[:first]
+        self._samples[:len(samples) - first] = samples[first:]
+
+        overflow = max(self._size + len(samples) - capacity, 0)
+        self._start = (self._start + overflow) % capacity
+        self._size = min(self._size + len(samples), capacity)
+
+    def read(self, count: int) -> np.ndarray:
+        """Removes and returns up to count samples, the oldest first."""
+        count = min(count, self._size)
+        indices = (self._start + np.arange(count)) % len(self._samples)
+        self._start = (self._start + count) % len(self._samples)
+        self._size -= count
+        return self._samples[indices]
+
+    def close(self) -> None:
+        pass
+
+
+class WavWriter:
+    def __init__(self, filename: str, sample_rate: int = SAMPLE_RATE):
+        self.sample_rate = sample_rate
+        self._file = wave.open(filename, 'wb')
+        self._file.setnchannels(2)
+        self._file.setsampwidth(2)
+        self._file.setframerate(sample_rate)
+
+    def write(self, samples: np.ndarray) -> None:
+        self._file.writeframes(samples.astype('<i2').tobytes())
+
+    def close(self) -> None:
+        self._file.close()
+
+
+AudioOutput = Union[RingBuffer, WavWriter]
@@ -0,0 +1,38 @@
+from typing import Tuple
+
+from custom_types import u16
+
+# Sound registers, NRx0 to NRx4 of channel x are at CHANNELS_START + 5 * (x - 1)
+CHANNELS_START = u16(0xff10)
+CHANNELS_END = u16(0xff24)
+CHANNEL_REGISTERS = 5
+
+NR10 = u16(0xff10)
+NR12 = u16(0xff12)
+NR14 = u16(0xff14)
+NR22 = u16(0xff17)
+NR24 = u16(0xff19)
+NR30 = u16(0xff1a)
+NR34 = u16(0xff1e)
+NR42 = u16(0xff21)
+NR44 = u16(0xff23)
+NR50 = u16(0xff24)
+NR51 = u16(0xff25)
+NR52 = u16(0xff26)
+
+WAVE_RAM_START = u16(0xff30)
+WAVE_RAM_END = u16(0xff40)
+
+# Registers turning the DAC of each channel on and off, and triggering it
+DAC_REGISTERS = (NR12, NR22, NR30, NR42)
+TRIGGER_REGISTERS = (NR14, NR24, NR34, NR44)
+
+
+def channel_register(address: int) -> Tuple[int, int]:
+    """Returns the channel number (0 to 3) of a sound register and its index in the channel (0 to 4)."""
+    return divmod(address - CHANNELS_START, CHANNEL_REGISTERS)
+
+
+def is_dac_enabled(channel: int, value: int) -> bool:
+    # The wave channel has a dedicated bit, the others are off when the envelope is silent and decreasing
+    return bool(value & 0x80) if channel == 2 else bool(value & 0xf8)
@@ -0,0 +1,138 @@
+from typing import Optional
+
+from apu.registers import is_dac_enabled
+from cpu.timer import FREQUENCY
+
+# The frame sequencer steps at 512Hz, step n happening at cycle n * SEQUENCER_CYCLES. Length counters are
+# clocked on even steps, the sweep on steps 2 and 6 and the envelopes on step 7.
+SEQUENCER_CYCLES = FREQUENCY // 512
+LENGTH_CYCLES = 2 * SEQUENCER_CYCLES
+SWEEP_CYCLES = 4 * SEQUENCER_CYCLES
+SWEEP_OFFSET = 2 * SEQUENCER_CYCLES
+
+
+def length_clocks(start: int, end: int) -> int:
+    """Returns the number of times the length counters are clocked after cycle start, up to cycle end."""
+    return end // LENGTH_CYCLES - start // LENGTH_CYCLES
+
+
+def next_sweep_clock(cycle: int) -> int:
+    """Returns the cycle of the first sweep clock after the given one."""
+    return ((cycle - SWEEP_OFFSET) // SWEEP_CYCLES + 1) * SWEEP_CYCLES + SWEEP_OFFSET
+
+
+class Sweep:
+    """Frequency sweep of channel 1, which turns the channel off when the frequency overflows."""
+
+    def __init__(self):
+        self.register = 0
+        # Shadow register, the frequency the sweep works on
+        self.frequency = 0
+        self.enabled = False
+        self.overflow = False
+        self._timer = 0
+
+    def trigger(self, frequency: int) -> None:
+        self.frequency = frequency
+        self._timer = self._period() or 8
+        self.enabled = bool(self._period() or self._shift())
+        self.overflow = False
+        if self._shift():
+            self._next_frequency()
+
+    def clock(self) -> bool:
+        """Returns whether the frequency changed."""
+        self._timer -= 1
+        if self._timer > 0:
+            return False
+
+        self._timer = self._period() or 8
+        if self.enabled and self._period():
+            frequency = self._next_frequency()
+            if frequency <= 0x7ff and self._shift():
+                self.frequency = frequency
+                # Checked again with the new frequency, without using the result
+                self._next_frequency()
+                return True
+        return False
+
+    def _next_frequency(self) -> int:
+        delta = self.frequency >> self._shift()
+        frequency = self.frequency - delta if self.register & 0x8 else self.frequency + delta
+        if frequency > 0x7ff:
+            self.overflow = True
+        return frequency
+
+    def _period(self) -> int:
+        return (self.register >> 4) & 0x7
+
+    def _shift(self) -> int:
+        return self.register & 0x7
+
+
+class ChannelStatus:
+    """What the CPU can observe of a channel: whether it is on, and so the length counter behind it.
+
+    The length counter is only brought up to date when it is needed, from the number of length clocks
+    since it was last written.
+    """
+
+    def __init__(self, number: int):
+        self.number = number
+        self.length_max = 256 if number == 2 else 64
+        self.enabled = False
+        self.dac_enabled = False
+        self.length_enabled = False
+        self._length_counter = 0
+        self._length_since = 0
+        # Channel 1 only
+        self.sweep = Sweep() if number == 0 else None
+        self._frequency = 0
+
+    def write(self, register: int, value: int, cycle: int) -> None:
+        if register == 0 and self.sweep:
+            self.sweep.register = value
+        elif register == 1:
+            self._length_counter = self.length_max - (value & (self.length_max - 1))
+            self._length_since = cycle
+        elif register == 3:
+            self._frequency = self._frequency & 0x700 | value
+        elif register == 4:
+            self._frequency = self._frequency & 0xff | (value & 0x7) << 8
+            self._length_counter = self.length_counter(cycle)
+            self._length_since = cycle
+            self.length_enabled = bool(value & 0x40)
+            if value & 0x80:
+                self._trigger()
+
+        # The DAC is controlled by NR30 for the wave channel, by the envelope (NRx2) for the others
+        if register == (0 if self.number == 2 else 2):
+            self.dac_enabled = is_dac_enabled(self.number, value)
+            self.enabled = self.enabled and self.dac_enabled
+
+    def length_counter(self, cycle: int) -> int:
+        if not self.length_enabled:
+            return self._length_counter
+        return max(self._length_counter - length_clocks(self._length_since, cycle), 0)
+
+    def length_expiry(self) -> Optional[int]:
+        """Returns the cycle at which the length counter turns the channel off, if it does."""
+        if not self.enabled or not self.length_enabled or not self._length_counter:
+            return None
+        return (self._length_since // LENGTH_CYCLES + self._length_counter) * LENGTH_CYCLES
+
+    def clock_sweep(self) -> None:
+        if self.sweep.clock():
+            self._frequency = self.sweep.frequency
+        if self.sweep.overflow:
+            self.enabled = False
+
+    def _trigger(self) -> None:
+        self.enabled = self.dac_enabled
+        if not self._length_counter:
+            self._length_counter = self.length_max
+
+        if self.sweep:
+            self.sweep.trigger(self._frequency)
+            if self.sweep.overflow:
+                self.enabled = False
@@ -0,0 +1,126 @@
+import math
+from typing import List
+from typing import Tuple
+
+import numpy as np
+
+from apu.channels import Channel
+from apu.channels import NoiseChannel
+from apu.channels import PulseChannel
+from apu.channels import WaveChannel
+from apu.output import AudioOutput
+from apu.registers import CHANNELS_END
+from apu.registers import NR50
+from apu.registers import NR51
+from apu.registers import NR52
+from apu.registers import WAVE_RAM_START
+from apu.registers import channel_register
+from apu.status import SEQUENCER_CYCLES
+from cpu.timer import FREQUENCY
+
+# From the sum of 4 channels at volume 15 and the master volume at 8 to the 16-bit range
+OUTPUT_SCALE = 32767 / (4 * 15 * 8)
+
+
+class Synthesizer:
+    """Generates the samples of the four channels from the timestamped register writes.
+
+    Writes are replayed in order when flushing: the samples between two writes, or two steps of the
+    frame sequencer, come from channels in a constant state and are generated together with NumPy.
+    """
+
+    def __init__(self, output: AudioOutput, cycles: int):
+        self._output = output
+        self._cycles_per_sample = FREQUENCY / output.sample_rate
+
+        self._channels: Tuple[Channel, ...] = ()
+        self._nr50 = 0
+        self._nr51 = 0
+        self._reset()
+
+        # (cycle, address, value) of the writes not replayed yet
+        self._writes: List[Tuple[int, int, int]] = []
+        self._rendered = cycles
+        self._next_sample = float(cycles)
+        self._next_step = (cycles // SEQUENCER_CYCLES + 1) * SEQUENCER_CYCLES
+        self._chunks: List[np.ndarray] = []
+
+    def write(self, cycle: int, address: int, value: int) -> None:
+        self._writes.append((cycle, address, value))
+
+    def flush(self, until: int) -> None:
+        """Synthesizes the samples up to the given cycle and sends them to the output."""
+        for cycle, address, value in self._writes:
+            self._synthesize(cycle)
+            self._apply(address, value)
+        self._writes.clear()
+        self._synthesize(until)
+
+        if self._chunks:
+            samples = np.concatenate(self._chunks)
+            self._chunks.clear()
+            self._output.write(np.rint(samples * OUTPUT_SCALE).astype(np.int16))
+
+    def close(self, until: int) -> None:
+        self.flush(until)
+        self._output.close()
+
+    def _reset(self) -> None:
+        self._channels = (PulseChannel(0), PulseChannel(1), WaveChannel(), NoiseChannel())
+        self._nr50 = 0
+        self._nr51 = 0
+
+    def _apply(self, address: int, value: int) -> None:
+        if address >= WAVE_RAM_START:
+            self._channels[2].write_wave(address - WAVE_RAM_START, value)
+        elif address < CHANNELS_END:
+            channel, register = channel_register(address)
+            self._channels[channel].write(register, value)
+        elif address == NR50:
+            self._nr50 = value
+        elif address == NR51:
+            self._nr51 = value
+        elif address == NR52 and not value & 0x80:
+            self._reset()
+
+    def _synthesize(self, until: int) -> None:
+        while self._next_step <= until:
+            self._render(self._next_step)
+            self._clock_sequencer(self._next_step // SEQUENCER_CYCLES % 8)
+            self._next_step += SEQUENCER_CYCLES
+        self._render(until)
+
+    def _clock_sequencer(self, step: int) -> None:
+        if step % 2 == 0:
+            for channel in self._channels:
+                channel.clock_length()
+        if step == 2 or step == 6:
+            self._channels[0].clock_sweep()
+        if step == 7:
+            for channel in (self._channels[0], self._channels[1], self._channels[3]):
+                channel.envelope.clock()
+
+    def _render(self, until: int) -> None:
+        cycles = until - self._rendered
+        if cycles <= 0:
+            return
+
+        count = max(math.ceil((until - self._next_sample) / self._cycles_per_sample), 0)
+        offsets = self._next_sample - self._rendered + np.arange(count) * self._cycles_per_sample
+        self._next_sample += count * self._cycles_per_sample
+        self._rendered = until
+
+        left = np.zeros(count)
+        right = np.zeros(count)
+        for channel in self._channels:
+            amplitudes = channel.render(offsets, cycles)
+            if amplitudes is None:
+                continue
+            if self._nr51 & (0x10 << channel.number):
+                left += amplitudes
+            if self._nr51 & (0x01 << channel.number):
+                right += amplitudes
+
+        left *= ((self._nr50 >> 4) & 0x7) + 1
+        right *= (self._nr50 & 0x7) + 1
+        self._chunks.append(np.stack((left, right), axis=1))
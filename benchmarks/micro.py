@@ -0,0 +1,210 @@
+import argparse
+import inspect
+import json
+import os
+import random
+import sys
+import time
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from cpu import alu
+from cpu.instruction import CPUInstruction
+from cpu.instruction import Operands
+from cpu.opcodes import opcodes
+from cpu.registers import Registers
+from custom_types import i8
+from custom_types import u16
+from custom_types import u8
+from mmu.memory import Memory
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BASELINE = os.path.join(ROOT_DIR, 'benchmarks', 'micro_baseline.json')
+
+STATES = 64  # distinct register sets cycled through by each benchmark
+DEFAULT_ITERATIONS = 20_000
+DEFAULT_THRESHOLD = 10.0  # percent
+
+# Keep the stack and jumps inside work RAM so that random states never leave the address space
+SAFE_ADDRESSES = (0xc100, 0xdf00)
+
+Benchmark = Tuple[Callable, List[tuple]]
+
+
+def random_registers(rng: random.Random) -> Registers:
+    registers = Registers()
+    for name in 'abcdefhl':
+        setattr(registers, name, rng.randrange(0x100))
+    registers.f &= 0xf0
+    registers.sp = rng.randrange(*SAFE_ADDRESSES)
+    registers.pc = rng.randrange(*SAFE_ADDRESSES)
+    registers.ime = rng.random() < 0.5
+    return registers
+
+
+def random_memory(rng: random.Random) -> Memory:
+    memory = Memory()
+    memory.content[:] = rng.randbytes(len(memory.content))
+    return memory
+
+
+def random_operands(rng: random.Random, length: int) -> Optional[Operands]:
+    if length == 2:
+        # Addresses too, LD (u16),SP at $ffff would write past the end of memory
+        return Operands(rng.randrange(*SAFE_ADDRESSES).to_bytes(2, 'little'))
+    return Operands(rng.randbytes(length)) if length else None
+
+
+def random_argument(rng: random.Random, parameter: inspect.Parameter, registers: Registers):
+    if parameter.annotation is Registers:
+        return registers
+    if parameter.name == 'bit_position':
+        return rng.randrange(8)
+    if parameter.annotation is bool:
+        return rng.random() < 0.5
+    if parameter.annotation is u16:
+        return rng.randrange(0x10000)
+    if parameter.annotation is i8:
+        return rng.randrange(-0x80, 0x80)
+    if parameter.annotation in (u8, int):
+        return rng.randrange(0x100)
+
+    raise TypeError(f'Cannot generate a value for {parameter}')
+
+
+def alu_benchmarks(rng: random.Random) -> Dict[str, Benchmark]:
+    benchmarks = {}
+
+    for name, function in inspect.getmembers(alu, inspect.isfunction):
+        if function.__module__ != alu.__name__:
+            continue
+
+        parameters = inspect.signature(function).parameters.values()
+        states = []
+        for _ in range(STATES):
+            registers = random_registers(rng)
+            states.append(tuple(random_argument(rng, parameter, registers) for parameter in parameters))
+
+        benchmarks[f'alu.{name}'] = (function, states)
+
+    return benchmarks
+
+
+def opcode_benchmarks(rng: random.Random) -> Dict[str, Benchmark]:
+    memory = random_memory(rng)
+    benchmarks = {}
+
+    for opcode, instruction in opcodes.items():
+        states = []
+        for _ in range(STATES):
+            registers = random_registers(rng)
+            operands = random_operands(rng, instruction.args_length)
+            states.append((registers, memory, operands))
+
+        if _is_implemented(instruction, states[0]):
+            benchmarks[f'opcode.{opcode:#04x} {instruction.name}'] = (instruction.run, states)
+
+    return benchmarks
+
+
+def _is_implemented(instruction: CPUInstruction, state: tuple) -> bool:
+    try:
+        instruction.run(*state)
+    except NotImplementedError:
+        return False
+    return True
+
+
+def time_benchmark(function: Callable, states: List[tuple], iterations: int, repeat: int) -> float:
+    calls = (states * (iterations // len(states) + 1))[:iterations]
+    best = None
+
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        for args in calls:
+            function(*args)
+        elapsed = time.perf_counter_ns() - start
+
+        best = elapsed if best is None else min(best, elapsed)
+
+    return best / iterations
+
+
+def loop_overhead(iterations: int, repeat: int) -> float:
+    def nothing(*args):
+        return False
+
+    return time_benchmark(nothing, [(None, None, None)], iterations, repeat)
+
+
+def run(patterns: List[str], iterations: int, repeat: int, seed: int) -> Dict[str, float]:
+    rng = random.Random(seed)
+    benchmarks = {**alu_benchmarks(rng), **opcode_benchmarks(rng)}
+    overhead = loop_overhead(iterations, repeat)
+    results = {}
+
+    for name, (function, states) in benchmarks.items():
+        if patterns and not any(pattern in name for pattern in patterns):
+            continue
+        results[name] = round(max(time_benchmark(function, states, iterations, repeat) - overhead, 0.0), 1)
+
+    return results
+
+
+def compare(results: Dict[str, float], baseline: Dict[str, float], threshold: float) -> List[str]:
+    regressions = []
+
+    for name, ns in results.items():
+        reference = baseline.get(name)
+        if not reference:
+            continue
+
+        change = 100 * (ns / reference - 1)
+        if change > threshold:
+            regressions.append(name)
+            print(f'REGRESSION {name:<40} {reference:>9.1f}ns -> {ns:>9.1f}ns ({change:+.1f}%)')
+
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Times every ALU function and opcode handler in isolation.')
+    parser.add_argument('patterns', nargs='*', help='only run benchmarks whose name contains one of these')
+    parser.add_argument('-n', '--iterations', type=int, default=DEFAULT_ITERATIONS, help='calls per measurement')
+    parser.add_argument('-r', '--repeat', type=int, default=3, help='measurements per benchmark, the best is kept')
+    parser.add_argument('-s', '--seed', type=int, default=0, help='seed of the random machine states')
+    parser.add_argument('-o', '--output', metavar='FILE', help='write the results as JSON to FILE')
+    parser.add_argument('-b', '--baseline', metavar='FILE', default=DEFAULT_BASELINE, help='results to compare with')
+    parser.add_argument('--save-baseline', action='store_true', help='store the results as the new baseline')
+    parser.add_argument(
+        '-t', '--threshold', type=float, default=DEFAULT_THRESHOLD, help='slowdown in percent reported as a regression'
+    )
+    args = parser.parse_args()
+
+    results = run(args.patterns, args.iterations, args.repeat, args.seed)
+
+    for name, ns in sorted(results.items(), key=lambda item: item[1], reverse=True):
+        print(f'{name:<40} {ns:>9.1f} ns/op')
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(results, f, indent=2)
+        return 0
+
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            if compare(results, json.load(f), args.threshold):
+                return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,163 @@
+from typing import Callable
+from typing import Dict
+
+ROM_SIZE = 0x8000
+ENTRY_POINT = 0x100
+CODE_START = 0x150
+TIMER_ISR = 0x50
+
+
+class Assembler:
+    """Just enough of an assembler to lay out the synthetic benchmark ROMs."""
+
+    def __init__(self, origin: int):
+        self.origin = origin
+        self.code = bytearray()
+        self.labels: Dict[str, int] = {}
+
+    @property
+    def address(self) -> int:
+        return self.origin + len(self.code)
+
+    def label(self, name: str) -> None:
+        self.labels[name] = self.address
+
+    def emit(self, *data: int) -> None:
+        self.code += bytes(data)
+
+    def jr(self, opcode: int, label: str) -> None:
+        offset = self.labels[label] - (self.address + 2)
+        self.emit(opcode, offset & 0xff)
+
+
+def _rom(main: Assembler, *routines: Assembler) -> bytes:
+    rom = bytearray(ROM_SIZE)
+    # Entry point: NOP, JP CODE_START
+    rom[ENTRY_POINT:ENTRY_POINT + 4] = bytes([0x00, 0xc3, CODE_START & 0xff, CODE_START >> 8])
+
+    for routine in (main, *routines):
+        rom[routine.origin:routine.address] = routine.code
+
+    # Some data for the copy loops to move around
+    rom[0x4000:0x4100] = bytes(range(256))
+
+    return bytes(rom)
+
+
+def _main() -> Assembler:
+    asm = Assembler(CODE_START)
+    asm.emit(0x31, 0xfe, 0xff)  # LD SP,$fffe
+    return asm
+
+
+def alu_rom() -> bytes:
+    asm = _main()
+    asm.label('loop')
+    asm.emit(
+        0x80,  # ADD A,B
+        0x89,  # ADC A,C
+        0x92,  # SUB D
+        0x9b,  # SBC A,E
+        0xa4,  # AND H
+        0xad,  # XOR L
+        0xb0,  # OR B
+        0xb9,  # CP C
+        0x04,  # INC B
+        0x0d,  # DEC C
+        0x14,  # INC D
+        0x1d,  # DEC E
+        0x07,  # RLCA
+        0x1f,  # RRA
+        0x27,  # DAA
+        0x2f,  # CPL
+        0x19,  # ADD HL,DE
+        0xc6, 0x11,  # ADD A,$11
+        0xee, 0x5a,  # XOR $5a
+    )
+    asm.jr(0x18, 'loop')  # JR loop
+    return _rom(asm)
+
+
+def memory_copy_rom() -> bytes:
+    asm = _main()
+    asm.label('loop')
+    asm.emit(0x21, 0x00, 0x40)  # LD HL,$4000
+    asm.emit(0x11, 0x00, 0xc0)  # LD DE,$c000
+    asm.emit(0x06, 0x00)  # LD B,$00 (256 iterations)
+    asm.label('copy')
+    asm.emit(
+        0x2a,  # LD A,(HL+)
+        0x12,  # LD (DE),A
+        0x13,  # INC DE
+        0x05,  # DEC B
+    )
+    asm.jr(0x20, 'copy')  # JR NZ,copy
+    asm.jr(0x18, 'loop')  # JR loop
+    return _rom(asm)
+
+
+def call_ret_rom() -> bytes:
+    leaf = Assembler(0x300)
+    leaf.emit(0x3c, 0xc9)  # INC A, RET
+
+    nested = Assembler(0x310)
+    nested.emit(0xc5, 0xcd, 0x00, 0x03, 0xc1, 0xc9)  # PUSH BC, CALL $0300, POP BC, RET
+
+    restart = Assembler(0x08)
+    restart.emit(0xc9)  # RET
+
+    asm = _main()
+    asm.label('loop')
+    asm.emit(0xcd, 0x10, 0x03)  # CALL $0310
+    asm.emit(0xcd, 0x00, 0x03)  # CALL $0300
+    asm.emit(0xcf)  # RST $08
+    asm.jr(0x18, 'loop')  # JR loop
+    return _rom(asm, leaf, nested, restart)
+
+
+def halt_rom() -> bytes:
+    asm = _main()
+    asm.emit(0xaf)  # XOR A
+    asm.emit(0xe0, 0x06)  # LDH ($06),A: TMA = 0
+    asm.emit(0xe0, 0x0f)  # LDH ($0f),A: clear IF
+    asm.emit(0x3e, 0x05, 0xe0, 0x07)  # LD A,$05, LDH ($07),A: timer enabled at 262144Hz
+    asm.emit(0x3e, 0x04, 0xe0, 0xff)  # LD A,$04, LDH ($ff),A: enable the timer interrupt
+    asm.emit(0xfb)  # EI
+    asm.label('loop')
+    asm.emit(0x76, 0x00, 0x04)  # HALT, NOP, INC B
+    asm.jr(0x18, 'loop')  # JR loop
+
+    isr = Assembler(TIMER_ISR)
+    isr.emit(0xd9)  # RETI
+
+    return _rom(asm, isr)
+
+
+def cb_prefix_rom() -> bytes:
+    asm = _main()
+    asm.emit(0x21, 0x00, 0xc0)  # LD HL,$c000
+    asm.label('loop')
+    asm.emit(
+        0xcb, 0x00,  # RLC B
+        0xcb, 0x19,  # RR C
+        0xcb, 0x22,  # SLA D
+        0xcb, 0x2b,  # SRA E
+        0xcb, 0x34,  # SWAP H
+        0xcb, 0x3d,  # SRL L
+        0xcb, 0x5f,  # BIT 3,A
+        0xcb, 0xc8,  # SET 1,B
+        0xcb, 0x91,  # RES 2,C
+        0xcb, 0x16,  # RL (HL)
+        0x21, 0x00, 0xc0,  # LD HL,$c000 (SWAP H and SRL L moved it)
+    )
+    asm.jr(0x18, 'loop')  # JR loop
+    return _rom(asm)
+
+
+SYNTHETIC_ROMS: Dict[str, Callable[[], bytes]] = {
+    'alu': alu_rom,
+    'memory_copy': memory_copy_rom,
+    'call_ret': call_ret_rom,
+    'halt': halt_rom,
+    'cb_prefix': cb_prefix_rom,
+}
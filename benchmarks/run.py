@@ -0,0 +1,173 @@
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from benchmarks.roms import SYNTHETIC_ROMS
+from cpu.cpu import CPU
+from cpu.timer import FREQUENCY
+from mmu.memory import Memory
+from utils.files import read_binary_file
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BLARGG_DIR = os.path.join(ROOT_DIR, 'roms', 'blargg')
+DEFAULT_BASELINE = os.path.join(ROOT_DIR, 'benchmarks', 'baseline.json')
+
+DEFAULT_CYCLES = 20_000_000
+WARMUP_CYCLES = 100_000
+DEFAULT_THRESHOLD = 5.0  # percent
+
+
+def available_benchmarks() -> Dict[str, Optional[str]]:
+    """Maps benchmark names to a ROM filename, or None for the synthetic ROMs."""
+    benchmarks: Dict[str, Optional[str]] = {name: None for name in SYNTHETIC_ROMS}
+
+    if os.path.isdir(BLARGG_DIR):
+        for filename in sorted(os.listdir(BLARGG_DIR)):
+            if filename.endswith('.gb'):
+                benchmarks[f'blargg/{filename[:-3]}'] = os.path.join(BLARGG_DIR, filename)
+
+    return benchmarks
+
+
+def measure(name: str, filename: Optional[str], cycles: int, repeat: int, translate: bool = False) -> dict:
+    rom_data = read_binary_file(filename) if filename else SYNTHETIC_ROMS[name]()
+    runs = []
+
+    for _ in range(repeat):
+        memory = Memory()
+        memory.load_rom(rom_data)
+        cpu = CPU(memory, False)
+        if translate:
+            cpu.enable_translation(rom_data)
+
+        cpu.run(WARMUP_CYCLES)
+        start_cycles = cpu.cycles
+        start = time.perf_counter()
+        instructions = cpu.run(cycles)
+        elapsed = time.perf_counter() - start
+
+        runs.append((elapsed, instructions, cpu.cycles - start_cycles))
+
+    # The fastest run is the one least disturbed by the rest of the system
+    elapsed, instructions, emulated_cycles = min(runs)
+
+    return {
+        'name': name,
+        'instructions': instructions,
+        'cycles': emulated_cycles,
+        'seconds': round(elapsed, 4),
+        'mips': round(instructions / elapsed / 1e6, 4),
+        'cycles_per_second': round(emulated_cycles / elapsed),
+        'realtime_ratio': round(emulated_cycles / elapsed / FREQUENCY, 4),
+        # ru_maxrss is in kilobytes on Linux
+        'peak_rss_mb': round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+    }
+
+
+def run_isolated(name: str, cycles: int, repeat: int, translate: bool) -> dict:
+    # Each benchmark gets its own interpreter so that the peak RSS is its own
+    output = subprocess.run(
+        [sys.executable, '-m', 'benchmarks.run', '--worker', name, '--cycles', str(cycles), '--repeat', str(repeat)]
+        + (['--translate'] if translate else []),
+        cwd=ROOT_DIR,
+        check=True,
+        stdout=subprocess.PIPE,
+    ).stdout
+    return json.loads(output)
+
+
+def compare(results: List[dict], baseline: List[dict], threshold: float) -> List[str]:
+    baseline_by_name = {result['name']: result for result in baseline}
+    regressions = []
+
+    print(f'\n{"benchmark":<32} {"baseline":>10} {"current":>10} {"change":>8}')
+    for result in results:
+        reference = baseline_by_name.get(result['name'])
+        if not reference:
+            continue
+
+        change = 100 * (result['cycles_per_second'] / reference['cycles_per_second'] - 1)
+        flag = ''
+        if change < -threshold:
+            regressions.append(result['name'])
+            flag = '  REGRESSION'
+
+        print(
+            f'{result["name"]:<32} {reference["cycles_per_second"] / 1e6:>9.3f}M '
+            f'{result["cycles_per_second"] / 1e6:>9.3f}M {change:>+7.1f}%{flag}'
+        )
+
+    return regressions
+
+
+def print_results(results: List[dict]) -> None:
+    print(f'{"benchmark":<32} {"MIPS":>8} {"Mcycles/s":>10} {"realtime":>9} {"peak RSS":>10}')
+    for result in results:
+        print(
+            f'{result["name"]:<32} {result["mips"]:>8.3f} {result["cycles_per_second"] / 1e6:>10.3f} '
+            f'{result["realtime_ratio"]:>8.2f}x {result["peak_rss_mb"]:>8.1f}MB'
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Measures the emulation speed on synthetic and test ROMs.')
+    parser.add_argument('names', nargs='*', help='benchmarks to run, all of them by default')
+    parser.add_argument('-c', '--cycles', type=int, default=DEFAULT_CYCLES, help='emulated cycles per benchmark')
+    parser.add_argument('-r', '--repeat', type=int, default=3, help='runs per benchmark, the fastest one is kept')
+    parser.add_argument('-l', '--list', action='store_true', help='list the available benchmarks')
+    parser.add_argument('-o', '--output', metavar='FILE', help='write the results as JSON to FILE')
+    parser.add_argument('-b', '--baseline', metavar='FILE', default=DEFAULT_BASELINE, help='results to compare with')
+    parser.add_argument('--save-baseline', action='store_true', help='store the results as the new baseline')
+    parser.add_argument(
+        '-t', '--threshold', type=float, default=DEFAULT_THRESHOLD, help='slowdown in percent reported as a regression'
+    )
+    parser.add_argument(
+        '--translate', action='store_true', help='run the ROMs as translated blocks (see CPU.enable_translation)'
+    )
+    parser.add_argument('--worker', metavar='NAME', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    benchmarks = available_benchmarks()
+
+    if args.worker:
+        json.dump(measure(args.worker, benchmarks[args.worker], args.cycles, args.repeat, args.translate), sys.stdout)
+        return 0
+
+    if args.list:
+        print('\n'.join(benchmarks))
+        return 0
+
+    unknown = [name for name in args.names if name not in benchmarks]
+    if unknown:
+        parser.error(f'unknown benchmarks: {", ".join(unknown)}')
+
+    results = [run_isolated(name, args.cycles, args.repeat, args.translate) for name in args.names or benchmarks]
+    print_results(results)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(results, f, indent=2)
+        return 0
+
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
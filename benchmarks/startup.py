@@ -0,0 +1,80 @@
+import argparse
+import os
+import subprocess
+import sys
+from typing import List
+from typing import Tuple
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# What a short-lived emulator process imports before running its first instruction
+DEFAULT_MODULE = 'main'
+# Import time budget of DEFAULT_MODULE, in milliseconds, with warm bytecode caches
+DEFAULT_BUDGET = 25.0
+
+# (self, cumulative) time in microseconds and name of every imported module
+ImportTimes = List[Tuple[int, int, str]]
+
+
+def import_times(module: str) -> ImportTimes:
+    # Every measurement gets a fresh interpreter, -X importtime reports on stderr
+    stderr = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=ROOT_DIR,
+        check=True,
+        stderr=subprocess.PIPE,
+        text=True,
+    ).stderr
+
+    times = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_time, cumulative, name = line[len('import time:'):].split('|')
+        times.append((int(self_time), int(cumulative), name.rstrip()))
+
+    return times
+
+
+def measure(module: str, repeat: int) -> Tuple[float, ImportTimes]:
+    """Returns the best import time of the module in milliseconds, and the details of that run."""
+    runs = []
+
+    for _ in range(repeat):
+        times = import_times(module)
+        total = next(cumulative for _, cumulative, name in times if name.strip() == module)
+        runs.append((total / 1000, times))
+
+    return min(runs, key=lambda run: run[0])
+
+
+def print_slowest(times: ImportTimes, limit: int) -> None:
+    print(f'\n{"self":>9} {"cumulative":>11}  module')
+    for self_time, cumulative, name in sorted(times, reverse=True)[:limit]:
+        print(f'{self_time / 1000:>7.2f}ms {cumulative / 1000:>9.2f}ms  {name.strip()}')
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Measures the import time of the emulator against a budget.')
+    parser.add_argument('module', nargs='?', default=DEFAULT_MODULE, help='module to import')
+    parser.add_argument('-r', '--repeat', type=int, default=10, help='imports measured, the fastest one is kept')
+    parser.add_argument('-b', '--budget', type=float, default=DEFAULT_BUDGET, help='budget in milliseconds')
+    parser.add_argument('-l', '--limit', type=int, default=15, help='number of slowest modules to show')
+    args = parser.parse_args()
+
+    # Make sure the bytecode caches exist, the first import after an edit compiles
+    import_times(args.module)
+    total, times = measure(args.module, args.repeat)
+
+    print_slowest(times, args.limit)
+    print(f'\nimport {args.module}: {total:.2f}ms (budget {args.budget:.2f}ms)')
+
+    if total > args.budget:
+        print('OVER BUDGET')
+        return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
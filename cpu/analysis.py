@@ -0,0 +1,285 @@
+import hashlib
+from dataclasses import asdict
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from cpu.instruction import FLOW_BRANCH
+from cpu.instruction import FLOW_CALL
+from cpu.instruction import FLOW_INDIRECT
+from cpu.instruction import FLOW_INVALID
+from cpu.instruction import FLOW_JUMP
+from cpu.instruction import FLOW_NONE
+from cpu.instruction import FLOW_RETURN
+from cpu.opcode_table import FLOWS
+from cpu.opcode_table import LENGTHS
+from cpu.opcode_table import NAMES
+
+BANK_SIZE = 0x4000
+
+# Reset vectors, interrupt vectors and the cartridge entry point
+ENTRY_POINTS = [0x00, 0x08, 0x10, 0x18, 0x20, 0x28, 0x30, 0x38, 0x40, 0x48, 0x50, 0x58, 0x60, 0x100]
+
+
+def to_offset(bank: int, address: int) -> int:
+    return address if address < BANK_SIZE else bank * BANK_SIZE + address - BANK_SIZE
+
+
+def to_address(offset: int) -> Tuple[int, int]:
+    bank = offset // BANK_SIZE
+    return bank, offset if bank == 0 else BANK_SIZE + offset % BANK_SIZE
+
+
+def decode(rom: memoryview, offset: int) -> Tuple[int, int]:
+    """Returns the opcode table index and the operand of the instruction at offset.
+
+    The index is -1 when there is no valid instruction there.
+    """
+    index = rom[offset]
+    if index == 0xcb:
+        if offset + 1 >= len(rom):
+            return -1, 0
+        index = 0x100 | rom[offset + 1]
+
+    length = LENGTHS[index]
+    if FLOWS[index] == FLOW_INVALID or offset + length > len(rom):
+        return -1, 0
+
+    if index > 0xff or length == 1:
+        operand = 0
+    elif length == 2:
+        operand = rom[offset + 1]
+    else:
+        operand = rom[offset + 1] | rom[offset + 2] << 8
+
+    return index, operand
+
+
+def target_address(index: int, address: int, operand: int) -> Optional[int]:
+    """Address the instruction at address transfers control to, if it is known statically."""
+    flow = FLOWS[index]
+    if flow not in (FLOW_JUMP, FLOW_BRANCH, FLOW_CALL):
+        return None
+
+    name = NAMES[index]
+    if name.startswith('RST'):
+        return int(name[4:6], 16)
+    if name.startswith('JR'):
+        return (address + 2 + (operand - 0x100 if operand & 0x80 else operand)) & 0xffff
+    return operand
+
+
+def falls_through(index: int) -> bool:
+    return FLOWS[index] not in (FLOW_JUMP, FLOW_RETURN, FLOW_INDIRECT, FLOW_INVALID)
+
+
+def resolve(bank: int, address: int, bank_count: int) -> Optional[int]:
+    """ROM offset of an address seen from code in the given bank, None outside of the ROM."""
+    if address < BANK_SIZE:
+        return address
+    if address < 2 * BANK_SIZE:
+        # Bank 0 cannot know which bank is mapped, assume the one mapped at power on
+        bank = max(bank, 1)
+        return to_offset(bank, address) if bank < bank_count else None
+    return None
+
+
+def recursive_descent(rom: memoryview, entries: Iterable[Tuple[int, int]]) -> bytearray:
+    """Follows the control flow from the entry points, returns a map of the instruction starts."""
+    bank_count = max(1, (len(rom) + BANK_SIZE - 1) // BANK_SIZE)
+    starts = bytearray(len(rom))
+    pending = [offset for offset in (resolve(bank, address, bank_count) for bank, address in entries) if offset is not None]
+
+    while pending:
+        offset = pending.pop()
+
+        while offset < len(rom) and not starts[offset]:
+            index, operand = decode(rom, offset)
+            if index < 0:
+                break
+
+            starts[offset] = 1
+            bank, address = to_address(offset)
+
+            target = target_address(index, address, operand)
+            if target is not None:
+                target_offset = resolve(bank, target, bank_count)
+                if target_offset is not None and target_offset < len(rom) and not starts[target_offset]:
+                    pending.append(target_offset)
+
+            if not falls_through(index):
+                break
+
+            offset += LENGTHS[index]
+            if offset % BANK_SIZE == 0:
+                # Execution never flows from the end of a bank into the next one
+                break
+
+    return starts
+
+
+CACHE_VERSION = 1
+
+
+def rom_hash(rom: bytes) -> str:
+    return hashlib.sha1(rom).hexdigest()
+
+
+@dataclass
+class BasicBlock:
+    offset: int  # in the ROM file
+    bank: int
+    address: int
+    size: int  # in bytes
+    instructions: int
+    flow: int  # control flow kind of the last instruction, see cpu.instruction
+    successors: List[int] = field(default_factory=list)  # ROM offsets, excluding call targets
+    call: Optional[int] = None  # ROM offset of the called routine
+
+    def label(self) -> str:
+        return f'{self.bank:02x}:{self.address:04x}'
+
+
+@dataclass
+class ControlFlowGraph:
+    rom_hash: str
+    entries: List[int]
+    blocks: Dict[int, BasicBlock]
+    # Routine entry -> offsets of the blocks of the routine
+    functions: Dict[int, List[int]]
+    # Routine entry -> entries of the routines it calls
+    call_graph: Dict[int, List[int]]
+
+    def blocks_in_bank(self, bank: int) -> List[BasicBlock]:
+        return [block for block in self.blocks.values() if block.bank == bank]
+
+    def to_json(self) -> dict:
+        return {
+            'version': CACHE_VERSION,
+            'rom_hash': self.rom_hash,
+            'entries': self.entries,
+            'blocks': [asdict(block) for block in sorted(self.blocks.values(), key=lambda b: b.offset)],
+            'functions': {str(entry): blocks for entry, blocks in self.functions.items()},
+            'call_graph': {str(entry): callees for entry, callees in self.call_graph.items()},
+        }
+
+    @classmethod
+    def from_json(cls, data: dict) -> 'ControlFlowGraph':
+        return cls(
+            rom_hash=data['rom_hash'],
+            entries=data['entries'],
+            blocks={block['offset']: BasicBlock(**block) for block in data['blocks']},
+            functions={int(entry): blocks for entry, blocks in data['functions'].items()},
+            call_graph={int(entry): callees for entry, callees in data['call_graph'].items()},
+        )
+
+
+def _build_blocks(rom: memoryview, starts: bytearray, entries: List[int]) -> Dict[int, BasicBlock]:
+    bank_count = max(1, (len(rom) + BANK_SIZE - 1) // BANK_SIZE)
+
+    # A block starts at every entry, jump target and instruction following a control flow change
+    leaders = set(entries)
+    offset = starts.find(1)
+    while offset >= 0:
+        index, operand = decode(rom, offset)
+        bank, address = to_address(offset)
+        target = target_address(index, address, operand)
+        if target is not None:
+            target_offset = resolve(bank, target, bank_count)
+            if target_offset is not None and target_offset < len(rom) and starts[target_offset]:
+                leaders.add(target_offset)
+        if FLOWS[index] != FLOW_NONE:
+            leaders.add(offset + LENGTHS[index])
+        offset = starts.find(1, offset + 1)
+
+    blocks = {}
+    for leader in sorted(leaders):
+        if leader >= len(rom) or not starts[leader]:
+            continue
+
+        bank, address = to_address(leader)
+        offset = leader
+        instructions = 0
+
+        while True:
+            index, operand = decode(rom, offset)
+            instructions += 1
+            next_offset = offset + LENGTHS[index]
+
+            if (
+                FLOWS[index] != FLOW_NONE
+                or next_offset in leaders
+                or next_offset % BANK_SIZE == 0
+                or next_offset >= len(rom)
+                or not starts[next_offset]
+            ):
+                break
+            offset = next_offset
+
+        block = BasicBlock(leader, bank, address, next_offset - leader, instructions, FLOWS[index])
+
+        target = target_address(index, to_address(offset)[1], operand)
+        target_offset = resolve(bank, target, bank_count) if target is not None else None
+        if target_offset is not None and target_offset < len(rom) and starts[target_offset]:
+            if FLOWS[index] == FLOW_CALL:
+                block.call = target_offset
+            else:
+                block.successors.append(target_offset)
+
+        if falls_through(index) and next_offset < len(rom) and starts[next_offset] and next_offset % BANK_SIZE:
+            block.successors.append(next_offset)
+
+        blocks[leader] = block
+
+    return blocks
+
+
+def _build_functions(blocks: Dict[int, BasicBlock], entries: List[int]) -> Tuple[Dict, Dict]:
+    roots = set(entries) | {block.call for block in blocks.values() if block.call is not None}
+    functions = {}
+    call_graph = {}
+
+    for root in sorted(roots):
+        if root not in blocks:
+            continue
+
+        members = []
+        callees = set()
+        pending = [root]
+        seen = {root}
+
+        # Jumps and branches stay within the routine, calls lead to other routines
+        while pending:
+            block = blocks[pending.pop()]
+            members.append(block.offset)
+            if block.call is not None:
+                callees.add(block.call)
+            for successor in block.successors:
+                if successor not in seen and successor in blocks and successor not in roots:
+                    seen.add(successor)
+                    pending.append(successor)
+
+        functions[root] = sorted(members)
+        call_graph[root] = sorted(callees)
+
+    return functions, call_graph
+
+
+def analyze(rom: bytes, entries: Iterable[Tuple[int, int]] = ()) -> ControlFlowGraph:
+    all_entries = [(0, address) for address in ENTRY_POINTS] + list(entries)
+
+    with memoryview(rom) as view:
+        bank_count = max(1, (len(view) + BANK_SIZE - 1) // BANK_SIZE)
+        entry_offsets = sorted({
+            offset for offset in (resolve(bank, address, bank_count) for bank, address in all_entries)
+            if offset is not None and offset < len(view)
+        })
+        starts = recursive_descent(view, all_entries)
+        blocks = _build_blocks(view, starts, entry_offsets)
+
+    functions, call_graph = _build_functions(blocks, entry_offsets)
+    return ControlFlowGraph(rom_hash(rom), entry_offsets, blocks, functions, call_graph)
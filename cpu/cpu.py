@@ -1,65 +1,308 @@
+import math
+from types import CodeType
+from typing import BinaryIO
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
 from cpu.instruction import CPUInstruction
+from cpu.instruction import InstructionRunnable
 from cpu.instruction import Operands
+from cpu.instruction import index_opcode
+from cpu.instrumentation import OpcodeStats
 from cpu.interrupts import InterruptsManager
+from cpu.opcode_table import ARGS_LENGTHS
+from cpu.opcode_table import CYCLES_BRANCH
+from cpu.opcode_table import CYCLES_NO_BRANCH
 from cpu.timer import Timer
 from custom_types import u16
 from debugger import Debugger
+from link.serial import SerialPort
+from ppu.ppu import PPU
 from mmu.memory import Memory
-from cpu.opcodes import opcodes
+from cpu.opcodes import HANDLERS
+from cpu.opcodes import instruction_table
 from cpu.registers import Registers
 from custom_types import u8
-from utils.bit_operations import combine_bytes
+from profiler import Profiler
+from tracer import TraceRecorder
 
 
 class CPU:
-    def __init__(self, memory: Memory, enable_debugger: bool):
+    def __init__(self, memory: Memory, enable_debugger: bool, enable_profiler: bool = False):
         self._memory = memory
         self._registers = Registers()
         self._interrupts_manager = InterruptsManager(self._registers, self._memory)
         self._timer = Timer(self._memory, self._interrupts_manager)
+        self._scheduler = memory.scheduler
+        self._serial = SerialPort(self._memory, self._interrupts_manager)
+        self._ppu = PPU(self._memory, self._interrupts_manager)
         self._debugger = Debugger(self._registers, self._memory, self._timer, enable_debugger)
+        self._profiler = Profiler(self._registers, self._memory) if enable_profiler else None
+        self._opcode_stats = None
+        self._tracer = None
+        # Flat dispatch table indexed by opcode_index(), swapped for an instrumented copy while
+        # gathering opcode statistics. The definitions are only built for the debugger and the profiler.
+        self._handlers: List[InstructionRunnable] = HANDLERS
+        self._opcodes: Optional[Dict[int, CPUInstruction]] = None
+        # Translated ROM code and its blocks keyed by the pc they start at, see cpu.translator.Block
+        self._translation: Optional[CodeType] = None
+        self._blocks: Optional[Dict[int, tuple]] = None
 
-        # Skip the bootrom for now and start directly with cartridge data
+        # Skip the bootrom for now and start directly with cartridge data, in the state the DMG boot
+        # ROM leaves the registers in
+        self._registers.af = 0x01b0
+        self._registers.bc = 0x0013
+        self._registers.de = 0x00d8
+        self._registers.hl = 0x014d
+        self._registers.sp = 0xfffe
         self._registers.pc = 0x100
-        #self.registers.sp = 0xfffe
+
+    @property
+    def registers(self) -> Registers:
+        return self._registers
+
+    @property
+    def memory(self) -> Memory:
+        return self._memory
+
+    @property
+    def serial(self) -> SerialPort:
+        return self._serial
+
+    @property
+    def ppu(self) -> PPU:
+        return self._ppu
+
+    @property
+    def profiler(self) -> Optional[Profiler]:
+        return self._profiler
+
+    @property
+    def opcode_stats(self) -> Optional[OpcodeStats]:
+        return self._opcode_stats
+
+    def enable_opcode_stats(self, stats: OpcodeStats) -> None:
+        self._opcode_stats = stats
+        self._opcodes = stats.instrument(instruction_table())
+        self._handlers = [self._opcodes[index_opcode(index)].run for index in range(0x200)]
+        self._bind_translated_blocks()
+
+    def disable_opcode_stats(self) -> None:
+        self._opcode_stats = None
+        self._opcodes = None
+        self._handlers = HANDLERS
+        self._bind_translated_blocks()
+
+    @property
+    def is_translated(self) -> bool:
+        return self._translation is not None
+
+    def enable_translation(self, rom: bytes, use_cache: bool = True) -> None:
+        """Runs the statically reachable code of the ROM as translated blocks instead of interpreting it.
+
+        The translation is cached on disk, so that it only happens the first time a ROM is run.
+        """
+        # The translator needs the ROM analysis, which plain runs do not pay for at startup
+        from cpu.translator import load_code
+
+        self._translation = load_code(rom, use_cache)
+        self._bind_translated_blocks()
+
+    def _bind_translated_blocks(self) -> None:
+        if self._translation is None:
+            return
+
+        from cpu.translator import load_blocks
+
+        self._blocks = load_blocks(self._translation, self._handlers, self._memory.rom_bank)
+
+    def start_trace(self, output: BinaryIO) -> None:
+        self._tracer = TraceRecorder(self._registers, self._memory, self._timer, output)
+
+    def stop_trace(self) -> None:
+        if self._tracer:
+            self._tracer.flush()
+            self._tracer = None
+
+    @property
+    def cycles(self) -> int:
+        return self._scheduler.cycles
 
     def start(self) -> None:
-        while True:
-            if self._registers.halted:
-                self._timer.tick(1)
-                if self._interrupts_manager.is_any_interrupt_scheduled():
-                    self._registers.halted = False
+        self.run(math.inf)
+
+    def run(self, cycles: float) -> int:
+        """Runs for at least the given number of cycles, returns the number of instructions executed."""
+        until = self._scheduler.cycles + cycles
+        executed = 0
+
+        while self._scheduler.cycles < until:
+            if self._is_instrumented():
+                executed += self._run_instrumented(until)
+            elif self._blocks is not None:
+                executed += self._run_translated(until)
             else:
-                byte = self._fetch()
-                instruction = self._decode(byte)
+                executed += self._run_fast(until)
+
+        return executed
+
+    def _is_instrumented(self) -> bool:
+        return self._debugger.active or self._profiler is not None or self._tracer is not None
+
+    def _run_fast(self, until: float) -> int:
+        # Nothing can attach hooks once we get there, so this loop has none
+        registers = self._registers
+        scheduler = self._scheduler
+        interrupts_manager = self._interrupts_manager
+        fetch_instruction = self._fetch_instruction
+        execute = self._execute
+        executed = 0
+
+        while scheduler.cycles < until:
+            if registers.halted:
+                executed += self._tick_halted()
+            else:
+                index, args = fetch_instruction()
+                execute(index, args)
+                executed += 1
+
+            if interrupts_manager.pending:
+                interrupts_manager.handle_interrupts()
 
-                if instruction.args_length:
-                    args = Operands(bytes(self._fetch() for _ in range(instruction.args_length)))
-                else:
-                    args = None
+        return executed
 
-                self._debugger.debug(instruction, args)
-                self._execute(instruction, args)
+    def _run_translated(self, until: float) -> int:
+        registers = self._registers
+        memory = self._memory
+        scheduler = self._scheduler
+        tick = scheduler.tick
+        interrupts_manager = self._interrupts_manager
+        handle_interrupts = interrupts_manager.handle_interrupts
+        blocks = self._blocks
+        fetch_instruction = self._fetch_instruction
+        execute = self._execute
+        executed = 0
 
+        while scheduler.cycles < until:
+            if registers.halted:
+                executed += self._tick_halted()
+                if interrupts_manager.pending:
+                    handle_interrupts()
+                continue
+
+            block = blocks.get(registers.pc)
+            if block is not None and scheduler.cycles + block[1] < until:
+                executed += block[0](registers, memory, tick, interrupts_manager)
+            else:
+                # RAM code, code only reached through computed jumps, or a block that could overshoot
+                index, args = fetch_instruction()
+                execute(index, args)
+                executed += 1
+                if interrupts_manager.pending:
+                    handle_interrupts()
+
+        return executed
+
+    def _run_instrumented(self, until: float) -> int:
+        scheduler = self._scheduler
+        debugger = self._debugger
+        step = self.step
+        executed = 0
+
+        # The debugger can be disabled from its prompt, in which case we switch to the fast loop
+        while (debugger.active or self._profiler or self._tracer) and scheduler.cycles < until:
+            executed += step()
+
+        return executed
+
+    def step(self) -> bool:
+        """Executes one instruction, or one halted tick, through the debugging and profiling hooks.
+
+        Returns whether an instruction was executed.
+        """
+        registers = self._registers
+
+        if registers.halted:
+            executed = self._tick_halted()
             self._interrupts_manager.handle_interrupts()
+            return bool(executed)
+
+        pc = registers.pc
+
+        if self._tracer:
+            self._tracer.record(pc)
+
+        index, args = self._fetch_instruction()
+        instruction = self._instruction(index)
+
+        if self._debugger.active:
+            self._debugger.debug(pc, instruction, args)
+
+        cycles = self._execute(index, args)
+
+        if self._profiler:
+            self._profiler.record(pc, instruction, cycles)
+
+        self._interrupts_manager.handle_interrupts()
+        return True
+
+    def _tick_halted(self) -> int:
+        """Runs one cycle of HALT, returns the number of instructions executed."""
+        if self._registers.halt_bug:
+            self._run_halt_bug()
+            return 1
+
+        self._scheduler.tick(1)
+        if self._interrupts_manager.pending:
+            self._registers.halted = False
+        return 0
+
+    def _run_halt_bug(self) -> None:
+        # The CPU leaves HALT right away but fails to increment pc past the next opcode, which runs with
+        # its own first byte read again. Rare enough to stay out of the loops and the translated blocks.
+        registers = self._registers
+        registers.halted = False
+        registers.halt_bug = False
+
+        index = self._decode(self._memory.content[registers.pc])
+        args_length = ARGS_LENGTHS[index]
+        args = Operands(bytes(self._fetch() for _ in range(args_length))) if args_length else None
+        self._execute(index, args)
+
+    def _instruction(self, index: int) -> CPUInstruction:
+        return (self._opcodes or instruction_table())[index_opcode(index)]
+
+    def _fetch_instruction(self) -> Tuple[int, Optional[Operands]]:
+        """Returns the opcode_index() of the instruction at pc and its operands."""
+        index = self._decode(self._fetch())
+        args_length = ARGS_LENGTHS[index]
+
+        if args_length:
+            args = Operands(bytes(self._fetch() for _ in range(args_length)))
+        else:
+            args = None
+
+        return index, args
 
     def _fetch(self) -> u8:
-        data = self._memory.read(self._registers.pc)
+        # Even during OAM DMA, which only locks data reads out, like translated blocks have their code built in
+        data = self._memory.content[self._registers.pc]
         self._registers.pc = u16(self._registers.pc + 1)
         return data
 
-    def _decode(self, byte: u8) -> CPUInstruction:
+    def _decode(self, byte: u8) -> int:
         if self._is_prefixed_opcode(byte):
-            opcode = combine_bytes(u8(0xcb), self._fetch())
-        else:
-            opcode = byte
+            return 0x100 | self._fetch()
 
-        return opcodes[opcode]
+        return byte
 
-    def _execute(self, instruction: CPUInstruction, operands: Operands) -> None:
-        branched = instruction.run(self._registers, self._memory, operands)
-        cycles = instruction.cycles_branch if branched else instruction.cycles_no_branch
-        self._timer.tick(cycles)
+    def _execute(self, index: int, operands: Optional[Operands]) -> int:
+        branched = self._handlers[index](self._registers, self._memory, operands)
+        cycles = CYCLES_BRANCH[index] if branched else CYCLES_NO_BRANCH[index]
+        self._scheduler.tick(cycles)
+        return cycles
 
     @staticmethod
     def _is_prefixed_opcode(byte: u8) -> bool:
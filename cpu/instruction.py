@@ -39,30 +39,60 @@ class Operands:
         return f'{self.to_u16():x}'
 
 
+# Control flow kinds
+FLOW_NONE = 0  # execution continues with the next instruction
+FLOW_JUMP = 1  # unconditional jump to the operand address
+FLOW_BRANCH = 2  # conditional jump to the operand address
+FLOW_CALL = 3  # call to the operand address (or reset vector), execution resumes after it
+FLOW_RETURN = 4  # unconditional return
+FLOW_RETURN_CONDITIONAL = 5
+FLOW_INDIRECT = 6  # JP HL, the target is unknown
+FLOW_INVALID = 7  # not an instruction, most likely data
+
+# Operand kinds
+OPERAND_NONE = 0
+OPERAND_U8 = 1
+OPERAND_U16 = 2
+OPERAND_I8 = 3
+OPERAND_RELATIVE = 4  # JR offset
+
+
+def opcode_index(opcode: int) -> int:
+    # CB-prefixed opcodes are stored right after the 256 unprefixed ones in flat tables
+    return 0x100 | (opcode & 0xff) if opcode > 0xff else opcode
+
+
+def index_opcode(index: int) -> int:
+    return 0xcb00 | (index & 0xff) if index > 0xff else index
+
+
 # The function returns whether the instruction branched or not
 InstructionRunnable = Callable[[Registers, Memory, Operands], bool]
 
 
-@dataclass
+def unimplemented(opcode: int, name: str) -> InstructionRunnable:
+    def _default_operation(*args):
+        raise NotImplementedError(f'[{opcode:#x}] {name} is not implemented')
+
+    return _default_operation
+
+
+# Built from the flat tables of cpu.opcode_table, where the derived fields are precomputed
+@dataclass(frozen=True, slots=True)
 class CPUInstruction:
     name: str
     opcode: int
     length: int
+    args_length: int  # operand bytes following the opcode
     cycles_no_branch: int
     cycles_branch: int
+    operand: int  # OPERAND_* kind
+    flow: int  # FLOW_* kind
     run: InstructionRunnable = None
 
     def __post_init__(self):
-        def _default_operation(*args):
-            raise NotImplementedError(f'[{self.opcode:#x}] {self.name} is not implemented')
-
         if self.run is None:
-            self.run = _default_operation
-
-    @property
-    def args_length(self) -> int:
-        opcode_length = 2 if self.opcode >= 0xcb00 else 1
-        return self.length - opcode_length
+            object.__setattr__(self, 'run', unimplemented(self.opcode, self.name))
 
     def __repr__(self) -> str:
         return f'[{self.opcode:#04x}] {self.name}'
@@ -0,0 +1,94 @@
+import array
+import csv
+import json
+from dataclasses import replace
+from time import perf_counter_ns
+from typing import Dict
+from typing import List
+from typing import TextIO
+
+from cpu.instruction import CPUInstruction
+from cpu.instruction import InstructionRunnable
+from cpu.instruction import opcode_index
+
+DEFAULT_SAMPLE_RATE = 64
+
+
+def zeroed_counters(size: int) -> array.array:
+    return array.array('Q', bytes(8 * size))
+
+
+class OpcodeStats:
+    """Counts executions of every opcode and samples the host time spent in its handler.
+
+    Instead of checking a flag on every instruction, the statistics are gathered by
+    an instrumented copy of the opcode table which the CPU swaps in and out.
+    """
+
+    def __init__(self, sample_rate: int = DEFAULT_SAMPLE_RATE):
+        if sample_rate < 1:
+            raise ValueError('Sample rate must be at least 1')
+
+        self.sample_rate = sample_rate
+        self.executions = zeroed_counters(0x200)
+        self.samples = zeroed_counters(0x200)
+        self.sampled_ns = zeroed_counters(0x200)
+        self._names: Dict[int, str] = {}
+
+    def instrument(self, table: Dict[int, CPUInstruction]) -> Dict[int, CPUInstruction]:
+        for opcode, instruction in table.items():
+            self._names[opcode] = instruction.name
+
+        return {opcode: replace(instruction, run=self._wrap(instruction)) for opcode, instruction in table.items()}
+
+    def _wrap(self, instruction: CPUInstruction) -> InstructionRunnable:
+        run = instruction.run
+        index = opcode_index(instruction.opcode)
+        sample_rate = self.sample_rate
+        executions = self.executions
+        samples = self.samples
+        sampled_ns = self.sampled_ns
+
+        def instrumented_run(registers, memory, operands):
+            count = executions[index] + 1
+            executions[index] = count
+
+            if count % sample_rate:
+                return run(registers, memory, operands)
+
+            start = perf_counter_ns()
+            branched = run(registers, memory, operands)
+            sampled_ns[index] += perf_counter_ns() - start
+            samples[index] += 1
+            return branched
+
+        return instrumented_run
+
+    def average_ns(self, opcode: int) -> float:
+        index = opcode_index(opcode)
+        return self.sampled_ns[index] / self.samples[index] if self.samples[index] else 0.0
+
+    def rows(self) -> List[dict]:
+        rows = []
+        for opcode, name in sorted(self._names.items()):
+            index = opcode_index(opcode)
+            if not self.executions[index]:
+                continue
+
+            rows.append({
+                'opcode': f'{opcode:#04x}',
+                'name': name,
+                'executions': self.executions[index],
+                'samples': self.samples[index],
+                'average_ns': round(self.average_ns(opcode), 1),
+            })
+
+        return sorted(rows, key=lambda row: row['executions'], reverse=True)
+
+    def write_json(self, output: TextIO) -> None:
+        json.dump({'sample_rate': self.sample_rate, 'opcodes': self.rows()}, output, indent=2)
+
+    def write_csv(self, output: TextIO) -> None:
+        writer = csv.DictWriter(output, fieldnames=['opcode', 'name', 'executions', 'samples', 'average_ns'])
+        writer.writeheader()
+        writer.writerows(self.rows())
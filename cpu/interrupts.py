@@ -1,16 +1,14 @@
-from enum import Flag
+from enum import Enum
 
 from cpu.opcodes import call
 from cpu.registers import Registers
 from custom_types import u16
 
 from mmu.memory import Memory
-from utils.bit_operations import get_bit
-from utils.bit_operations import set_bit
 
 
-# Interrupt flags with their bit position
-class InterruptFlag(Flag):
+# Interrupt flags with their bit position, the lowest bit has the highest priority
+class InterruptFlag(Enum):
     VBLANK = 0
     LCD = 1
     TIMER = 2
@@ -27,6 +25,15 @@ INTERRUPT_SERVICE_ROUTINES = {
     InterruptFlag.JOYPAD: u16(0x0060),
 }
 
+INTERRUPTS_MASK = 0x1f
+# Two wait states, pushing pc and jumping to the routine
+DISPATCH_CYCLES = 20
+
+# Bit position of the interrupt to service for every 5-bit set of pending interrupts
+HIGHEST_PRIORITY = tuple((pending & -pending).bit_length() - 1 for pending in range(INTERRUPTS_MASK + 1))
+# ISR addresses indexed by bit position
+ISR_ADDRESSES = tuple(INTERRUPT_SERVICE_ROUTINES[InterruptFlag(bit)] for bit in range(len(InterruptFlag)))
+
 
 IF_REGISTER_ADDRESS = u16(0xff0f)
 IE_REGISTER_ADDRESS = u16(0xffff)
@@ -36,39 +43,42 @@ class InterruptsManager:
     def __init__(self, registers: Registers, memory: Memory):
         self._registers = registers
         self._memory = memory
-
-    def handle_interrupts(self) -> None:
-        if not self._registers.ime:
-            return
-
-        for flag in InterruptFlag:
-            if self._should_trigger_interrupt(flag):
-                self._process_interrupt(flag)
+        # IE & IF, kept up to date by the writes to both registers. Checking it is all it costs
+        # to find out whether an interrupt is requested after each instruction.
+        self.pending = 0
+
+        memory.add_write_hook(IF_REGISTER_ADDRESS, self._update_pending)
+        memory.add_write_hook(IE_REGISTER_ADDRESS, self._update_pending)
+        self._update_pending()
+
+    def handle_interrupts(self) -> bool:
+        """Services the pending interrupt with the highest priority, returns whether the pc moved to its routine."""
+        if not self.pending or not self._registers.ime:
+            return False
+
+        registers = self._registers
+        bit = HIGHEST_PRIORITY[self.pending]
+        registers.ime = False
+        registers.halted = False
+        if registers.halt_bug:
+            # HALT right after EI: the routine returns to the HALT instruction
+            registers.halt_bug = False
+            registers.pc = u16(registers.pc - 1)
+
+        self._memory.write_u8(IF_REGISTER_ADDRESS, self._memory.content[IF_REGISTER_ADDRESS] & ~(1 << bit))
+        call(registers, self._memory, ISR_ADDRESSES[bit])
+        self._memory.scheduler.tick(DISPATCH_CYCLES)
+        return True
 
     def set_interrupt(self, flag: InterruptFlag) -> None:
-        self._update_interrupt_flag(flag, True)
+        self._memory.write_u8(IF_REGISTER_ADDRESS, self._memory.content[IF_REGISTER_ADDRESS] | 1 << flag.value)
 
     def reset_interrupt(self, flag: InterruptFlag) -> None:
-        self._update_interrupt_flag(flag, False)
-
-    def _update_interrupt_flag(self, flag: InterruptFlag, enabled: bool) -> None:
-        interrupt_flags = self._memory.read(IF_REGISTER_ADDRESS)
-        updated_interrupt_flags = set_bit(interrupt_flags, flag.value, int(enabled))
-        self._memory.write_u8(IF_REGISTER_ADDRESS, updated_interrupt_flags)
+        self._memory.write_u8(IF_REGISTER_ADDRESS, self._memory.content[IF_REGISTER_ADDRESS] & ~(1 << flag.value))
 
     def is_any_interrupt_scheduled(self) -> bool:
-        interrupt_enable = self._memory.read(IE_REGISTER_ADDRESS)
-        interrupt_flags = self._memory.read(IF_REGISTER_ADDRESS)
-        return interrupt_enable & interrupt_flags != 0x0
-
-    def _process_interrupt(self, flag: InterruptFlag) -> None:
-        self._registers.ime = False
-        self.reset_interrupt(flag)
-
-        isr_address = INTERRUPT_SERVICE_ROUTINES[flag]
-        call(self._registers, self._memory, isr_address)
+        return self.pending != 0
 
-    def _should_trigger_interrupt(self, flag: InterruptFlag) -> bool:
-        interrupt_enable = self._memory.read(IE_REGISTER_ADDRESS)
-        interrupt_flags = self._memory.read(IF_REGISTER_ADDRESS)
-        return get_bit(interrupt_flags & interrupt_enable, flag.value) == 1
+    def _update_pending(self, _value: int = 0) -> None:
+        content = self._memory.content
+        self.pending = content[IE_REGISTER_ADDRESS] & content[IF_REGISTER_ADDRESS] & INTERRUPTS_MASK
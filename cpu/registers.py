@@ -40,6 +40,8 @@ class Registers:
 
     ime: bool = False
     halted: bool = False
+    # HALT executed with IME unset and an interrupt pending, see cpu.opcodes.halt()
+    halt_bug: bool = False
 
     @property
     def af(self) -> u16:
@@ -0,0 +1,164 @@
+import importlib.util
+import marshal
+import os
+from types import CodeType
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Sequence
+from typing import Tuple
+
+from cpu.analysis import BANK_SIZE
+from cpu.analysis import BasicBlock
+from cpu.analysis import analyze
+from cpu.analysis import decode
+from cpu.analysis import rom_hash
+from cpu.instruction import InstructionRunnable
+from cpu.instruction import Operands
+from cpu.opcode_table import ARGS_LENGTHS
+from cpu.opcode_table import CYCLES_BRANCH
+from cpu.opcode_table import CYCLES_NO_BRANCH
+from cpu.opcode_table import LENGTHS
+from cpu.opcode_table import NAMES
+from utils import files
+
+TRANSLATION_VERSION = 3
+# Marshalled code can only be loaded by the Python version that wrote it
+CACHE_TAG = f'v{TRANSLATION_VERSION}-{importlib.util.MAGIC_NUMBER.hex()}'
+
+# A translated block runs its instructions and returns how many it executed. It leaves early
+# when an interrupt gets serviced, so the caller always resumes at the right pc.
+BlockFunction = Callable[..., int]
+
+# Translated block and the cycles it can take before starting its last instruction.
+# The caller only enters a block when it cannot overshoot its cycle budget.
+Block = Tuple[BlockFunction, int]
+
+
+def cache_directory() -> str:
+    return files.cache_directory('aot')
+
+
+def cache_paths(rom: bytes) -> Tuple[str, str]:
+    """Generated source and marshalled code of a ROM, in a directory named after its hash."""
+    directory = os.path.join(cache_directory(), rom_hash(rom))
+    return os.path.join(directory, f'blocks-{CACHE_TAG}.py'), os.path.join(directory, f'blocks-{CACHE_TAG}.marshal')
+
+
+# ROM offset and opcode_index() of a translated instruction
+TranslatedInstruction = Tuple[int, int]
+
+
+def _split(rom: memoryview, block: BasicBlock) -> List[List[TranslatedInstruction]]:
+    # HALT hands control back to the main loop, what follows it is translated separately
+    segments = [[]]
+    offset = block.offset
+
+    for _ in range(block.instructions):
+        index, _operand = decode(rom, offset)
+        segments[-1].append((offset, index))
+        offset += LENGTHS[index]
+
+        if NAMES[index] == 'HALT' and offset < block.offset + block.size:
+            segments.append([])
+
+    return segments
+
+
+def _translate_segment(rom: memoryview, address: int, instructions: List[TranslatedInstruction]) -> Tuple[str, int]:
+    offset = instructions[0][0]
+    parameters = ['r', 'm', 'tick', 'interrupts']
+    body = []
+    cycles = 0
+
+    for position, (instruction_offset, index) in enumerate(instructions):
+        address += LENGTHS[index]
+        handler = f'h{position}'
+        parameters.append(f'{handler}=H[{index:#x}]')
+
+        if ARGS_LENGTHS[index]:
+            operands = f'o{position}'
+            data = bytes(rom[instruction_offset + 1:instruction_offset + LENGTHS[index]])
+            parameters.append(f'{operands}=O({data!r})')
+        else:
+            operands = 'None'
+
+        # Handlers see the pc after the instruction, like with the interpreter
+        body.append(f'    r.pc = {address:#06x}')
+        branch, no_branch = CYCLES_BRANCH[index], CYCLES_NO_BRANCH[index]
+        if branch != no_branch:
+            body.append(f'    tick({branch} if {handler}(r, m, {operands}) else {no_branch})')
+        else:
+            body.append(f'    {handler}(r, m, {operands})')
+            body.append(f'    tick({no_branch})')
+
+        if position == len(instructions) - 1:
+            body.append('    if interrupts.pending:')
+            body.append('        interrupts.handle_interrupts()')
+            body.append(f'    return {position + 1}')
+        else:
+            body.append('    if interrupts.pending and interrupts.handle_interrupts():')
+            body.append(f'        return {position + 1}')
+            cycles += max(branch, no_branch)
+
+    source = f'def b{offset:06x}({", ".join(parameters)}):\n' + '\n'.join(body) + '\n'
+    return source, cycles
+
+
+def translate(rom: bytes) -> str:
+    """Returns the source of a module defining BLOCKS, the translation of every statically reachable
+    basic block keyed by ROM offset.
+
+    The module expects H, the flat table of opcode handlers, and O, the Operands class, in its globals.
+    """
+    graph = analyze(rom)
+    functions = [f'# Translated from ROM {graph.rom_hash}\n']
+    entries = []
+
+    with memoryview(rom) as view:
+        for block in sorted(graph.blocks.values(), key=lambda b: b.offset):
+            address = block.address
+            for segment in _split(view, block):
+                source, cycles = _translate_segment(view, address, segment)
+                functions.append(source)
+                entries.append(f'    {segment[0][0]:#x}: (b{segment[0][0]:06x}, {cycles}),')
+                address += sum(LENGTHS[index] for _, index in segment)
+
+    return '\n'.join(functions) + '\nBLOCKS = {\n' + '\n'.join(entries) + '\n}\n'
+
+
+def load_code(rom: bytes, use_cache: bool = True) -> CodeType:
+    """Returns the compiled translation of a ROM, from the disk cache when it was translated before."""
+    source_path, code_path = cache_paths(rom)
+
+    if use_cache:
+        try:
+            with open(code_path, 'rb') as f:
+                return marshal.load(f)
+        except (OSError, EOFError, ValueError, TypeError):
+            pass
+
+    source = translate(rom)
+    # Tracebacks point into the generated source, which is kept next to the code
+    code = compile(source, source_path if use_cache else '<translated ROM>', 'exec')
+
+    if use_cache:
+        files.write_atomic(source_path, source.encode())
+        files.write_atomic(code_path, marshal.dumps(code))
+
+    return code
+
+
+def load_blocks(code: CodeType, handlers: Sequence[InstructionRunnable], rom_bank: int) -> Dict[int, Block]:
+    """Binds the translated blocks to a dispatch table, returns those of the mapped banks keyed by address."""
+    namespace = {'H': handlers, 'O': Operands}
+    exec(code, namespace)
+
+    blocks = {}
+    for offset, block in namespace['BLOCKS'].items():
+        bank, address = divmod(offset, BANK_SIZE)
+        if bank == 0:
+            blocks[address] = block
+        elif bank == rom_bank:
+            blocks[BANK_SIZE + address] = block
+    return blocks
@@ -1,4 +1,6 @@
 import sys
+from typing import Optional
+from typing import Set
 
 from cpu.instruction import CPUInstruction
 from cpu.instruction import Operands
@@ -17,21 +19,29 @@ class Debugger:
         self.registers = registers
         self.timer = timer
         self.enabled = enabled
+        self.breakpoints: Set[int] = set()
         self.jump_address = None
         self.skip = None
 
-    def debug(self, instruction: CPUInstruction, operands: Operands) -> None:
-        if not self.enabled:
+    @property
+    def active(self) -> bool:
+        # The CPU only runs its instrumented loop, and calls debug(), while this is true
+        return self.enabled or bool(self.breakpoints)
+
+    def debug(self, pc: int, instruction: CPUInstruction, operands: Optional[Operands]) -> None:
+        if pc in self.breakpoints:
+            if pc == self.jump_address:
+                self.breakpoints.discard(pc)
+                self.jump_address = None
+            self.enabled = True
+            self.skip = None
+        elif not self.enabled:
             return
 
         if operands:
-            print(f'{GREEN}{instruction} ${operands}{RESET}')
+            print(f'{GREEN}{pc:#06x} {instruction} ${operands}{RESET}')
         else:
-            print(f'{GREEN}{instruction}{RESET}')
-
-        if self.jump_address and self.registers.pc != self.jump_address:
-            return
-        self.jump_address = None
+            print(f'{GREEN}{pc:#06x} {instruction}{RESET}')
 
         if self.skip and self.skip != 0:
             self.skip -= 1
@@ -67,7 +77,28 @@ class Debugger:
             except ValueError:
                 pass
 
-        self.jump_address = address
+        # Run without printing until the address is reached, like a one-shot breakpoint
+        if address not in self.breakpoints:
+            self.jump_address = address
+            self.breakpoints.add(address)
+        self.enabled = False
+
+    def _toggle_breakpoint(self) -> None:
+        if self.breakpoints:
+            print(f'breakpoints: {", ".join(f"{address:#06x}" for address in sorted(self.breakpoints))}')
+
+        address = None
+
+        while address is None:
+            try:
+                address = int(input('hex address of breakpoint to toggle: '), 16)
+            except ValueError:
+                pass
+
+        if address in self.breakpoints:
+            self.breakpoints.discard(address)
+        else:
+            self.breakpoints.add(address)
 
     def _step(self) -> None:
         step = None
@@ -90,8 +121,8 @@ class Debugger:
     def _prompt(self) -> None:
         while True:
             choice = input(
-                f'print [r]egisters / print [m]emory / [q]uit / [s]tep / '
-                f'[j]ump / [d]isable debugger / [t]iming information / [c]ontinue (default): '
+                f'print [r]egisters / print [m]emory / [q]uit / [s]tep / [j]ump / [b]reakpoint / '
+                f'[d]isable debugger / [t]iming information / [c]ontinue (default): '
             )
             if choice == '' or choice == 'c':
                 return
@@ -103,6 +134,8 @@ class Debugger:
             elif choice == 's':
                 self._step()
                 return
+            elif choice == 'b':
+                self._toggle_breakpoint()
             elif choice == 'r':
                 self._print_registers()
             elif choice == 't':
@@ -110,5 +143,6 @@ class Debugger:
             elif choice == 'm':
                 self._print_memory()
             elif choice == 'd':
+                # Breakpoints stay armed, the CPU only goes back to its fast loop without any
                 self.enabled = False
                 return
@@ -0,0 +1,123 @@
+import threading
+import time
+from typing import Optional
+from typing import Tuple
+
+from cpu.cpu import CPU
+from pacing import FRAME_RATE
+from pacing import Pacer
+from pacing import paced_frames
+from ppu.output import FrameOutput
+from ppu.ppu import FRAMEBUFFER_SIZE
+
+# Number of frames over which the speed reached is measured
+SPEED_FRAMES = 60
+
+
+class DoubleBuffer(FrameOutput):
+    """Hands the completed frames from the emulation thread to the display.
+
+    The PPU keeps rendering into its own buffer, completed frames are copied to the front one under a
+    lock that the display only holds to copy it again, so neither side waits on the other's work.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._front = bytearray(FRAMEBUFFER_SIZE)
+        # Number of the frame in the front buffer
+        self._number = 0
+
+    def frame(self, framebuffer: memoryview, number: int) -> None:
+        with self._lock:
+            self._front[:] = framebuffer
+            self._number = number
+
+    def latest(self, shown: int) -> Optional[Tuple[int, memoryview]]:
+        """Returns the number and shades of the latest frame, if it is not frame shown."""
+        with self._lock:
+            if self._number == shown:
+                return None
+            return self._number, memoryview(bytes(self._front))
+
+
+class EmulationThread(threading.Thread):
+    """Runs the emulator at the pace of the pacer until stopped.
+
+    Faster than real time, only as many frames are handed over as real time needs: the others are
+    not rendered.
+    """
+
+    def __init__(self, cpu: CPU, pacer: Pacer, frames: DoubleBuffer):
+        super().__init__(name='emulation', daemon=True)
+        self._cpu = cpu
+        self._pacer = pacer
+        self._frames = frames
+        self._stopped = threading.Event()
+        self.error: Optional[BaseException] = None
+
+    def run(self) -> None:
+        try:
+            start = time.perf_counter()
+            for count, _ in enumerate(paced_frames(self._cpu, self._pacer), 1):
+                if self._stopped.is_set():
+                    return
+                if count % SPEED_FRAMES == 0:
+                    now = time.perf_counter()
+                    self._downsample(SPEED_FRAMES / FRAME_RATE / (now - start))
+                    start = now
+        except BaseException as e:
+            self.error = e
+
+    def _downsample(self, speed: float) -> None:
+        """Adapts to the multiple of real time actually reached, whether the pacer is capped or not."""
+        self._frames.interval = max(round(speed), 1)
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+
+class Window:
+    """What the frontend needs from a GUI toolkit."""
+
+    closed = False
+
+    def present(self, framebuffer: memoryview) -> None:
+        """Shows a frame of SCREEN_WIDTH * SCREEN_HEIGHT shades."""
+        raise NotImplementedError
+
+    def process_events(self) -> None:
+        """Handles the pending window events, sets closed once the user closed the window."""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+def run_windowed(cpu: CPU, window: Window, speed: float = 1.0) -> None:
+    """Emulates in a thread of its own and shows its frames in the window until it is closed.
+
+    The speed is a multiple of real time, or pacing.UNCAPPED.
+    """
+    frames = DoubleBuffer()
+    cpu.ppu.add_output(frames)
+    emulation = EmulationThread(cpu, Pacer(speed), frames)
+    emulation.start()
+
+    # The display refreshes in real time whatever the speed of the emulation
+    refresh = Pacer()
+    shown = 0
+    try:
+        while not window.closed and emulation.is_alive():
+            frame = frames.latest(shown)
+            if frame:
+                shown, framebuffer = frame
+                window.present(framebuffer)
+            window.process_events()
+            refresh.wait()
+    finally:
+        emulation.stop()
+        emulation.join()
+        window.close()
+
+    if emulation.error:
+        raise emulation.error
@@ -0,0 +1,39 @@
+import tkinter
+
+from frontend.frontend import Window
+from ppu.output import to_rgb
+from ppu.ppu import SCREEN_HEIGHT
+from ppu.ppu import SCREEN_WIDTH
+
+PPM_HEADER = f'P6 {SCREEN_WIDTH} {SCREEN_HEIGHT} 255\n'.encode()
+
+
+class TkWindow(Window):
+    """Window from the Tk toolkit bundled with Python, frames are scaled up by a whole factor."""
+
+    def __init__(self, title: str, scale: int = 3):
+        self._root = tkinter.Tk()
+        self._root.title(title)
+        self._root.resizable(False, False)
+        self._root.protocol('WM_DELETE_WINDOW', self._on_close)
+
+        self._scale = scale
+        self._frame = tkinter.PhotoImage(width=SCREEN_WIDTH, height=SCREEN_HEIGHT)
+        self._screen = tkinter.PhotoImage(width=SCREEN_WIDTH * scale, height=SCREEN_HEIGHT * scale)
+        tkinter.Label(self._root, image=self._screen, borderwidth=0).pack()
+
+    def present(self, framebuffer: memoryview) -> None:
+        self._frame.configure(data=PPM_HEADER + to_rgb(framebuffer), format='PPM')
+        # PhotoImage.copy() only takes options from Python 3.13 on
+        self._screen.tk.call(self._screen, 'copy', self._frame, '-zoom', self._scale)
+
+    def process_events(self) -> None:
+        self._root.update()
+
+    def close(self) -> None:
+        if not self.closed:
+            self._on_close()
+
+    def _on_close(self) -> None:
+        self.closed = True
+        self._root.destroy()
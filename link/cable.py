@@ -0,0 +1,114 @@
+import select
+import socket
+from typing import Optional
+from typing import Tuple
+
+from link.serial import SerialPort
+from link.serial import TRANSFER_CYCLES
+from link.sinks import NO_DATA
+from link.sinks import SerialSink
+from scheduler import Scheduler
+
+LOCALHOST = '127.0.0.1'
+POLL_EVENT = 'link.poll'
+# How often the cable is checked for a byte clocked by the other end
+POLL_CYCLES = TRANSFER_CYCLES
+
+# Messages are two bytes: the kind and the byte shifted
+TRANSFER = 0
+REPLY = 1
+
+
+class LinkCable(SerialSink):
+    """Serial cable to an emulator instance in another process, over a local socket.
+
+    The instances run freely and only synchronize on transfers: the one providing the clock sends its
+    byte and waits for the reply. The other end checks the socket every POLL_CYCLES and answers with
+    what its serial port shifted out.
+    """
+
+    def __init__(self, connection: socket.socket):
+        if connection.family != socket.AF_UNIX:
+            # Transfers are a couple of bytes waited for
+            connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._socket = connection
+        self._connected = True
+        self._port: Optional[SerialPort] = None
+        self._scheduler: Optional[Scheduler] = None
+
+    @classmethod
+    def listen(cls, port: int, host: str = LOCALHOST) -> 'LinkCable':
+        """Waits for the other instance to connect."""
+        with socket.create_server((host, port)) as server:
+            connection, _ = server.accept()
+        return cls(connection)
+
+    @classmethod
+    def connect(cls, port: int, host: str = LOCALHOST) -> 'LinkCable':
+        return cls(socket.create_connection((host, port)))
+
+    def plug(self, port: SerialPort, scheduler: Scheduler) -> None:
+        self._port = port
+        self._scheduler = scheduler
+        port.sink = self
+        scheduler.schedule(POLL_EVENT, POLL_CYCLES, self._poll)
+
+    def transfer(self, byte: int) -> int:
+        if not self._send(TRANSFER, byte):
+            return NO_DATA
+
+        while True:
+            message = self._receive()
+            if message is None:
+                return NO_DATA
+
+            kind, value = message
+            if kind == REPLY:
+                return value
+            # Both ends provide the clock, neither gets the other's byte
+            self._send(REPLY, NO_DATA)
+
+    def close(self) -> None:
+        self._unplug()
+        if self._scheduler:
+            self._scheduler.cancel(POLL_EVENT)
+
+    def _poll(self) -> None:
+        while self._connected and select.select([self._socket], [], [], 0)[0]:
+            message = self._receive()
+            if message is None:
+                return
+
+            kind, value = message
+            if kind == TRANSFER:
+                self._send(REPLY, self._port.receive(value))
+
+        if self._connected:
+            self._scheduler.schedule(POLL_EVENT, POLL_CYCLES, self._poll)
+
+    def _send(self, kind: int, value: int) -> bool:
+        if not self._connected:
+            return False
+
+        try:
+            self._socket.sendall(bytes((kind, value)))
+        except OSError:
+            self._unplug()
+        return self._connected
+
+    def _receive(self) -> Optional[Tuple[int, int]]:
+        """Blocks until a message arrives, returns None once the other end is gone."""
+        try:
+            message = self._socket.recv(2, socket.MSG_WAITALL)
+        except OSError:
+            message = b''
+
+        if len(message) < 2:
+            self._unplug()
+            return None
+        return message[0], message[1]
+
+    def _unplug(self) -> None:
+        # Like a cable plugged into nothing from now on
+        self._connected = False
+        self._socket.close()
@@ -0,0 +1,64 @@
+from typing import Optional
+
+from cpu.interrupts import InterruptFlag
+from cpu.interrupts import InterruptsManager
+from cpu.timer import FREQUENCY
+from custom_types import u16
+from link.sinks import NO_DATA
+from link.sinks import SerialSink
+from mmu.memory import Memory
+
+SB_REGISTER_ADDRESS = u16(0xff01)
+SC_REGISTER_ADDRESS = u16(0xff02)
+
+# 8 bits shifted out at 8192Hz with the internal clock
+TRANSFER_CYCLES = 8 * FREQUENCY // 8_192
+TRANSFER_EVENT = 'serial.transfer'
+
+TRANSFER_START = 0x80
+INTERNAL_CLOCK = 0x01
+
+
+class SerialPort:
+    """SB and SC. A transfer started with the internal clock completes after TRANSFER_CYCLES, exchanging SB
+    with the sink at once and requesting the serial interrupt.
+
+    With the external clock, the transfer waits for the other end, see receive().
+    """
+
+    def __init__(self, memory: Memory, interrupts_manager: InterruptsManager, sink: Optional[SerialSink] = None):
+        self._memory = memory
+        self._scheduler = memory.scheduler
+        self._interrupts_manager = interrupts_manager
+        self.sink = sink
+
+        memory.add_write_hook(SC_REGISTER_ADDRESS, self._update_transfer)
+
+    def receive(self, byte: int) -> int:
+        """Clocks a byte in from the other end, returns the byte shifted out.
+
+        Nothing is shifted unless a transfer waits for the external clock.
+        """
+        content = self._memory.content
+        if content[SC_REGISTER_ADDRESS] & (TRANSFER_START | INTERNAL_CLOCK) != TRANSFER_START:
+            return NO_DATA
+
+        sent = content[SB_REGISTER_ADDRESS]
+        self._complete(byte)
+        return sent
+
+    def _update_transfer(self, value: int) -> None:
+        if value & (TRANSFER_START | INTERNAL_CLOCK) == TRANSFER_START | INTERNAL_CLOCK:
+            self._scheduler.schedule(TRANSFER_EVENT, TRANSFER_CYCLES, self._transfer)
+        else:
+            self._scheduler.cancel(TRANSFER_EVENT)
+
+    def _transfer(self) -> None:
+        sent = self._memory.content[SB_REGISTER_ADDRESS]
+        self._complete(self.sink.transfer(sent) if self.sink else NO_DATA)
+
+    def _complete(self, received: int) -> None:
+        content = self._memory.content
+        content[SB_REGISTER_ADDRESS] = received
+        content[SC_REGISTER_ADDRESS] &= ~TRANSFER_START
+        self._interrupts_manager.set_interrupt(InterruptFlag.SERIAL)
@@ -0,0 +1,56 @@
+from typing import TYPE_CHECKING
+from typing import BinaryIO
+
+if TYPE_CHECKING:
+    from link.serial import SerialPort
+
+NO_DATA = 0xff
+
+
+class SerialSink:
+    """The other end of the serial port: receives every byte sent and returns the byte sent back."""
+
+    def transfer(self, byte: int) -> int:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+class BufferSink(SerialSink):
+    """Captures the bytes sent, like a cable plugged into nothing."""
+
+    def __init__(self):
+        self.data = bytearray()
+
+    def transfer(self, byte: int) -> int:
+        self.data.append(byte)
+        return NO_DATA
+
+
+class StreamSink(SerialSink):
+    """Writes the bytes sent to a binary stream, such as a file or sys.stdout.buffer."""
+
+    def __init__(self, stream: BinaryIO, line_buffered: bool = False):
+        self._stream = stream
+        # Test ROMs print their results line by line, someone may be waiting for them
+        self._line_buffered = line_buffered
+
+    def transfer(self, byte: int) -> int:
+        self._stream.write(bytes((byte,)))
+        if self._line_buffered and byte == 0x0a:
+            self._stream.flush()
+        return NO_DATA
+
+    def close(self) -> None:
+        self._stream.flush()
+
+
+class PortSink(SerialSink):
+    """Cable to the serial port of another emulator instance in the same process."""
+
+    def __init__(self, port: 'SerialPort'):
+        self._port = port
+
+    def transfer(self, byte: int) -> int:
+        return self._port.receive(byte)
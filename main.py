@@ -1,23 +1,253 @@
 import argparse
+import signal
+import sys
+from typing import BinaryIO
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
 
+from apu.apu import APU
 from cpu.cpu import CPU
+from cpu.instrumentation import OpcodeStats
+from link.sinks import StreamSink
 from mmu.memory import Memory
+from pacing import UNCAPPED
+from pacing import Pacer
+from pacing import paced_frames
+from ppu.ppu import PPU
 from utils.files import read_binary_file
 
 
-def start(filename: str, enable_debugger: bool) -> None:
+def start(
+    filename: str,
+    enable_debugger: bool,
+    profile: Optional[str] = None,
+    flamegraph: Optional[str] = None,
+    opcode_stats: Optional[str] = None,
+    trace: Optional[str] = None,
+    translate: bool = False,
+    audio: Optional[str] = None,
+    serial: Optional[str] = None,
+    link_listen: Optional[int] = None,
+    link_connect: Optional[int] = None,
+    screenshots: Optional[Dict[int, str]] = None,
+    video: Optional[str] = None,
+    frame_dump: Optional[str] = None,
+    frame_ring: Optional[str] = None,
+    window: Optional[int] = None,
+    speed: Optional[float] = None,
+) -> None:
     memory = Memory()
     rom_data = read_binary_file(filename)
     memory.load_rom(rom_data)
 
-    cpu = CPU(memory, enable_debugger)
-    cpu.start()
+    cpu = CPU(memory, enable_debugger, enable_profiler=bool(profile or flamegraph))
+    if translate:
+        cpu.enable_translation(rom_data)
+    if opcode_stats:
+        cpu.enable_opcode_stats(OpcodeStats())
+
+    # Test ROMs report their results on the serial port
+    serial_file = open(serial, 'wb') if serial else None
+    cpu.serial.sink = StreamSink(serial_file or sys.stdout.buffer, line_buffered=not serial_file)
+
+    # Link cable to another instance, which takes over the serial port
+    cable = None
+    if link_listen is not None or link_connect is not None:
+        from link.cable import LinkCable
+
+        cable = LinkCable.listen(link_listen) if link_listen is not None else LinkCable.connect(link_connect)
+        cable.plug(cpu.serial, memory.scheduler)
+
+    trace_file = open(trace, 'wb') if trace else None
+    if trace_file:
+        cpu.start_trace(trace_file)
+
+    if audio:
+        # Sound needs NumPy, which plain runs do not pay for at startup
+        from apu.output import WavWriter
+
+        apu = APU(memory, WavWriter(audio))
+    else:
+        # Only what the game can read back from the sound registers
+        apu = APU(memory)
+
+    frame_files = add_frame_outputs(cpu.ppu, screenshots, video, frame_dump, frame_ring)
+
+    # Windows show the game in real time by default, headless runs go as fast as they can
+    if speed is None:
+        speed = 1.0 if window else UNCAPPED
+
+    if (
+        not cpu.profiler
+        and not cpu.opcode_stats
+        and not trace_file
+        and not audio
+        and not serial_file
+        and not cable
+        and not frame_files
+        and not frame_ring
+        and not window
+        and speed == UNCAPPED
+    ):
+        cpu.start()
+        return
+
+    # Make sure the reports are written when the emulator gets killed
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+
+    try:
+        if window:
+            # GUI toolkits are only imported when a window is asked for
+            from frontend.frontend import run_windowed
+            from frontend.tk import TkWindow
+
+            run_windowed(cpu, TkWindow(filename, window), speed)
+        elif speed != UNCAPPED:
+            for _ in paced_frames(cpu, Pacer(speed)):
+                pass
+        else:
+            cpu.start()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        apu.close()
+        cpu.serial.sink.close()
+        if serial_file:
+            serial_file.close()
+        cpu.ppu.close()
+        for frame_file in frame_files:
+            frame_file.close()
+        if trace_file:
+            cpu.stop_trace()
+            trace_file.close()
+        if profile:
+            with open(profile, 'w') as f:
+                cpu.profiler.write_report(f)
+        if flamegraph:
+            with open(flamegraph, 'w') as f:
+                cpu.profiler.write_collapsed_stacks(f)
+        if opcode_stats:
+            with open(opcode_stats, 'w', newline='') as f:
+                if opcode_stats.endswith('.csv'):
+                    cpu.opcode_stats.write_csv(f)
+                else:
+                    cpu.opcode_stats.write_json(f)
+
+
+def add_frame_outputs(
+    ppu: PPU,
+    screenshots: Optional[Dict[int, str]],
+    video: Optional[str],
+    frame_dump: Optional[str],
+    frame_ring: Optional[str],
+) -> List[BinaryIO]:
+    """Attaches the requested frame outputs, returns the files to close on exit."""
+    if not screenshots and not video and not frame_dump and not frame_ring:
+        return []
+
+    from ppu.output import FrameDump
+    from ppu.output import FrameRing
+    from ppu.output import RawVideo
+    from ppu.output import Screenshots
+
+    files = []
+    if screenshots:
+        ppu.add_output(Screenshots(screenshots))
+    if video:
+        files.append(open(video, 'wb'))
+        ppu.add_output(RawVideo(files[-1]))
+    if frame_dump:
+        files.append(open(frame_dump, 'wb'))
+        ppu.add_output(FrameDump(files[-1]))
+    if frame_ring:
+        ppu.add_output(FrameRing(frame_ring))
+    return files
+
+
+def parse_screenshot(value: str) -> Tuple[int, str]:
+    frame, _, filename = value.partition(':')
+    if not frame.isdigit() or not filename:
+        raise argparse.ArgumentTypeError('expected FRAME:FILE')
+    return int(frame), filename
+
+
+def parse_speed(value: str) -> float:
+    # 'max' or 'uncapped', a multiple of real time like '2x', or a percentage like '50%'
+    if value in ('max', 'uncapped'):
+        return UNCAPPED
+    try:
+        if value.endswith('%'):
+            speed = float(value[:-1]) / 100
+        else:
+            speed = float(value.removesuffix('x'))
+    except ValueError:
+        speed = 0
+    if not speed > 0:
+        raise argparse.ArgumentTypeError('expected max, a multiple like 2x or a percentage like 50%')
+    return speed
 
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='GameBoy Emulator.')
     parser.add_argument('filename', help='the filename of the ROM to run')
     parser.add_argument('-d', '--debugger', action='store_true', help='enable the debugger')
+    parser.add_argument('-p', '--profile', metavar='FILE', help='write a hot-spot report to FILE on exit')
+    parser.add_argument('--flamegraph', metavar='FILE', help='write collapsed call stacks to FILE on exit')
+    parser.add_argument(
+        '--opcode-stats', metavar='FILE', help='write opcode frequencies and handler costs to FILE (.json or .csv) on exit'
+    )
+    parser.add_argument('--trace', metavar='FILE', help='record a binary execution trace to FILE')
+    parser.add_argument(
+        '--aot', action='store_true', help='run the ROM code as translated blocks, cached on disk across launches'
+    )
+    parser.add_argument('--audio', metavar='FILE', help='record the sound output to FILE (.wav), requires NumPy')
+    parser.add_argument('--serial', metavar='FILE', help='write the bytes sent on the serial port to FILE instead of stdout')
+    parser.add_argument('--link-listen', type=int, metavar='PORT', help='wait for another instance to link with on PORT')
+    parser.add_argument('--link-connect', type=int, metavar='PORT', help='link with the instance listening on PORT')
+    parser.add_argument(
+        '--screenshot',
+        type=parse_screenshot,
+        action='append',
+        metavar='FRAME:FILE',
+        help='write a PNG screenshot of frame FRAME to FILE, can be repeated',
+    )
+    parser.add_argument('--video', metavar='FILE', help='stream raw RGB24 frames to FILE, which may be a named pipe')
+    parser.add_argument('--frame-dump', metavar='FILE', help='write the frames at 2 bits per pixel to FILE')
+    parser.add_argument('--frame-ring', metavar='FILE', help='render the frames into a ring memory-mapped from FILE')
+    parser.add_argument(
+        '--window',
+        type=int,
+        nargs='?',
+        const=3,
+        metavar='SCALE',
+        help='show the frames in a window, scaled up 3 times or by SCALE',
+    )
+    parser.add_argument(
+        '--speed',
+        type=parse_speed,
+        metavar='SPEED',
+        help='max, a multiple of real time like 2x, or a percentage like 50%%; 1x with --window, max otherwise',
+    )
     args = parser.parse_args()
 
-    start(args.filename, args.debugger)
+    start(
+        args.filename,
+        args.debugger,
+        args.profile,
+        args.flamegraph,
+        args.opcode_stats,
+        args.trace,
+        args.aot,
+        args.audio,
+        args.serial,
+        args.link_listen,
+        args.link_connect,
+        dict(args.screenshot or []),
+        args.video,
+        args.frame_dump,
+        args.frame_ring,
+        args.window,
+        args.speed,
+    )
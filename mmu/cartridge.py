@@ -0,0 +1,102 @@
+from dataclasses import dataclass
+
+HEADER_END = 0x150
+TITLE_START = 0x134
+TITLE_END = 0x144
+CGB_FLAG_ADDRESS = 0x143
+CARTRIDGE_TYPE_ADDRESS = 0x147
+ROM_SIZE_ADDRESS = 0x148
+RAM_SIZE_ADDRESS = 0x149
+HEADER_CHECKSUM_ADDRESS = 0x14d
+GLOBAL_CHECKSUM_ADDRESS = 0x14e
+
+ROM_BANK_SIZE = 0x4000
+
+# Hardware of each cartridge type, the part before the first '+' being the memory bank controller
+CARTRIDGE_TYPES = {
+    0x00: 'ROM',
+    0x01: 'MBC1',
+    0x02: 'MBC1+RAM',
+    0x03: 'MBC1+RAM+BATTERY',
+    0x05: 'MBC2',
+    0x06: 'MBC2+BATTERY',
+    0x08: 'ROM+RAM',
+    0x09: 'ROM+RAM+BATTERY',
+    0x0b: 'MMM01',
+    0x0c: 'MMM01+RAM',
+    0x0d: 'MMM01+RAM+BATTERY',
+    0x0f: 'MBC3+TIMER+BATTERY',
+    0x10: 'MBC3+TIMER+RAM+BATTERY',
+    0x11: 'MBC3',
+    0x12: 'MBC3+RAM',
+    0x13: 'MBC3+RAM+BATTERY',
+    0x19: 'MBC5',
+    0x1a: 'MBC5+RAM',
+    0x1b: 'MBC5+RAM+BATTERY',
+    0x1c: 'MBC5+RUMBLE',
+    0x1d: 'MBC5+RUMBLE+RAM',
+    0x1e: 'MBC5+RUMBLE+RAM+BATTERY',
+    0x20: 'MBC6',
+    0x22: 'MBC7+SENSOR+RUMBLE+RAM+BATTERY',
+    0xfc: 'POCKET CAMERA',
+    0xfd: 'TAMA5',
+    0xfe: 'HUC3',
+    0xff: 'HUC1+RAM+BATTERY',
+}
+
+# Code at RAM_SIZE_ADDRESS -> size in bytes, 0x01 is unused by licensed cartridges
+RAM_SIZES = {0x00: 0, 0x01: 0x800, 0x02: 0x2000, 0x03: 0x8000, 0x04: 0x20000, 0x05: 0x10000}
+
+
+@dataclass
+class CartridgeHeader:
+    title: str
+    cartridge_type: int
+    rom_size: int  # in bytes, 0 for an unknown code
+    ram_size: int  # in bytes, 0 for an unknown code
+    cgb: bool  # the game supports, or requires, the Game Boy Color
+    header_checksum_valid: bool  # the boot ROM locks up when it is not
+    global_checksum_valid: bool  # never checked by the hardware
+
+    @property
+    def type_name(self) -> str:
+        return CARTRIDGE_TYPES.get(self.cartridge_type, f'UNKNOWN {self.cartridge_type:#04x}')
+
+    @property
+    def mbc(self) -> str:
+        return self.type_name.split('+')[0]
+
+
+def header_checksum(rom: bytes) -> int:
+    checksum = 0
+    for byte in rom[TITLE_START:HEADER_CHECKSUM_ADDRESS]:
+        checksum = (checksum - byte - 1) & 0xff
+    return checksum
+
+
+def global_checksum(rom: bytes) -> int:
+    """Sum of every byte of the ROM but the global checksum itself."""
+    stored = rom[GLOBAL_CHECKSUM_ADDRESS] + rom[GLOBAL_CHECKSUM_ADDRESS + 1]
+    return (sum(rom) - stored) & 0xffff
+
+
+def parse_header(rom: bytes) -> CartridgeHeader:
+    if len(rom) < HEADER_END:
+        raise ValueError('ROM too small to hold a cartridge header')
+
+    cgb = bool(rom[CGB_FLAG_ADDRESS] & 0x80)
+    # Color games took the last byte of the title for their flag, and later a manufacturer code too
+    title = rom[TITLE_START:CGB_FLAG_ADDRESS if cgb else TITLE_END].split(b'\x00')[0]
+    rom_size_code = rom[ROM_SIZE_ADDRESS]
+
+    return CartridgeHeader(
+        title=title.decode('ascii', errors='replace').rstrip(),
+        cartridge_type=rom[CARTRIDGE_TYPE_ADDRESS],
+        rom_size=2 * ROM_BANK_SIZE << rom_size_code if rom_size_code <= 8 else 0,
+        ram_size=RAM_SIZES.get(rom[RAM_SIZE_ADDRESS], 0),
+        cgb=cgb,
+        header_checksum_valid=header_checksum(rom) == rom[HEADER_CHECKSUM_ADDRESS],
+        global_checksum_valid=global_checksum(rom) == int.from_bytes(
+            rom[GLOBAL_CHECKSUM_ADDRESS:GLOBAL_CHECKSUM_ADDRESS + 2], 'big'
+        ),
+    )
@@ -1,45 +1,80 @@
+from typing import Callable
+from typing import Dict
+
 from custom_types import u16
 from custom_types import u8
+from scheduler import Scheduler
 from utils.bit_operations import split_bytes
 
 SIZE = 65536  # 64KB
-IME_ADDRESS = 0xffff
+ROM_END = 0x8000
+IO_START = 0xff00
+
+OAM_START = 0xfe00
+OAM_SIZE = 0xa0
+DMA_REGISTER_ADDRESS = 0xff46
+DMA_CYCLES = 640
+DMA_END_EVENT = 'mmu.dma_end'
+# The only memory the CPU can read while an OAM DMA transfer holds the bus
+HRAM_START = 0xff80
+HRAM_END = 0xffff
 
 
 class Memory:
     def __init__(self):
         self.content = bytearray(SIZE)
+        # There is no MBC support yet, the switchable area always maps bank 1
+        self.rom_bank = 1
+        # I/O registers whose writes have side effects, address -> function called with the written value
+        self._write_hooks: Dict[int, Callable[[int], None]] = {}
+        # Shared with everything that needs the time or to act later, I/O registers included
+        self.scheduler = Scheduler()
+        # Whether an OAM DMA transfer holds the bus, until its end event
+        self.dma_active = False
+        self.add_write_hook(DMA_REGISTER_ADDRESS, self._start_oam_dma)
+
+    def add_write_hook(self, address: u16, hook: Callable[[int], None]) -> None:
+        self._write_hooks[address] = hook
 
     def load_boot_rom(self, data: bytes) -> None:
         self.content[0:256] = data
 
     def load_rom(self, data: bytes) -> None:
-        self.content[0:0x8000] = data.ljust(0x8000, b'\x00')
-
-    @property
-    def ime(self) -> bool:
-        return self.content[IME_ADDRESS] == 1
-
-    @ime.setter
-    def ime(self, value: bool) -> None:
-        self.content[IME_ADDRESS] = int(value)
+        # Without a memory bank controller only the first two banks are mapped, a longer slice would
+        # grow the address space instead
+        self.content[0:ROM_END] = data[:ROM_END].ljust(ROM_END, b'\x00')
 
     def read(self, address: u16) -> u8:
         self._raise_for_invalid_address(address)
+        if self.dma_active and not HRAM_START <= address < HRAM_END:
+            return u8(0xff)
         return u8(self.content[address])
 
     def write_u8(self, address: u16, value: u8) -> None:
         self._raise_for_invalid_address(address)
+        # The ROM is read-only, writes there are meant for the (not emulated) MBC
+        if address < ROM_END:
+            return
         self.content[address] = value & 0xff
 
-        # Blargg serial test output
-        if address == 0xff02 and value == 0x81:
-            print(chr(self.content[0xff01]), end='')
-            self.content[0xff02] = 0x0
+        if address >= IO_START and address in self._write_hooks:
+            self._write_hooks[address](value & 0xff)
+
+    def _start_oam_dma(self, value: int) -> None:
+        # The 160 bytes are copied at once, only the time the transfer keeps the bus busy is emulated.
+        # Sources past 0xdf00 read the echo of the work RAM.
+        source = (value if value < 0xe0 else value - 0x20) << 8
+        self.content[OAM_START:OAM_START + OAM_SIZE] = self.content[source:source + OAM_SIZE]
+        self.dma_active = True
+        self.scheduler.schedule(DMA_END_EVENT, DMA_CYCLES, self._end_oam_dma)
+
+    def _end_oam_dma(self) -> None:
+        self.dma_active = False
 
     # returns true if there was an overflow
     def inc_u8(self, address: u16) -> bool:
-        current_value = self.read(address)
+        # Only the timer increments registers, it is not locked out by OAM DMA
+        current_value = self.content[address]
         self.write_u8(address, u8(current_value + 1))
         return current_value == 0xff
 
@@ -48,8 +83,15 @@ class Memory:
         self._raise_for_invalid_address(address)
         self._raise_for_invalid_address(address+1)
         msb, lsb = split_bytes(value)
-        self.content[address] = lsb & 0xff
-        self.content[address+1] = msb & 0xff
+        if address >= ROM_END:
+            self.content[address] = lsb & 0xff
+        if address + 1 >= ROM_END:
+            self.content[address+1] = msb & 0xff
+
+        if address + 1 >= IO_START:
+            for hooked_address in (address, address + 1):
+                if hooked_address in self._write_hooks:
+                    self._write_hooks[hooked_address](self.content[hooked_address])
 
     @staticmethod
     def _raise_for_invalid_address(address):
@@ -0,0 +1,63 @@
+import math
+import time
+from typing import Callable
+from typing import Iterator
+from typing import Optional
+
+from cpu.cpu import CPU
+from cpu.timer import FREQUENCY
+from ppu.ppu import FRAME_CYCLES
+
+FRAME_RATE = FREQUENCY / FRAME_CYCLES  # About 59.73 Hertz
+UNCAPPED = math.inf
+# Behind by more than that, the lost time is given up on rather than caught up with at full speed
+MAX_LAG = 0.1  # Seconds
+
+
+class Pacer:
+    """Keeps emulation at real time, frame by frame.
+
+    Each frame has a deadline one period after the previous one, waiting for it absorbs the time the
+    frame took to emulate so that small delays do not add up. The speed is a multiple of real time, it
+    can be changed while running and UNCAPPED never waits.
+    """
+
+    def __init__(
+        self,
+        speed: float = 1.0,
+        frame_rate: float = FRAME_RATE,
+        clock: Callable[[], float] = time.perf_counter,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.speed = speed
+        self._frame_rate = frame_rate
+        self._clock = clock
+        self._sleep = sleep
+        self._deadline: Optional[float] = None
+
+    def wait(self) -> None:
+        """Returns once the next frame is due."""
+        if self.speed == UNCAPPED:
+            self._deadline = None
+            return
+
+        now = self._clock()
+        if self._deadline is None:
+            self._deadline = now
+        self._deadline += 1 / (self._frame_rate * self.speed)
+
+        if self._deadline > now:
+            self._sleep(self._deadline - now)
+        elif now - self._deadline > MAX_LAG:
+            self._deadline = now
+
+
+def paced_frames(cpu: CPU, pacer: Pacer) -> Iterator[None]:
+    """Runs the emulator a frame at a time, at the pace of the pacer, yielding after every frame."""
+    # Runs overshoot by a few cycles, aim at frame boundaries so that they do not add up
+    target = cpu.cycles
+    while True:
+        target += FRAME_CYCLES
+        cpu.run(target - cpu.cycles)
+        pacer.wait()
+        yield
@@ -0,0 +1,90 @@
+import hashlib
+from typing import Dict
+from typing import Iterable
+from typing import NamedTuple
+from typing import Optional
+
+from ppu.output import FrameOutput
+from ppu.output import pack_2bpp
+
+HASH_SIZE = 8
+GOLDEN_MAGIC = 'gbframes 1'
+
+
+def frame_hash(framebuffer: memoryview) -> bytes:
+    # Shades rather than VRAM: frames that look the same hash the same, however they were drawn
+    return _digest(pack_2bpp(framebuffer))
+
+
+def _digest(packed: bytes) -> bytes:
+    return hashlib.blake2b(packed, digest_size=HASH_SIZE).digest()
+
+
+class Golden(NamedTuple):
+    """Expected hashes of a run: frame number -> hash, and the hash of every frame up to the last one."""
+    frames: Dict[int, bytes]
+    sequence: bytes
+
+
+def write_golden(filename: str, golden: Golden) -> None:
+    lines = [GOLDEN_MAGIC, f'sequence {golden.sequence.hex()}']
+    lines += [f'{number} {digest.hex()}' for number, digest in sorted(golden.frames.items())]
+    with open(filename, 'w') as f:
+        f.write('\n'.join(lines) + '\n')
+
+
+def read_golden(filename: str) -> Golden:
+    with open(filename) as f:
+        lines = f.read().split('\n')
+    if lines[0] != GOLDEN_MAGIC:
+        raise ValueError(f'{filename} is not a golden file')
+
+    frames = {}
+    sequence = b''
+    for line in lines[1:]:
+        if not line:
+            continue
+        key, digest = line.split()
+        if key == 'sequence':
+            sequence = bytes.fromhex(digest)
+        else:
+            frames[int(key)] = bytes.fromhex(digest)
+    return Golden(frames, sequence)
+
+
+class FrameHashes(FrameOutput):
+    """Hashes the chosen frames, and the whole sequence of frames up to the last of them.
+
+    Given the expected hashes, keeps a copy of the frames that differ so that only those need to be
+    looked at.
+    """
+
+    def __init__(self, frames: Iterable[int], expected: Optional[Golden] = None):
+        self._frames = set(frames)
+        self.last = max(self._frames)
+        self._expected = expected
+        self._sequence = hashlib.blake2b(digest_size=HASH_SIZE)
+        self.hashes: Dict[int, bytes] = {}
+        # Frame number -> its shades, for the frames which do not match the expected hash
+        self.mismatches: Dict[int, bytes] = {}
+
+    @property
+    def done(self) -> bool:
+        return len(self.hashes) == len(self._frames)
+
+    def golden(self) -> Golden:
+        return Golden(dict(self.hashes), self._sequence.digest())
+
+    def frame(self, framebuffer: memoryview, number: int) -> None:
+        if number > self.last:
+            return
+
+        packed = pack_2bpp(framebuffer)
+        self._sequence.update(packed)
+        if number not in self._frames:
+            return
+
+        digest = _digest(packed)
+        self.hashes[number] = digest
+        if self._expected is not None and self._expected.frames.get(number) != digest:
+            self.mismatches[number] = framebuffer.tobytes()
@@ -0,0 +1,156 @@
+import mmap
+import struct
+import zlib
+from typing import BinaryIO
+from typing import Dict
+from typing import Optional
+
+from ppu.ppu import FRAMEBUFFER_SIZE
+from ppu.ppu import SCREEN_HEIGHT
+from ppu.ppu import SCREEN_WIDTH
+
+# RGB of the four shades, from lightest to darkest
+SHADES = ((0xe0, 0xf8, 0xd0), (0x88, 0xc0, 0x70), (0x34, 0x68, 0x56), (0x08, 0x18, 0x20))
+# bytes.translate() tables from shades to each RGB component
+RED, GREEN, BLUE = (bytes(shade[component] for shade in SHADES).ljust(256, b'\x00') for component in range(3))
+# And to the shade moved to its place in a byte of four 2-bit pixels, the first one in the high bits
+PACKING = tuple(bytes(shade << (6 - 2 * position) for shade in range(4)).ljust(256, b'\x00') for position in range(4))
+
+PACKED_FRAME_SIZE = FRAMEBUFFER_SIZE // 4
+
+
+def pack_2bpp(framebuffer: memoryview) -> bytes:
+    """Returns the shades packed four per byte."""
+    # Every byte is OR-ed with its neighbours as part of one large integer, instead of one at a time
+    packed = 0
+    for position in range(4):
+        packed |= int.from_bytes(framebuffer[position::4].tobytes().translate(PACKING[position]), 'big')
+    return packed.to_bytes(PACKED_FRAME_SIZE, 'big')
+
+
+def to_rgb(framebuffer: memoryview) -> bytearray:
+    rgb = bytearray(FRAMEBUFFER_SIZE * 3)
+    shades = framebuffer.tobytes()
+    rgb[0::3] = shades.translate(RED)
+    rgb[1::3] = shades.translate(GREEN)
+    rgb[2::3] = shades.translate(BLUE)
+    return rgb
+
+
+def png(framebuffer: memoryview) -> bytes:
+    """Returns the frame as a 2-bit indexed PNG image."""
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data))
+
+    packed = pack_2bpp(framebuffer)
+    row_size = SCREEN_WIDTH // 4
+    # Each row starts with its filter type, none
+    rows = b''.join(b'\x00' + packed[start:start + row_size] for start in range(0, len(packed), row_size))
+
+    return (
+        b'\x89PNG\r\n\x1a\n'
+        + chunk(b'IHDR', struct.pack('>IIBBBBB', SCREEN_WIDTH, SCREEN_HEIGHT, 2, 3, 0, 0, 0))
+        + chunk(b'PLTE', bytes(component for shade in SHADES for component in shade))
+        + chunk(b'IDAT', zlib.compress(rows))
+        + chunk(b'IEND', b'')
+    )
+
+
+def write_png(filename: str, framebuffer: memoryview) -> None:
+    with open(filename, 'wb') as f:
+        f.write(png(framebuffer))
+
+
+class FrameOutput:
+    # Only every interval-th frame is handed to the output, frames no output wants are not rendered
+    interval = 1
+
+    def first_buffer(self) -> Optional[memoryview]:
+        """Returns the buffer the PPU should render the first frame into, if the output provides them."""
+        return None
+
+    def frame(self, framebuffer: memoryview, number: int) -> Optional[memoryview]:
+        """Called with every completed frame, at the start of VBlank.
+
+        May return the buffer the PPU renders the next frame into.
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+class Screenshots(FrameOutput):
+    """Writes PNG screenshots of the given frames, frame number -> filename."""
+
+    def __init__(self, screenshots: Dict[int, str]):
+        self._screenshots = screenshots
+
+    def frame(self, framebuffer: memoryview, number: int) -> None:
+        if number in self._screenshots:
+            write_png(self._screenshots[number], framebuffer)
+
+
+class RawVideo(FrameOutput):
+    """Streams RGB24 frames, for instance to an encoder reading a pipe:
+    ffmpeg -f rawvideo -pix_fmt rgb24 -video_size 160x144 -framerate 59.73 -i PIPE output.mp4
+    """
+
+    def __init__(self, stream: BinaryIO):
+        self._stream = stream
+
+    def frame(self, framebuffer: memoryview, number: int) -> None:
+        self._stream.write(to_rgb(framebuffer))
+
+    def close(self) -> None:
+        self._stream.flush()
+
+
+class FrameDump(FrameOutput):
+    """Writes the frames packed at 2 bits per pixel, PACKED_FRAME_SIZE bytes each."""
+
+    def __init__(self, stream: BinaryIO):
+        self._stream = stream
+
+    def frame(self, framebuffer: memoryview, number: int) -> None:
+        self._stream.write(pack_2bpp(framebuffer))
+
+    def close(self) -> None:
+        self._stream.flush()
+
+
+class FrameRing(FrameOutput):
+    """Ring of frames in a memory-mapped file, for another process to read while the emulator runs.
+
+    The PPU renders straight into the slots. The file starts with a header of HEADER_SIZE bytes: the
+    number of the latest frame and its slot (both little-endian u32), followed by the slots of
+    FRAMEBUFFER_SIZE shades.
+    """
+
+    HEADER = struct.Struct('<II')
+    HEADER_SIZE = 16
+
+    def __init__(self, filename: str, slots: int = 8):
+        self._slots = slots
+        size = self.HEADER_SIZE + slots * FRAMEBUFFER_SIZE
+        with open(filename, 'w+b') as f:
+            f.truncate(size)
+            self._map = mmap.mmap(f.fileno(), size)
+        self._view = memoryview(self._map)
+        self._slot = 0
+
+    def first_buffer(self) -> memoryview:
+        return self._buffer(self._slot)
+
+    def frame(self, framebuffer: memoryview, number: int) -> memoryview:
+        self.HEADER.pack_into(self._map, 0, number, self._slot)
+        self._slot = (self._slot + 1) % self._slots
+        return self._buffer(self._slot)
+
+    def close(self) -> None:
+        self._view.release()
+        self._map.close()
+
+    def _buffer(self, slot: int) -> memoryview:
+        start = self.HEADER_SIZE + slot * FRAMEBUFFER_SIZE
+        return self._view[start:start + FRAMEBUFFER_SIZE]
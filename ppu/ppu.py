@@ -0,0 +1,271 @@
+from typing import TYPE_CHECKING
+from typing import List
+
+from cpu.interrupts import InterruptFlag
+from cpu.interrupts import InterruptsManager
+from custom_types import u16
+from mmu.memory import Memory
+from mmu.memory import OAM_START
+
+if TYPE_CHECKING:
+    from ppu.output import FrameOutput
+
+SCREEN_WIDTH = 160
+SCREEN_HEIGHT = 144
+FRAMEBUFFER_SIZE = SCREEN_WIDTH * SCREEN_HEIGHT
+
+LINE_CYCLES = 456
+OAM_SCAN_CYCLES = 80
+TRANSFER_CYCLES = 172
+LINES = 154
+FRAME_CYCLES = LINE_CYCLES * LINES
+
+LCDC_REGISTER_ADDRESS = u16(0xff40)
+STAT_REGISTER_ADDRESS = u16(0xff41)
+SCY_REGISTER_ADDRESS = u16(0xff42)
+SCX_REGISTER_ADDRESS = u16(0xff43)
+LY_REGISTER_ADDRESS = u16(0xff44)
+LYC_REGISTER_ADDRESS = u16(0xff45)
+BGP_REGISTER_ADDRESS = u16(0xff47)
+OBP0_REGISTER_ADDRESS = u16(0xff48)
+OBP1_REGISTER_ADDRESS = u16(0xff49)
+WY_REGISTER_ADDRESS = u16(0xff4a)
+WX_REGISTER_ADDRESS = u16(0xff4b)
+
+MODE_HBLANK = 0
+MODE_VBLANK = 1
+MODE_OAM_SCAN = 2
+MODE_TRANSFER = 3
+# STAT bits enabling the LCD interrupt for each mode, and for LY == LYC
+MODE_INTERRUPTS = (0x08, 0x10, 0x20, 0x00)
+COINCIDENCE = 0x04
+COINCIDENCE_INTERRUPT = 0x40
+
+PPU_EVENT = 'ppu'
+
+# Each bit of a byte moved to the lowest bit of its own byte, so that a row of a tile decodes with two
+# lookups and a shift: the 8 color indices are the bytes of SPREAD[low] | SPREAD[high] << 1
+SPREAD = tuple(int.from_bytes(bytes((byte >> (7 - bit)) & 1 for bit in range(8)), 'big') for byte in range(256))
+
+
+def palette_table(palette: int) -> bytes:
+    """Returns the bytes.translate() table from color indices to shades."""
+    return bytes((palette >> (2 * color)) & 0x3 for color in range(4)).ljust(256, b'\x00')
+
+
+class PPU:
+    """LCD timing and rendering.
+
+    LY, the STAT modes and the interrupts follow scheduler events, three per visible line. Lines are only
+    rendered while some output wants the frame, into a buffer of SCREEN_WIDTH * SCREEN_HEIGHT shades
+    (0 to 3, from lightest to darkest).
+    """
+
+    def __init__(self, memory: Memory, interrupts_manager: InterruptsManager):
+        self._memory = memory
+        self._scheduler = memory.scheduler
+        self._interrupts_manager = interrupts_manager
+        self.framebuffer = memoryview(bytearray(FRAMEBUFFER_SIZE))
+        # Number of frames completed
+        self.frame = 0
+        self._outputs: List['FrameOutput'] = []
+        # The outputs which want the frame being drawn
+        self._receivers: List['FrameOutput'] = []
+
+        self._mode = MODE_HBLANK
+        self._line = 0
+        self._window_line = 0
+        self._next_event = 0
+
+        # The boot ROM is skipped, start with the LCD on like it leaves it
+        memory.content[LCDC_REGISTER_ADDRESS] = 0x91
+        memory.content[BGP_REGISTER_ADDRESS] = 0xfc
+        memory.add_write_hook(LCDC_REGISTER_ADDRESS, self._update_lcdc)
+        memory.add_write_hook(STAT_REGISTER_ADDRESS, self._update_stat)
+        memory.add_write_hook(LYC_REGISTER_ADDRESS, lambda _value: self._compare_ly())
+        self._start_frame(self._scheduler.cycles)
+
+    def add_output(self, output: 'FrameOutput') -> None:
+        self._outputs.append(output)
+        self._update_receivers()
+        framebuffer = output.first_buffer()
+        if framebuffer is not None:
+            self.framebuffer = framebuffer
+
+    def close(self) -> None:
+        # Outputs may have provided the framebuffer
+        self.framebuffer = memoryview(bytearray(FRAMEBUFFER_SIZE))
+        for output in self._outputs:
+            output.close()
+        self._outputs.clear()
+        self._receivers.clear()
+
+    def _update_lcdc(self, value: int) -> None:
+        enabled = self._scheduler.is_scheduled(PPU_EVENT)
+        if value & 0x80 and not enabled:
+            self._start_frame(self._scheduler.cycles)
+        elif not value & 0x80 and enabled:
+            # LY stays at 0 while the LCD is off
+            self._scheduler.cancel(PPU_EVENT)
+            self._line = 0
+            self._memory.content[LY_REGISTER_ADDRESS] = 0
+            self._set_mode(MODE_HBLANK)
+
+    def _update_stat(self, value: int) -> None:
+        # The mode and the coincidence flag are read-only
+        content = self._memory.content
+        content[STAT_REGISTER_ADDRESS] = value & 0x78 | self._mode | self._coincidence()
+
+    def _start_frame(self, cycle: int) -> None:
+        self._next_event = cycle
+        self._next_frame()
+
+    def _next_frame(self) -> None:
+        self._window_line = 0
+        self._update_receivers()
+        self._start_line(0)
+
+    def _update_receivers(self) -> None:
+        number = self.frame + 1
+        self._receivers = [output for output in self._outputs if number % output.interval == 0]
+
+    def _start_line(self, line: int) -> None:
+        self._line = line
+        self._memory.content[LY_REGISTER_ADDRESS] = line
+        self._compare_ly()
+
+        if line < SCREEN_HEIGHT:
+            self._set_mode(MODE_OAM_SCAN)
+            self._schedule(OAM_SCAN_CYCLES, self._start_transfer)
+            return
+
+        if line == SCREEN_HEIGHT:
+            self._set_mode(MODE_VBLANK)
+            self._interrupts_manager.set_interrupt(InterruptFlag.VBLANK)
+            self._end_frame()
+        self._schedule(LINE_CYCLES, self._next_line)
+
+    def _start_transfer(self) -> None:
+        self._set_mode(MODE_TRANSFER)
+        if self._receivers:
+            self._render_line(self._line)
+        self._schedule(TRANSFER_CYCLES, self._start_hblank)
+
+    def _start_hblank(self) -> None:
+        self._set_mode(MODE_HBLANK)
+        self._schedule(LINE_CYCLES - OAM_SCAN_CYCLES - TRANSFER_CYCLES, self._next_line)
+
+    def _next_line(self) -> None:
+        if self._line == LINES - 1:
+            self._next_frame()
+        else:
+            self._start_line(self._line + 1)
+
+    def _schedule(self, cycles: int, callback) -> None:
+        # From the time the last event was due rather than the time it ran, which may be a few cycles later
+        self._next_event += cycles
+        self._scheduler.schedule_at(PPU_EVENT, self._next_event, callback)
+
+    def _end_frame(self) -> None:
+        self.frame += 1
+        for output in self._receivers:
+            framebuffer = output.frame(self.framebuffer, self.frame)
+            if framebuffer is not None:
+                self.framebuffer = framebuffer
+
+    def _set_mode(self, mode: int) -> None:
+        self._mode = mode
+        content = self._memory.content
+        content[STAT_REGISTER_ADDRESS] = content[STAT_REGISTER_ADDRESS] & 0xfc | mode
+        if content[STAT_REGISTER_ADDRESS] & MODE_INTERRUPTS[mode]:
+            self._interrupts_manager.set_interrupt(InterruptFlag.LCD)
+
+    def _coincidence(self) -> int:
+        return COINCIDENCE if self._line == self._memory.content[LYC_REGISTER_ADDRESS] else 0
+
+    def _compare_ly(self) -> None:
+        content = self._memory.content
+        coincidence = self._coincidence()
+        content[STAT_REGISTER_ADDRESS] = content[STAT_REGISTER_ADDRESS] & ~COINCIDENCE | coincidence
+        if coincidence and content[STAT_REGISTER_ADDRESS] & COINCIDENCE_INTERRUPT:
+            self._interrupts_manager.set_interrupt(InterruptFlag.LCD)
+
+    def _render_line(self, line: int) -> None:
+        content = self._memory.content
+        lcdc = content[LCDC_REGISTER_ADDRESS]
+
+        if lcdc & 0x01:
+            scx = content[SCX_REGISTER_ADDRESS]
+            y = (line + content[SCY_REGISTER_ADDRESS]) & 0xff
+            colors = self._tile_row(0x9c00 if lcdc & 0x08 else 0x9800, y, scx >> 3, 21)
+            colors = colors[scx & 0x7:(scx & 0x7) + SCREEN_WIDTH]
+
+            wx = content[WX_REGISTER_ADDRESS] - 7
+            if lcdc & 0x20 and line >= content[WY_REGISTER_ADDRESS] and wx < SCREEN_WIDTH:
+                window = self._tile_row(0x9c00 if lcdc & 0x40 else 0x9800, self._window_line, 0, 21)
+                self._window_line += 1
+                if wx < 0:
+                    colors[:SCREEN_WIDTH] = window[-wx:SCREEN_WIDTH - wx]
+                else:
+                    colors[wx:] = window[:SCREEN_WIDTH - wx]
+        else:
+            colors = bytearray(SCREEN_WIDTH)
+
+        shades = colors.translate(palette_table(content[BGP_REGISTER_ADDRESS]))
+        if lcdc & 0x02:
+            self._render_sprites(line, lcdc, colors, shades)
+
+        start = line * SCREEN_WIDTH
+        self.framebuffer[start:start + SCREEN_WIDTH] = shades
+
+    def _tile_row(self, tile_map: int, y: int, first_tile: int, count: int) -> bytearray:
+        """Returns the color indices of count tiles of a row of pixels of a tile map."""
+        content = self._memory.content
+        unsigned = content[LCDC_REGISTER_ADDRESS] & 0x10
+        row_start = tile_map + (y >> 3) * 32
+        fine_y = (y & 0x7) * 2
+        pixels = bytearray()
+
+        for tile in range(first_tile, first_tile + count):
+            index = content[row_start + (tile & 0x1f)]
+            address = 0x8000 + index * 16 if unsigned else 0x9000 + ((index ^ 0x80) - 0x80) * 16
+            address += fine_y
+            pixels += (SPREAD[content[address]] | SPREAD[content[address + 1]] << 1).to_bytes(8, 'big')
+
+        return pixels
+
+    def _render_sprites(self, line: int, lcdc: int, colors: bytearray, shades: bytearray) -> None:
+        content = self._memory.content
+        height = 16 if lcdc & 0x04 else 8
+
+        # At most 10 sprites per line, in OAM order
+        sprites = []
+        for address in range(OAM_START, OAM_START + 160, 4):
+            if content[address] - 16 <= line < content[address] - 16 + height:
+                sprites.append((content[address + 1], address))
+                if len(sprites) == 10:
+                    break
+
+        # The leftmost sprites, then the first ones in OAM, are drawn over the others
+        for x, address in sorted(sprites, reverse=True):
+            tile, attributes = content[address + 2], content[address + 3]
+            row = line - (content[address] - 16)
+            if attributes & 0x40:
+                row = height - 1 - row
+            if height == 16:
+                tile &= 0xfe
+
+            tile_address = 0x8000 + tile * 16 + row * 2
+            pixels = (SPREAD[content[tile_address]] | SPREAD[content[tile_address + 1]] << 1).to_bytes(8, 'big')
+            if attributes & 0x20:
+                pixels = pixels[::-1]
+
+            palette = content[OBP1_REGISTER_ADDRESS if attributes & 0x10 else OBP0_REGISTER_ADDRESS]
+            for offset, color in enumerate(pixels):
+                position = x - 8 + offset
+                if not color or not 0 <= position < SCREEN_WIDTH:
+                    continue
+                # Behind the background colors 1 to 3
+                if attributes & 0x80 and colors[position]:
+                    continue
+                shades[position] = (palette >> (2 * color)) & 0x3
@@ -0,0 +1,178 @@
+from collections import defaultdict
+from typing import Dict
+from typing import List
+from typing import TextIO
+from typing import Tuple
+
+from cpu.instruction import CPUInstruction
+from cpu.instruction import FLOW_BRANCH
+from cpu.instruction import FLOW_CALL
+from cpu.instruction import FLOW_INDIRECT
+from cpu.instruction import FLOW_JUMP
+from cpu.instruction import FLOW_RETURN
+from cpu.instruction import FLOW_RETURN_CONDITIONAL
+from cpu.instruction import index_opcode
+from cpu.instruction import opcode_index
+from cpu.instrumentation import zeroed_counters
+from cpu.opcodes import instruction_table
+from cpu.registers import Registers
+from mmu.memory import Memory
+
+ADDRESS_SPACE = 0x10000
+MAX_ROM_BANKS = 512
+MAX_STACK_DEPTH = 64
+ENTRY_POINT = 0x100
+
+RETURN_FLOWS = (FLOW_RETURN, FLOW_RETURN_CONDITIONAL)
+JUMP_FLOWS = (FLOW_JUMP, FLOW_BRANCH, FLOW_INDIRECT)
+
+
+class Profiler:
+    """Counts executions and cycles per PC, opcode and ROM bank.
+
+    Calls, returns and interrupts are tracked to maintain a guest call stack
+    so cycles can also be attributed to routines and dumped as collapsed
+    stacks for flamegraph tools.
+    """
+
+    def __init__(self, registers: Registers, memory: Memory):
+        self._registers = registers
+        self._memory = memory
+
+        self.executions = zeroed_counters(ADDRESS_SPACE)
+        self.cycles = zeroed_counters(ADDRESS_SPACE)
+        self.opcode_executions = zeroed_counters(0x200)
+        self.opcode_cycles = zeroed_counters(0x200)
+        self.bank_cycles = zeroed_counters(MAX_ROM_BANKS)
+
+        # (loop start, backward jump address) -> number of iterations
+        self.loops: Dict[Tuple[int, int], int] = defaultdict(int)
+        # call stack (tuple of routine addresses) -> cycles spent at the top of that stack
+        self.stacks: Dict[Tuple[int, ...], int] = defaultdict(int)
+
+        self._stack: List[int] = [ENTRY_POINT]
+        self._stack_key = (ENTRY_POINT,)
+        self._expected_pc = None
+
+    def record(self, pc: int, instruction: CPUInstruction, cycles: int) -> None:
+        if self._expected_pc is not None and pc != self._expected_pc:
+            # The previous instruction did not lead here, an interrupt was serviced
+            self._push_frame(pc)
+
+        self.executions[pc] += 1
+        self.cycles[pc] += cycles
+
+        index = opcode_index(instruction.opcode)
+        self.opcode_executions[index] += 1
+        self.opcode_cycles[index] += cycles
+
+        if pc < 0x8000:
+            self.bank_cycles[self._bank(pc)] += cycles
+
+        self.stacks[self._stack_key] += cycles
+
+        flow = instruction.flow
+        next_pc = self._registers.pc
+        self._expected_pc = next_pc
+
+        if next_pc == (pc + instruction.length) & 0xffff:
+            return
+
+        if flow == FLOW_CALL:
+            self._push_frame(next_pc)
+        elif flow in RETURN_FLOWS:
+            self._pop_frame()
+        elif flow in JUMP_FLOWS and next_pc <= pc:
+            self.loops[(next_pc, pc)] += 1
+
+    def _push_frame(self, address: int) -> None:
+        if len(self._stack) >= MAX_STACK_DEPTH:
+            # Code juggling the stack manually never returns, keep the deepest frames only
+            del self._stack[1]
+        self._stack.append(address)
+        self._stack_key = tuple(self._stack)
+
+    def _pop_frame(self) -> None:
+        if len(self._stack) > 1:
+            self._stack.pop()
+            self._stack_key = tuple(self._stack)
+
+    def _bank(self, address: int) -> int:
+        return 0 if address < 0x4000 else self._memory.rom_bank
+
+    def _location(self, address: int) -> str:
+        if address < 0x8000:
+            return f'{self._bank(address):02x}:{address:04x}'
+        return f'--:{address:04x}'
+
+    def _instruction_at(self, address: int) -> CPUInstruction:
+        opcode = self._memory.content[address]
+        if opcode == 0xcb and address < 0xffff:
+            opcode = 0xcb00 | self._memory.content[address + 1]
+        return instruction_table()[opcode]
+
+    def routine_cycles(self) -> Tuple[Dict[int, int], Dict[int, int]]:
+        self_cycles: Dict[int, int] = defaultdict(int)
+        inclusive_cycles: Dict[int, int] = defaultdict(int)
+
+        for stack, cycles in self.stacks.items():
+            self_cycles[stack[-1]] += cycles
+            for address in set(stack):
+                inclusive_cycles[address] += cycles
+
+        return self_cycles, inclusive_cycles
+
+    def write_report(self, output: TextIO, limit: int = 20) -> None:
+        total_cycles = sum(self.cycles) or 1
+
+        def percent(value: int) -> str:
+            return f'{100 * value / total_cycles:6.2f}%'
+
+        output.write(f'Total: {sum(self.executions)} instructions, {total_cycles} cycles\n')
+
+        output.write('\nHottest addresses\n')
+        hottest = sorted(range(ADDRESS_SPACE), key=self.cycles.__getitem__, reverse=True)[:limit]
+        for address in hottest:
+            if not self.cycles[address]:
+                break
+            output.write(
+                f'  {self._location(address)} {self.executions[address]:>12} {self.cycles[address]:>14} '
+                f'{percent(self.cycles[address])}  {self._instruction_at(address).name}\n'
+            )
+
+        output.write('\nHottest routines (self / inclusive cycles)\n')
+        self_cycles, inclusive_cycles = self.routine_cycles()
+        for address in sorted(self_cycles, key=self_cycles.__getitem__, reverse=True)[:limit]:
+            output.write(
+                f'  {self._location(address)} {self_cycles[address]:>14} {percent(self_cycles[address])} '
+                f'{inclusive_cycles[address]:>14} {percent(inclusive_cycles[address])}\n'
+            )
+
+        output.write('\nHottest loops (iterations / body cycles)\n')
+        loops = sorted(self.loops.items(), key=lambda item: item[1], reverse=True)[:limit]
+        for (start, end), iterations in loops:
+            body_cycles = sum(self.cycles[start:end + 1])
+            output.write(
+                f'  {self._location(start)}-{end:04x} {iterations:>12} {body_cycles:>14} {percent(body_cycles)}\n'
+            )
+
+        output.write('\nHottest opcodes\n')
+        hottest = sorted(range(0x200), key=self.opcode_cycles.__getitem__, reverse=True)[:limit]
+        for index in hottest:
+            if not self.opcode_cycles[index]:
+                break
+            output.write(
+                f'  {instruction_table()[index_opcode(index)]!r:<24} {self.opcode_executions[index]:>12} '
+                f'{self.opcode_cycles[index]:>14} {percent(self.opcode_cycles[index])}\n'
+            )
+
+        output.write('\nCycles per ROM bank\n')
+        for bank, cycles in enumerate(self.bank_cycles):
+            if cycles:
+                output.write(f'  {bank:02x} {cycles:>14} {percent(cycles)}\n')
+
+    def write_collapsed_stacks(self, output: TextIO) -> None:
+        # One line per stack in the format expected by flamegraph.pl and speedscope
+        for stack, cycles in self.stacks.items():
+            frames = ';'.join(self._location(address) for address in stack)
+            output.write(f'{frames} {cycles}\n')
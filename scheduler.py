@@ -0,0 +1,58 @@
+import heapq
+import math
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+
+class Scheduler:
+    """Master clock of the machine, runs callbacks once it reaches the cycle they were scheduled at.
+
+    Events are named, scheduling an event again replaces the pending one. Ticking only compares the
+    clock with the next event, so components that are rarely due cost nothing per instruction.
+    """
+
+    def __init__(self):
+        # Total number of cycles elapsed since power on
+        self.cycles = 0
+        self.next_event = math.inf
+        self._queue: List[Tuple[int, int, str]] = []  # (cycle, sequence, name)
+        self._events: Dict[str, Tuple[int, int, Callable[[], None]]] = {}  # name -> (cycle, sequence, callback)
+        self._sequence = 0
+
+    def tick(self, cycles: int) -> None:
+        self.cycles += cycles
+        if self.cycles >= self.next_event:
+            self._run_due_events()
+
+    def schedule(self, name: str, delay: int, callback: Callable[[], None]) -> None:
+        self.schedule_at(name, self.cycles + delay, callback)
+
+    def schedule_at(self, name: str, cycle: int, callback: Callable[[], None]) -> None:
+        self._sequence += 1
+        self._events[name] = (cycle, self._sequence, callback)
+        heapq.heappush(self._queue, (cycle, self._sequence, name))
+        self.next_event = min(self.next_event, cycle)
+
+    def cancel(self, name: str) -> None:
+        # The queue entry is skipped when it comes up
+        self._events.pop(name, None)
+
+    def is_scheduled(self, name: str) -> bool:
+        return name in self._events
+
+    def _run_due_events(self) -> None:
+        queue = self._queue
+
+        while queue and queue[0][0] <= self.cycles:
+            _, sequence, name = heapq.heappop(queue)
+            event = self._events.get(name)
+            if event is None or event[1] != sequence:
+                # Cancelled or scheduled again
+                continue
+
+            del self._events[name]
+            event[2]()
+
+        self.next_event = queue[0][0] if queue else math.inf
@@ -0,0 +1,87 @@
+import importlib.util
+import unittest
+
+from apu.apu import APU
+from mmu.memory import Memory
+
+
+def play_pulse(memory: Memory, length_enabled: bool = False):
+    memory.write_u8(0xff24, 0x77)  # NR50: full volume
+    memory.write_u8(0xff25, 0x11)  # NR51: channel 1 on both sides
+    memory.write_u8(0xff11, 0x80 | 0x3f)  # NR11: 50% duty, 1 length step left
+    memory.write_u8(0xff12, 0xf0)  # NR12: volume 15, no envelope
+    memory.write_u8(0xff13, 0x00)
+    memory.write_u8(0xff14, 0x87 | (0x40 if length_enabled else 0))  # NR14: trigger, 2048 - 0x700 = 256
+
+
+class TestAPUStatus(unittest.TestCase):
+    def setUp(self):
+        self.memory = Memory()
+        self.apu = APU(self.memory)
+
+    def test_length_counter_runs_out_without_synthesis(self):
+        play_pulse(self.memory, length_enabled=True)
+        self.assertEqual(self.memory.content[0xff26], 0x81)
+
+        # Length counters are clocked every 16384 cycles
+        self.memory.scheduler.tick(16_383)
+        self.assertEqual(self.memory.content[0xff26], 0x81)
+        self.memory.scheduler.tick(1)
+        self.assertEqual(self.memory.content[0xff26], 0x80)
+
+    def test_trigger_reloads_an_expired_length_counter(self):
+        play_pulse(self.memory, length_enabled=True)
+        self.memory.scheduler.tick(20_000)
+        self.memory.write_u8(0xff14, 0xc7)
+
+        self.assertEqual(self.memory.content[0xff26], 0x81)
+        self.memory.scheduler.tick(64 * 16_384)
+        self.assertEqual(self.memory.content[0xff26], 0x80)
+
+    def test_sweep_overflow_disables_channel_1(self):
+        self.memory.write_u8(0xff10, 0x12)  # NR10: period 1, increase, shift 2
+        self.memory.write_u8(0xff12, 0xf0)
+        self.memory.write_u8(0xff13, 0x00)
+        self.memory.write_u8(0xff14, 0x84)
+
+        # Sweeps at 16384 and 49152 go to 0x500 and 0x640, the one at 81920 overflows (0x7d0 + 0x1f4)
+        self.memory.scheduler.tick(81_919)
+        self.assertEqual(self.memory.content[0xff26], 0x81)
+        self.memory.scheduler.tick(1)
+        self.assertEqual(self.memory.content[0xff26], 0x80)
+
+    def test_power_off_clears_the_registers(self):
+        play_pulse(self.memory)
+        self.memory.write_u8(0xff26, 0x00)
+        self.memory.write_u8(0xff12, 0xf0)
+
+        self.assertEqual(self.memory.content[0xff10:0xff27], bytes(0x17))
+
+
+@unittest.skipUnless(importlib.util.find_spec('numpy'), 'NumPy is not installed')
+class TestAPU(unittest.TestCase):
+    def setUp(self):
+        from apu.output import RingBuffer
+
+        self.memory = Memory()
+        self.output = RingBuffer(capacity=48_000)
+        self.apu = APU(self.memory, self.output)
+
+    def test_pulse_is_synthesized_a_frame_at_a_time(self):
+        play_pulse(self.memory)
+        self.assertEqual(self.memory.content[0xff26], 0x81)
+
+        self.memory.scheduler.tick(70_224)
+        samples = self.output.read(len(self.output))
+
+        # 70224 cycles at 48kHz, and a square wave of 4194304 / (256 * 4 * 8) = 512Hz
+        self.assertIn(len(samples), (803, 804))
+        self.assertEqual(set(samples[:, 0].tolist()), {0, round(15 * 8 * 32767 / 480)})
+        self.assertTrue((samples[:, 0] == samples[:, 1]).all())
+
+    def test_length_counter_disables_the_channel(self):
+        play_pulse(self.memory, length_enabled=True)
+        self.memory.scheduler.tick(70_224)
+
+        self.assertEqual(self.memory.content[0xff26], 0x80)
+        self.assertFalse(self.output.read(len(self.output))[-100:].any())
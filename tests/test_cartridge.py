@@ -0,0 +1,55 @@
+import os
+import tempfile
+import unittest
+
+from mmu.cartridge import global_checksum
+from mmu.cartridge import header_checksum
+from mmu.cartridge import parse_header
+from tools.rom_index import RomIndex
+
+
+def make_rom(title: bytes, cartridge_type: int, banks: int = 2) -> bytes:
+    rom = bytearray(banks * 0x4000)
+    rom[0x134:0x134 + len(title)] = title
+    rom[0x147] = cartridge_type
+    rom[0x148] = (banks // 2).bit_length() - 1
+    rom[0x149] = 0x03 if cartridge_type in (0x03, 0x1b) else 0x00
+    rom[0x14d] = header_checksum(rom)
+    rom[0x14e:0x150] = global_checksum(rom).to_bytes(2, 'big')
+    return bytes(rom)
+
+
+class TestCartridge(unittest.TestCase):
+    def test_header_is_parsed_and_checked(self):
+        header = parse_header(make_rom(b'TETRIS', 0x03, banks=8))
+
+        self.assertEqual(header.title, 'TETRIS')
+        self.assertEqual((header.mbc, header.type_name), ('MBC1', 'MBC1+RAM+BATTERY'))
+        self.assertEqual((header.rom_size, header.ram_size), (0x20000, 0x8000))
+        self.assertTrue(header.header_checksum_valid)
+        self.assertTrue(header.global_checksum_valid)
+
+        corrupted = bytearray(make_rom(b'TETRIS', 0x00))
+        corrupted[0x134] ^= 0xff
+        header = parse_header(bytes(corrupted))
+        self.assertFalse(header.header_checksum_valid)
+        self.assertFalse(header.global_checksum_valid)
+
+    def test_index_only_reads_files_which_changed(self):
+        with tempfile.TemporaryDirectory() as directory:
+            roms = os.path.join(directory, 'roms')
+            os.makedirs(os.path.join(roms, 'nested'))
+            for name, rom in (('a.gb', make_rom(b'A', 0x00)), ('nested/b.gbc', make_rom(b'B', 0x1b, banks=4))):
+                with open(os.path.join(roms, name), 'wb') as f:
+                    f.write(rom)
+
+            cache = os.path.join(directory, 'index.json')
+            index = RomIndex(cache)
+            self.assertEqual([rom.header.mbc for rom in index.scan(roms)], ['ROM', 'MBC5'])
+            index.save()
+
+            os.remove(os.path.join(roms, 'a.gb'))
+            index = RomIndex(cache)
+            entries = index.scan(roms)
+            self.assertEqual(index.read_count, 0)
+            self.assertEqual([(rom.header.title, rom.header.rom_size) for rom in entries], [('B', 0x10000)])
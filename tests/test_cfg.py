@@ -0,0 +1,35 @@
+import unittest
+
+from benchmarks.roms import call_ret_rom
+from benchmarks.roms import memory_copy_rom
+from cpu.analysis import ControlFlowGraph
+from cpu.analysis import analyze
+from cpu.instruction import FLOW_BRANCH
+from cpu.instruction import FLOW_CALL
+
+
+class TestControlFlowGraph(unittest.TestCase):
+    def test_loops_are_split_into_blocks(self):
+        graph = analyze(memory_copy_rom())
+
+        copy_loop = graph.blocks[0x15b]
+        self.assertEqual(copy_loop.instructions, 5)
+        self.assertEqual(copy_loop.flow, FLOW_BRANCH)
+        self.assertEqual(sorted(copy_loop.successors), [0x15b, 0x161])
+
+    def test_calls_build_the_call_graph(self):
+        graph = analyze(call_ret_rom())
+
+        self.assertEqual(graph.blocks[0x153].flow, FLOW_CALL)
+        self.assertEqual(graph.blocks[0x153].call, 0x310)
+        self.assertEqual(graph.call_graph[0x310], [0x300])
+        self.assertIn(0x300, graph.call_graph[0x100])
+        self.assertIn(0x8, graph.call_graph[0x100])
+
+    def test_json_round_trip(self):
+        graph = analyze(call_ret_rom())
+        self.assertEqual(ControlFlowGraph.from_json(graph.to_json()), graph)
+
+
+if __name__ == '__main__':
+    unittest.main()
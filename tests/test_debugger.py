@@ -0,0 +1,72 @@
+import contextlib
+import io
+import unittest
+from unittest import mock
+
+from benchmarks.roms import call_ret_rom
+from cpu.cpu import CPU
+from mmu.memory import Memory
+
+# Address of the loop of call_ret_rom(), reached once per iteration
+LOOP = 0x153
+
+
+class TestDebugger(unittest.TestCase):
+    def setUp(self):
+        memory = Memory()
+        memory.load_rom(call_ret_rom())
+        self.cpu = CPU(memory, enable_debugger=False)
+        self.debugger = self.cpu._debugger
+        self.run_fast = mock.patch.object(self.cpu, '_run_fast', wraps=self.cpu._run_fast).start()
+        self.run_instrumented = mock.patch.object(
+            self.cpu, '_run_instrumented', wraps=self.cpu._run_instrumented
+        ).start()
+        self.addCleanup(mock.patch.stopall)
+
+    def run_with_answers(self, cycles: int, *answers: str) -> None:
+        # Running out of answers means the debugger prompted more than expected
+        with mock.patch('builtins.input', side_effect=answers) as prompt, contextlib.redirect_stdout(io.StringIO()):
+            self.cpu.run(cycles)
+        self.assertEqual(prompt.call_count, len(answers))
+
+    def test_breakpoints_switch_between_the_run_loops(self):
+        self.cpu.run(100)
+        self.assertTrue(self.run_fast.called)
+        self.assertFalse(self.run_instrumented.called)
+
+        self.run_fast.reset_mock()
+        self.debugger.breakpoints.add(0x7000)
+        self.cpu.run(100)
+        self.assertTrue(self.run_instrumented.called)
+        self.assertFalse(self.run_fast.called)
+
+        self.run_instrumented.reset_mock()
+        self.debugger.breakpoints.clear()
+        self.cpu.run(100)
+        self.assertTrue(self.run_fast.called)
+        self.assertFalse(self.run_instrumented.called)
+
+    def test_breakpoint_stops_every_time_until_cleared(self):
+        self.debugger.breakpoints.add(LOOP)
+        # Disable the debugger at the first stop, then clear the breakpoint at the second one
+        self.run_with_answers(1000, 'd', 'b', f'{LOOP:x}', 'd')
+
+        self.assertEqual(self.debugger.breakpoints, set())
+        self.assertFalse(self.debugger.active)
+        self.assertTrue(self.run_fast.called)
+
+    def test_jump_stops_exactly_once(self):
+        self.debugger.enabled = True
+        # Jump from the entry point to the loop, then disable the debugger there
+        self.run_with_answers(1000, 'j', f'{LOOP:x}', 'd')
+
+        self.assertEqual(self.debugger.breakpoints, set())
+        self.assertIsNone(self.debugger.jump_address)
+        self.assertTrue(self.run_fast.called)
+
+    def test_jump_keeps_an_existing_breakpoint(self):
+        self.debugger.enabled = True
+        self.debugger.breakpoints.add(LOOP)
+        self.run_with_answers(1000, 'j', f'{LOOP:x}', 'd', 'b', f'{LOOP:x}', 'd')
+
+        self.assertEqual(self.debugger.breakpoints, set())
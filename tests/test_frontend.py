@@ -0,0 +1,86 @@
+import unittest
+
+from cpu.cpu import CPU
+from frontend.frontend import DoubleBuffer
+from frontend.frontend import Window
+from frontend.frontend import run_windowed
+from mmu.memory import Memory
+from pacing import MAX_LAG
+from pacing import UNCAPPED
+from pacing import Pacer
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(round(seconds, 6))
+        self.now += seconds
+
+
+class Recorder(Window):
+    def __init__(self, frames: int):
+        self.frames = []
+        self._count = frames
+
+    def present(self, framebuffer: memoryview) -> None:
+        self.frames.append(bytes(framebuffer))
+
+    def process_events(self) -> None:
+        self.closed = len(self.frames) >= self._count
+
+
+class TestFrontend(unittest.TestCase):
+    def test_pacer_absorbs_the_time_frames_take(self):
+        clock = FakeClock()
+        pacer = Pacer(frame_rate=10, clock=clock, sleep=clock.sleep)
+
+        pacer.wait()
+        clock.now += 0.03
+        pacer.wait()
+        self.assertEqual(clock.sleeps, [0.1, 0.07])
+
+        # Too far behind to catch up, the next frame is due one period from now
+        clock.now += 0.1 + MAX_LAG + 0.01
+        pacer.wait()
+        pacer.wait()
+        self.assertEqual(clock.sleeps[2:], [0.1])
+
+    def test_speed_is_a_multiple_of_real_time(self):
+        clock = FakeClock()
+        pacer = Pacer(speed=2, frame_rate=10, clock=clock, sleep=clock.sleep)
+        pacer.wait()
+        pacer.speed = 0.5
+        pacer.wait()
+        pacer.speed = UNCAPPED
+        pacer.wait()
+        self.assertEqual(clock.sleeps, [0.05, 0.2])
+
+    def test_only_new_frames_are_handed_over(self):
+        frames = DoubleBuffer()
+        self.assertIsNone(frames.latest(0))
+
+        framebuffer = memoryview(bytearray(160 * 144))
+        framebuffer[0] = 3
+        frames.frame(framebuffer, 1)
+        framebuffer[0] = 2
+
+        number, shown = frames.latest(0)
+        self.assertEqual((number, shown[0]), (1, 3))
+        self.assertIsNone(frames.latest(1))
+
+    def test_window_shows_the_frames_emulated_in_a_thread(self):
+        memory = Memory()
+        memory.load_rom(bytes(0x100) + b'\x18\xfe')  # JR -2
+        cpu = CPU(memory, enable_debugger=False)
+        window = Recorder(frames=2)
+
+        run_windowed(cpu, window)
+
+        self.assertEqual(window.frames, [bytes(160 * 144)] * 2)
+        self.assertGreaterEqual(cpu.ppu.frame, 2)
@@ -0,0 +1,20 @@
+import random
+import unittest
+
+from cpu.opcode_table import LENGTHS
+from tools.fuzz import random_program
+
+
+class TestFuzz(unittest.TestCase):
+    def test_programs_include_cb_prefixed_instructions(self):
+        program = random_program(random.Random(0), 0x100)
+
+        prefixed = []
+        offset = 0
+        while offset < len(program) - 1:
+            index = 0x100 | program[offset + 1] if program[offset] == 0xcb else program[offset]
+            if index > 0xff:
+                prefixed.append(program[offset + 1])
+            offset += LENGTHS[index]
+
+        self.assertTrue(prefixed)
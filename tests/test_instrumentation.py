@@ -0,0 +1,53 @@
+import csv
+import io
+import json
+import unittest
+
+from benchmarks.roms import alu_rom
+from cpu.cpu import CPU
+from cpu.instrumentation import OpcodeStats
+from cpu.opcodes import HANDLERS
+from mmu.memory import Memory
+
+
+class TestOpcodeStats(unittest.TestCase):
+    def setUp(self):
+        memory = Memory()
+        memory.load_rom(alu_rom())
+        self.cpu = CPU(memory, enable_debugger=False)
+        self.stats = OpcodeStats(sample_rate=2)
+        self.cpu.enable_opcode_stats(self.stats)
+
+        # NOP, JP and LD SP at the entry point, then two iterations of the 20 instructions loop
+        for _ in range(3 + 2 * 20):
+            self.cpu.step()
+
+    def test_executions_are_counted_and_one_in_sample_rate_timed(self):
+        rows = {row['name']: row for row in self.stats.rows()}
+
+        self.assertEqual(rows['NOP']['executions'], 1)
+        self.assertEqual(rows['NOP']['samples'], 0)
+        self.assertEqual(rows['ADD A,B']['executions'], 2)
+        self.assertEqual(rows['ADD A,B']['samples'], 1)
+        self.assertEqual(sum(row['executions'] for row in rows.values()), 43)
+
+    def test_json_and_csv_hold_the_same_counts(self):
+        output = io.StringIO()
+        self.stats.write_json(output)
+        report = json.loads(output.getvalue())
+        self.assertEqual(report['sample_rate'], 2)
+        counts = {row['opcode']: row['executions'] for row in report['opcodes']}
+
+        output = io.StringIO()
+        self.stats.write_csv(output)
+        output.seek(0)
+        self.assertEqual({row['opcode']: int(row['executions']) for row in csv.DictReader(output)}, counts)
+        self.assertEqual(counts['0x80'], 2)
+
+    def test_disabling_restores_the_plain_handlers(self):
+        self.assertIsNot(self.cpu._handlers, HANDLERS)
+        self.cpu.disable_opcode_stats()
+        self.assertIs(self.cpu._handlers, HANDLERS)
+
+        self.cpu.step()
+        self.assertEqual(sum(self.stats.executions), 43)
@@ -0,0 +1,84 @@
+import unittest
+
+from cpu.cpu import CPU
+from cpu.interrupts import IE_REGISTER_ADDRESS
+from cpu.interrupts import IF_REGISTER_ADDRESS
+from cpu.interrupts import InterruptFlag
+from cpu.interrupts import InterruptsManager
+from cpu.registers import Registers
+from mmu.memory import Memory
+
+
+class TestInterruptsManager(unittest.TestCase):
+    def setUp(self):
+        self.registers = Registers()
+        self.registers.sp = 0xdff0
+        self.registers.pc = 0x1234
+        self.memory = Memory()
+        self.interrupts = InterruptsManager(self.registers, self.memory)
+
+    def test_pending_follows_register_writes(self):
+        self.interrupts.set_interrupt(InterruptFlag.TIMER)
+        self.assertEqual(self.interrupts.pending, 0)
+
+        self.memory.write_u8(IE_REGISTER_ADDRESS, 0xff)
+        self.assertEqual(self.interrupts.pending, 0b100)
+
+        self.memory.write_u16(0xfffe, 0x0000)
+        self.assertEqual(self.interrupts.pending, 0)
+
+    def test_highest_priority_interrupt_is_serviced_alone(self):
+        self.registers.ime = True
+        self.memory.write_u8(IE_REGISTER_ADDRESS, 0x1f)
+        self.memory.write_u8(IF_REGISTER_ADDRESS, 0b11000)
+
+        self.assertTrue(self.interrupts.handle_interrupts())
+        self.assertEqual(self.registers.pc, 0x58)
+        self.assertFalse(self.registers.ime)
+        self.assertEqual(self.interrupts.pending, 0b10000)
+        self.assertFalse(self.interrupts.handle_interrupts())
+
+
+class TestInterruptTiming(unittest.TestCase):
+    def create_cpu(self, program: bytes) -> CPU:
+        rom = bytearray(0x8000)
+        rom[0x100:0x100 + len(program)] = program
+        memory = Memory()
+        memory.load_rom(bytes(rom))
+        cpu = CPU(memory, False)
+        cpu.registers.sp = 0xdff0
+        memory.write_u8(IE_REGISTER_ADDRESS, 1 << InterruptFlag.TIMER.value)
+        memory.write_u8(IF_REGISTER_ADDRESS, 1 << InterruptFlag.TIMER.value)
+        return cpu
+
+    def test_ei_takes_effect_after_the_next_instruction(self):
+        # EI, NOP, NOP
+        cpu = self.create_cpu(bytes([0xfb, 0x00, 0x00]))
+
+        cpu.run(1)
+        self.assertEqual(cpu.registers.pc, 0x101)
+        self.assertFalse(cpu.registers.ime)
+
+        # The interrupt is serviced right after the NOP, for 20 cycles
+        cpu.run(1)
+        self.assertEqual(cpu.registers.pc, 0x50)
+        self.assertEqual(cpu.memory.content[0xdfee:0xdff0], b'\x02\x01')
+        self.assertEqual(cpu.cycles, 28)
+
+    def test_di_cancels_a_pending_ei(self):
+        # EI, DI, NOP
+        cpu = self.create_cpu(bytes([0xfb, 0xf3, 0x00]))
+
+        cpu.run(12)
+        self.assertEqual(cpu.registers.pc, 0x103)
+        self.assertFalse(cpu.registers.ime)
+
+    def test_halt_bug_reads_the_next_byte_twice(self):
+        # HALT, INC A, NOP
+        cpu = self.create_cpu(bytes([0x76, 0x3c, 0x00]))
+        cpu.registers.a = 0
+
+        cpu.run(12)
+        self.assertEqual(cpu.registers.a, 2)
+        self.assertEqual(cpu.registers.pc, 0x102)
+        self.assertFalse(cpu.registers.halted)
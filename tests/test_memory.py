@@ -0,0 +1,44 @@
+import unittest
+
+from mmu.memory import Memory
+
+
+class TestMemory(unittest.TestCase):
+    def setUp(self):
+        self.memory = Memory()
+
+    def test_oam_dma_copies_the_page_and_holds_the_bus(self):
+        self.memory.content[0xc100:0xc1a0] = bytes(range(160))
+        self.memory.content[0xff80] = 0x12
+        self.memory.write_u8(0xff46, 0xc1)
+
+        self.assertEqual(self.memory.content[0xfe00:0xfea0], bytes(range(160)))
+        self.assertEqual(self.memory.read(0xc101), 0xff)
+        self.assertEqual(self.memory.read(0xff80), 0x12)
+
+        self.memory.scheduler.tick(639)
+        self.assertEqual(self.memory.read(0xfe01), 0xff)
+        self.memory.scheduler.tick(1)
+        self.assertEqual(self.memory.read(0xc101), 1)
+        self.assertEqual(self.memory.read(0xfe01), 1)
+
+    def test_timer_registers_count_during_oam_dma(self):
+        self.memory.write_u8(0xff46, 0xc1)
+        self.memory.content[0xff05] = 0x41
+
+        self.assertFalse(self.memory.inc_u8(0xff05))
+        self.assertEqual(self.memory.content[0xff05], 0x42)
+
+    def test_oam_dma_reads_the_echo_ram(self):
+        self.memory.content[0xc000:0xc0a0] = bytes(range(160))
+        self.memory.write_u8(0xff46, 0xe0)
+
+        self.assertEqual(self.memory.content[0xfe00:0xfea0], bytes(range(160)))
+
+    def test_banked_roms_only_map_their_first_two_banks(self):
+        size = len(self.memory.content)
+        self.memory.load_rom(bytes([1]) * 0x8000 + bytes([2]) * 0x8000)
+
+        self.assertEqual(len(self.memory.content), size)
+        self.assertEqual(self.memory.content[0x7fff], 1)
+        self.assertEqual(self.memory.content[0x8000], 0)
@@ -0,0 +1,141 @@
+import os
+import struct
+import tempfile
+import unittest
+import zlib
+
+from cpu.interrupts import IF_REGISTER_ADDRESS
+from cpu.interrupts import InterruptsManager
+from cpu.registers import Registers
+from mmu.memory import Memory
+from ppu.hashing import FrameHashes
+from ppu.hashing import frame_hash
+from ppu.hashing import read_golden
+from ppu.hashing import write_golden
+from ppu.output import FrameOutput
+from ppu.output import FrameRing
+from ppu.output import pack_2bpp
+from ppu.output import png
+from ppu.ppu import FRAME_CYCLES
+from ppu.ppu import LINE_CYCLES
+from ppu.ppu import PPU
+
+
+class Capture(FrameOutput):
+    def __init__(self):
+        self.frames = []
+
+    def frame(self, framebuffer: memoryview, number: int) -> None:
+        self.frames.append(bytes(framebuffer))
+
+
+class TestPPU(unittest.TestCase):
+    def setUp(self):
+        self.memory = Memory()
+        self.ppu = PPU(self.memory, InterruptsManager(Registers(), self.memory))
+
+    def test_vblank_starts_after_144_lines(self):
+        self.memory.scheduler.tick(143 * LINE_CYCLES)
+        self.assertEqual(self.memory.content[0xff44], 143)
+        self.assertEqual(self.memory.content[IF_REGISTER_ADDRESS], 0)
+
+        self.memory.scheduler.tick(LINE_CYCLES)
+        self.assertEqual(self.memory.content[0xff44], 144)
+        self.assertEqual(self.memory.content[0xff41] & 0x3, 1)
+        self.assertEqual(self.memory.content[IF_REGISTER_ADDRESS], 0b1)
+        self.assertEqual(self.ppu.frame, 1)
+
+        self.memory.scheduler.tick(10 * LINE_CYCLES)
+        self.assertEqual(self.memory.content[0xff44], 0)
+        self.assertEqual(self.memory.content[0xff41] & 0x3, 2)
+
+    def test_background_and_sprites_are_rendered(self):
+        capture = Capture()
+        self.ppu.add_output(capture)
+        content = self.memory.content
+        # Tile 1: color 3 on its first row only, drawn at the top left of the background
+        content[0x8010:0x8012] = b'\xff\xff'
+        content[0x9800] = 1
+        # A sprite of the same tile, at (16, 0), with the palette mapping color 3 to shade 1
+        content[0xfe00:0xfe04] = bytes((16, 24, 1, 0))
+        content[0xff48] = 0b01000000
+        content[0xff40] |= 0x02
+
+        self.memory.scheduler.tick(FRAME_CYCLES)
+
+        frame = capture.frames[0]
+        self.assertEqual(frame[:8], b'\x03' * 8)
+        self.assertEqual(frame[8:16], b'\x00' * 8)
+        self.assertEqual(frame[16:24], b'\x01' * 8)
+        self.assertEqual(frame[160:], bytes(len(frame) - 160))
+
+    def test_frames_are_only_rendered_for_the_outputs_which_want_them(self):
+        every_other_frame = Capture()
+        every_other_frame.interval = 2
+        self.ppu.add_output(every_other_frame)
+        self.memory.content[0x8000:0x8002] = b'\xff\xff'
+
+        # The first frame is not drawn at all
+        self.memory.scheduler.tick(144 * LINE_CYCLES)
+        self.assertEqual(self.ppu.frame, 1)
+        self.assertEqual(bytes(self.ppu.framebuffer), bytes(160 * 144))
+
+        self.memory.scheduler.tick(3 * FRAME_CYCLES)
+        self.assertEqual(self.ppu.frame, 4)
+        self.assertEqual(len(every_other_frame.frames), 2)
+        self.assertEqual(every_other_frame.frames[0][:8], b'\x03' * 8)
+
+    def test_frames_are_rendered_into_the_ring(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'frames')
+            self.ppu.add_output(FrameRing(filename, slots=2))
+            first = self.ppu.framebuffer
+
+            self.memory.content[0x8000:0x8002] = b'\xff\x00'
+            self.memory.scheduler.tick(FRAME_CYCLES)
+            self.assertIsNot(self.ppu.framebuffer, first)
+            first.release()
+            self.ppu.close()
+
+            with open(filename, 'rb') as f:
+                ring = f.read()
+            self.assertEqual(FrameRing.HEADER.unpack_from(ring), (1, 0))
+            self.assertEqual(ring[FrameRing.HEADER_SIZE:FrameRing.HEADER_SIZE + 8], b'\x03' * 8)
+
+    def test_png_holds_the_packed_frame(self):
+        framebuffer = memoryview(bytes(range(4)) * (160 * 144 // 4))
+        self.assertEqual(pack_2bpp(framebuffer)[:2], b'\x1b\x1b')
+
+        image = png(framebuffer)
+        self.assertEqual(image[:8], b'\x89PNG\r\n\x1a\n')
+        idat = image.index(b'IDAT')
+        size, = struct.unpack('>I', image[idat - 4:idat])
+        rows = zlib.decompress(image[idat + 4:idat + 4 + size])
+        self.assertEqual(rows[:3], b'\x00\x1b\x1b')
+        self.assertEqual(len(rows), 144 * 41)
+
+    def test_only_frames_which_differ_are_kept(self):
+        hashes = FrameHashes([1, 3])
+        self.ppu.add_output(hashes)
+        self.memory.scheduler.tick(3 * FRAME_CYCLES)
+        self.assertTrue(hashes.done)
+        self.assertEqual(hashes.hashes[1], frame_hash(memoryview(bytes(160 * 144))))
+
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'rom.frames')
+            write_golden(filename, hashes.golden())
+            golden = read_golden(filename)
+        self.assertEqual(golden, hashes.golden())
+
+        # Same run, but the background shows tile 0 with its first row set from the third frame on
+        memory = Memory()
+        ppu = PPU(memory, InterruptsManager(Registers(), memory))
+        checked = FrameHashes(golden.frames, golden)
+        ppu.add_output(checked)
+        memory.scheduler.tick(2 * FRAME_CYCLES)
+        memory.content[0x8000:0x8002] = b'\xff\xff'
+        memory.scheduler.tick(FRAME_CYCLES)
+
+        self.assertEqual(list(checked.mismatches), [3])
+        self.assertEqual(checked.mismatches[3][:8], b'\x03' * 8)
+        self.assertNotEqual(checked.golden().sequence, golden.sequence)
@@ -0,0 +1,46 @@
+import io
+import unittest
+
+from benchmarks.roms import call_ret_rom
+from cpu.cpu import CPU
+from mmu.memory import Memory
+
+
+class TestProfiler(unittest.TestCase):
+    def setUp(self):
+        memory = Memory()
+        memory.load_rom(call_ret_rom())
+        self.cpu = CPU(memory, enable_debugger=False, enable_profiler=True)
+        # The entry point and 4 iterations of the loop at 0x153, the fifth stops before its JR
+        self.cpu.run(1000)
+        self.profiler = self.cpu.profiler
+
+    def test_executions_are_counted_per_pc(self):
+        executions = {pc: count for pc, count in enumerate(self.profiler.executions) if count}
+        self.assertEqual(executions, {
+            0x0008: 4,
+            0x0100: 1, 0x0101: 1, 0x0150: 1,
+            0x0153: 5, 0x0156: 5, 0x0159: 5, 0x015a: 4,
+            0x0300: 10, 0x0301: 10,
+            0x0310: 5, 0x0311: 5, 0x0314: 5, 0x0315: 5,
+        })
+        self.assertEqual(sum(self.profiler.cycles), self.cpu.cycles)
+
+    def test_backward_jumps_are_loops(self):
+        self.assertEqual(dict(self.profiler.loops), {(0x153, 0x15a): 4})
+
+        report = io.StringIO()
+        self.profiler.write_report(report)
+        self.assertIn('00:0153-015a            4', report.getvalue())
+
+    def test_cycles_are_attributed_to_call_stacks(self):
+        output = io.StringIO()
+        self.profiler.write_collapsed_stacks(output)
+
+        self.assertEqual(output.getvalue().splitlines(), [
+            '00:0100 400',
+            '00:0100;00:0310 340',
+            '00:0100;00:0310;00:0300 100',
+            '00:0100;00:0300 100',
+            '00:0100;00:0008 64',
+        ])
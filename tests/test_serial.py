@@ -0,0 +1,88 @@
+import socket
+import threading
+import unittest
+from typing import Tuple
+
+from cpu.interrupts import IF_REGISTER_ADDRESS
+from cpu.interrupts import InterruptsManager
+from cpu.registers import Registers
+from link.cable import POLL_CYCLES
+from link.cable import LinkCable
+from link.serial import SB_REGISTER_ADDRESS
+from link.serial import SC_REGISTER_ADDRESS
+from link.serial import SerialPort
+from link.sinks import BufferSink
+from link.sinks import PortSink
+from mmu.memory import Memory
+
+
+def create_port() -> Tuple[Memory, SerialPort]:
+    memory = Memory()
+    return memory, SerialPort(memory, InterruptsManager(Registers(), memory))
+
+
+class TestSerialPort(unittest.TestCase):
+    def test_transfer_completes_after_eight_bits(self):
+        memory, port = create_port()
+        port.sink = BufferSink()
+
+        memory.write_u8(SB_REGISTER_ADDRESS, ord('P'))
+        memory.write_u8(SC_REGISTER_ADDRESS, 0x81)
+        memory.scheduler.tick(4095)
+        self.assertEqual(port.sink.data, b'')
+
+        memory.scheduler.tick(1)
+        self.assertEqual(port.sink.data, b'P')
+        self.assertEqual(memory.content[SB_REGISTER_ADDRESS], 0xff)
+        self.assertEqual(memory.content[SC_REGISTER_ADDRESS], 0x01)
+        self.assertEqual(memory.content[IF_REGISTER_ADDRESS], 0b1000)
+
+    def test_ports_exchange_bytes_over_a_cable(self):
+        master_memory, master = create_port()
+        slave_memory, slave = create_port()
+        master.sink = PortSink(slave)
+
+        slave_memory.write_u8(SB_REGISTER_ADDRESS, 0x42)
+        slave_memory.write_u8(SC_REGISTER_ADDRESS, 0x80)
+        master_memory.write_u8(SB_REGISTER_ADDRESS, 0x24)
+        master_memory.write_u8(SC_REGISTER_ADDRESS, 0x81)
+        master_memory.scheduler.tick(4096)
+
+        self.assertEqual(master_memory.content[SB_REGISTER_ADDRESS], 0x42)
+        self.assertEqual(slave_memory.content[SB_REGISTER_ADDRESS], 0x24)
+        self.assertEqual(slave_memory.content[SC_REGISTER_ADDRESS], 0x00)
+        self.assertEqual(slave_memory.content[IF_REGISTER_ADDRESS], 0b1000)
+
+
+class TestLinkCable(unittest.TestCase):
+    def test_instances_exchange_bytes_over_a_socket(self):
+        master_socket, slave_socket = socket.socketpair()
+        master_memory, master = create_port()
+        slave_memory, slave = create_port()
+        LinkCable(master_socket).plug(master, master_memory.scheduler)
+        slave_cable = LinkCable(slave_socket)
+        slave_cable.plug(slave, slave_memory.scheduler)
+
+        slave_memory.write_u8(SB_REGISTER_ADDRESS, 0x42)
+        slave_memory.write_u8(SC_REGISTER_ADDRESS, 0x80)
+
+        # The other instance runs on its own, and answers when it gets to check the cable
+        def run_slave():
+            while slave_memory.content[SC_REGISTER_ADDRESS] & 0x80:
+                slave_memory.scheduler.tick(POLL_CYCLES)
+
+        thread = threading.Thread(target=run_slave)
+        thread.start()
+        master_memory.write_u8(SB_REGISTER_ADDRESS, 0x24)
+        master_memory.write_u8(SC_REGISTER_ADDRESS, 0x81)
+        master_memory.scheduler.tick(4096)
+        thread.join(5)
+
+        self.assertEqual(master_memory.content[SB_REGISTER_ADDRESS], 0x42)
+        self.assertEqual(slave_memory.content[SB_REGISTER_ADDRESS], 0x24)
+
+        # Unplugged, the other end shifts in nothing
+        slave_cable.close()
+        master_memory.write_u8(SC_REGISTER_ADDRESS, 0x81)
+        master_memory.scheduler.tick(4096)
+        self.assertEqual(master_memory.content[SB_REGISTER_ADDRESS], 0xff)
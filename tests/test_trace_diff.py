@@ -0,0 +1,124 @@
+import io
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from benchmarks.roms import call_ret_rom
+from cpu.cpu import CPU
+from cpu.registers import Registers
+from cpu.timer import Timer
+from mmu.memory import Memory
+from tools.trace import decode
+from tools.trace_diff import diff
+from tracer import TraceRecorder
+from tracer import read_trace
+
+
+class TestTraceDiff(unittest.TestCase):
+    def setUp(self) -> None:
+        self.registers = Registers()
+        self.memory = Memory()
+        self.timer = Timer(self.memory, None)
+        self.directory = tempfile.TemporaryDirectory()
+        self.trace_filename = os.path.join(self.directory.name, 'trace.bin')
+        self.log_filename = os.path.join(self.directory.name, 'reference.log')
+
+        self.memory.content[0x100:0x104] = b'\x00\xc3\x13\x02'
+
+        with open(self.trace_filename, 'wb') as f:
+            recorder = TraceRecorder(self.registers, self.memory, self.timer, f, buffer_records=7)
+            for i in range(100):
+                self.registers.a = i
+                self.registers.hl = 0x1234 + i
+                recorder.record(0x100)
+                self.memory.scheduler.tick(4)
+            recorder.flush()
+
+        with open(self.trace_filename, 'rb') as f:
+            self.lines = [record.to_doctor() for record in read_trace(f)]
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def _write_log(self, lines) -> None:
+        with open(self.log_filename, 'w') as f:
+            f.write('\n'.join(lines) + '\n')
+
+    def test_records_are_decoded_in_doctor_format(self):
+        self.assertEqual(len(self.lines), 100)
+        self.assertEqual(
+            self.lines[1],
+            'A:01 F:00 B:00 C:00 D:00 E:00 H:12 L:35 SP:0000 PC:0100 PCMEM:00,C3,13,02',
+        )
+
+    def test_identical_traces(self):
+        self._write_log(self.lines)
+        self.assertTrue(diff(self.trace_filename, self.log_filename, io.StringIO()))
+
+    def test_first_divergence_is_reported(self):
+        lines = list(self.lines)
+        lines[42] = lines[42].replace('L:5E', 'L:FF')
+        self._write_log(lines)
+
+        output = io.StringIO()
+        self.assertFalse(diff(self.trace_filename, self.log_filename, output))
+        self.assertIn('instruction 43 (cycle 168)', output.getvalue())
+        self.assertIn('differing: L', output.getvalue())
+
+    def test_truncated_reference(self):
+        self._write_log(self.lines[:60])
+
+        output = io.StringIO()
+        self.assertFalse(diff(self.trace_filename, self.log_filename, output))
+        self.assertIn('instruction 61', output.getvalue())
+        self.assertIn('<end of reference>', output.getvalue())
+
+    def test_blocks_without_states_do_not_end_the_reference(self):
+        lines = list(self.lines)
+        lines[70] = lines[70].replace('A:46', 'A:00')
+        # With small chunks, whole chunks of the reference hold no state at all
+        lines[50:50] = ['# ' + '-' * 70] * 20 + ['']
+        self._write_log(lines)
+
+        output = io.StringIO()
+        with mock.patch('tools.trace_diff.CHUNK_SIZE', 256):
+            self.assertFalse(diff(self.trace_filename, self.log_filename, output))
+        self.assertIn('instruction 71 (cycle 280)', output.getvalue())
+        self.assertIn('differing: A', output.getvalue())
+
+
+class TestTraceRecorder(unittest.TestCase):
+    def test_recorded_states_decode_to_the_cpu_states(self):
+        memory = Memory()
+        memory.load_rom(call_ret_rom())
+        cpu = CPU(memory, enable_debugger=False)
+        trace = io.BytesIO()
+        cpu.start_trace(trace)
+
+        expected = []
+        for _ in range(50):
+            r = cpu.registers
+            pcmem = ','.join(f'{byte:02X}' for byte in memory.content[r.pc:r.pc + 4])
+            expected.append(
+                f'A:{r.a:02X} F:{r.f:02X} B:{r.b:02X} C:{r.c:02X} D:{r.d:02X} E:{r.e:02X} '
+                f'H:{r.h:02X} L:{r.l:02X} SP:{r.sp:04X} PC:{r.pc:04X} PCMEM:{pcmem}'
+            )
+            cpu.step()
+        cpu.stop_trace()
+
+        output = io.StringIO()
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'trace.bin')
+            with open(filename, 'wb') as f:
+                f.write(trace.getvalue())
+            decode(filename, output)
+
+        lines = output.getvalue().splitlines()
+        self.assertEqual(lines, expected)
+        # Like the boot ROM leaves it, which is where gameboy-doctor logs start
+        self.assertEqual(lines[0], 'A:01 F:B0 B:00 C:13 D:00 E:D8 H:01 L:4D SP:FFFE PC:0100 PCMEM:00,C3,50,01')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from benchmarks.roms import CODE_START
+from benchmarks.roms import ENTRY_POINT
+from benchmarks.roms import ROM_SIZE
+from benchmarks.roms import Assembler
+from benchmarks.roms import call_ret_rom
+from benchmarks.roms import halt_rom
+from cpu import translator
+from cpu.cpu import CPU
+from mmu.memory import Memory
+
+
+def oam_dma_rom() -> bytes:
+    asm = Assembler(CODE_START)
+    asm.emit(0x21, 0x00, 0xc0)  # LD HL,$c000
+    asm.emit(0x36, 0x5a)  # LD (HL),$5a
+    asm.label('loop')
+    asm.emit(0x3e, 0xc1, 0xe0, 0x46)  # LD A,$c1, LDH ($46),A: start OAM DMA
+    asm.emit(0x7e, 0x47)  # LD A,(HL), LD B,A: read while the bus is held
+    asm.emit(0x0e, 0x40)  # LD C,$40
+    asm.label('wait')
+    asm.emit(0x0d)  # DEC C
+    asm.jr(0x20, 'wait')  # JR NZ,wait, longer than the transfer
+    asm.emit(0x7e, 0x57)  # LD A,(HL), LD D,A: read once the transfer is over
+    asm.jr(0x18, 'loop')  # JR loop
+
+    rom = bytearray(ROM_SIZE)
+    rom[ENTRY_POINT:ENTRY_POINT + 4] = bytes([0x00, 0xc3, CODE_START & 0xff, CODE_START >> 8])
+    rom[asm.origin:asm.address] = asm.code
+    return bytes(rom)
+
+
+def create_cpu(rom: bytes) -> CPU:
+    memory = Memory()
+    memory.load_rom(rom)
+    return CPU(memory, False)
+
+
+class TestTranslator(unittest.TestCase):
+    def setUp(self):
+        cache = tempfile.TemporaryDirectory()
+        self.addCleanup(cache.cleanup)
+        patcher = mock.patch.dict(os.environ, {'XDG_CACHE_HOME': cache.name})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def assert_runs_like_the_interpreter(self, rom: bytes):
+        interpreted = create_cpu(rom)
+        translated = create_cpu(rom)
+        translated.enable_translation(rom)
+
+        for _ in range(20):
+            interpreted.run(5000)
+            translated.run(5000)
+            self.assertEqual(translated.registers, interpreted.registers)
+            self.assertEqual(translated.cycles, interpreted.cycles)
+            self.assertEqual(translated.memory.content, interpreted.memory.content)
+
+    def test_calls_run_like_the_interpreter(self):
+        self.assert_runs_like_the_interpreter(call_ret_rom())
+
+    def test_interrupts_run_like_the_interpreter(self):
+        self.assert_runs_like_the_interpreter(halt_rom())
+
+    def test_oam_dma_runs_like_the_interpreter(self):
+        rom = oam_dma_rom()
+        self.assert_runs_like_the_interpreter(rom)
+
+        cpu = create_cpu(rom)
+        cpu.run(5000)
+        self.assertEqual((cpu.registers.b, cpu.registers.d), (0xff, 0x5a))
+
+    def test_translation_is_loaded_from_the_cache(self):
+        rom = call_ret_rom()
+        create_cpu(rom).enable_translation(rom)
+
+        with mock.patch.object(translator, 'translate') as translate:
+            create_cpu(rom).enable_translation(rom)
+            translate.assert_not_called()
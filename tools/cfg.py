@@ -0,0 +1,98 @@
+import argparse
+import json
+import os
+import sys
+from typing import TextIO
+
+from cpu.analysis import CACHE_VERSION
+from cpu.analysis import ControlFlowGraph
+from cpu.analysis import analyze
+from cpu.analysis import rom_hash
+from tools.decompiler import parse_entry
+from utils import files
+from utils.files import read_binary_file
+
+
+def cache_directory() -> str:
+    return files.cache_directory('cfg')
+
+
+def load_or_analyze(rom: bytes, use_cache: bool = True) -> ControlFlowGraph:
+    """Returns the graph of a ROM from the disk cache, analyzing and caching it on a miss."""
+    path = os.path.join(cache_directory(), f'{rom_hash(rom)}.json')
+
+    if use_cache:
+        try:
+            with open(path) as f:
+                data = json.load(f)
+            if data.get('version') == CACHE_VERSION:
+                return ControlFlowGraph.from_json(data)
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+    graph = analyze(rom)
+
+    if use_cache:
+        files.write_atomic(path, json.dumps(graph.to_json()).encode())
+
+    return graph
+
+
+def write_dot(graph: ControlFlowGraph, output: TextIO, call_graph: bool = False) -> None:
+    output.write('digraph rom {\n  node [shape=box, fontname=monospace];\n')
+
+    if call_graph:
+        for entry, callees in graph.call_graph.items():
+            block = graph.blocks[entry]
+            size = sum(graph.blocks[offset].instructions for offset in graph.functions[entry])
+            output.write(f'  "{block.label()}" [label="{block.label()}\\n{size} instructions"];\n')
+            for callee in callees:
+                output.write(f'  "{block.label()}" -> "{graph.blocks[callee].label()}";\n')
+        output.write('}\n')
+        return
+
+    banks = sorted({block.bank for block in graph.blocks.values()})
+    for bank in banks:
+        output.write(f'  subgraph cluster_bank_{bank:02x} {{\n    label="bank {bank:02x}";\n')
+        for block in graph.blocks_in_bank(bank):
+            output.write(f'    "{block.label()}" [label="{block.label()}\\n{block.instructions} instructions"];\n')
+        output.write('  }\n')
+
+    for block in graph.blocks.values():
+        for successor in block.successors:
+            output.write(f'  "{block.label()}" -> "{graph.blocks[successor].label()}";\n')
+        if block.call is not None:
+            output.write(f'  "{block.label()}" -> "{graph.blocks[block.call].label()}" [style=dashed];\n')
+
+    output.write('}\n')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Extracts the basic blocks, control flow graph and call graph of a ROM.')
+    parser.add_argument('filename', help='the filename of the ROM to analyze')
+    parser.add_argument('-f', '--format', choices=['json', 'dot'], default='json', help='output format')
+    parser.add_argument('-c', '--call-graph', action='store_true', help='output the call graph instead of the CFG (dot)')
+    parser.add_argument(
+        '-e', '--entry', action='append', type=parse_entry, default=[], metavar='BANK:ADDRESS',
+        help='additional entry point, in hexadecimal (disables the cache)',
+    )
+    parser.add_argument('--no-cache', action='store_true', help=f'do not use the cache in {cache_directory()}')
+    parser.add_argument('-o', '--output', help='write to this file instead of stdout')
+    args = parser.parse_args()
+
+    file_data = read_binary_file(args.filename)
+    if args.entry:
+        result = analyze(file_data, args.entry)
+    else:
+        result = load_or_analyze(file_data, use_cache=not args.no_cache)
+
+    output_file = open(args.output, 'w') if args.output else sys.stdout
+    try:
+        if args.format == 'dot':
+            write_dot(result, output_file, args.call_graph)
+        else:
+            json.dump(result.to_json(), output_file, indent=1)
+            output_file.write('\n')
+    finally:
+        if args.output:
+            output_file.close()
@@ -1,43 +1,247 @@
 import argparse
-from typing import Iterator
+import sys
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import TextIO
+from typing import Tuple
 
-from cpu.opcodes import opcodes
-from custom_types import u8
-from utils.bit_operations import combine_bytes
+from cpu import opcode_table
+from cpu.analysis import BANK_SIZE
+from cpu.analysis import ENTRY_POINTS
+from cpu.analysis import decode
+from cpu.analysis import recursive_descent
+from cpu.analysis import to_address
+from cpu.instruction import FLOW_INVALID
+from cpu.instruction import OPERAND_NONE
+from cpu.instruction import OPERAND_RELATIVE
+from cpu.instruction import OPERAND_U16
+from cpu.instruction import OPERAND_U8
+from cpu.instruction import index_opcode
 from utils.files import read_binary_file
 
+OUTPUT_CHUNK_LINES = 4096
+DATA_BYTES_PER_LINE = 8
 
-def decompile(iterator: Iterator[int]) -> None:
-    while True:
-        opcode = u8(next(iterator, None))
-        if opcode is None:
-            return
+# Flat tables indexed by opcode_index(), so that decoding never builds objects
+NAMES: List[str] = list(opcode_table.NAMES)
+LENGTHS: List[int] = list(opcode_table.LENGTHS)
+FLOWS: List[int] = list(opcode_table.FLOWS)
+OPERANDS: List[int] = list(opcode_table.OPERANDS)
 
-        if is_prefixed_opcode(opcode):
-            opcode = combine_bytes(opcode, u8(next(iterator)))
 
-        instruction = opcodes[opcode]
-        operand_bytes = bytes([next(iterator) for _ in range(instruction.args_length)])
+def _suffix_format(opcode: int, name: str, operand: int) -> str:
+    """%-format of what follows the address on the line of an instruction, the raw bytes and the mnemonic."""
+    text = name.replace('%', '%%')
+    if operand == OPERAND_NONE:
+        raw = f'{opcode >> 8:02x} {opcode & 0xff:02x}' if opcode > 0xff else f'{opcode:02x}'
+    elif operand == OPERAND_U16:
+        raw = f'{opcode:02x} %02x %02x'
+        text = text.replace('u16', '$%04x')
+    else:
+        raw = f'{opcode:02x} %02x'
+        text = text.replace('u8', '$%02x').replace('i8', '$%04x' if operand == OPERAND_RELATIVE else '%+d')
 
-        if len(operand_bytes) > 0:
-            operands = read_operands(operand_bytes)
-            print(f'{instruction} ${operands:x}')
+    return f'  {raw + " " * (9 - len(raw.replace("%02x", "xx")))} {text}'
+
+
+def _build_tables() -> Tuple[List[str], List[Optional[str]], List[Optional[List[str]]]]:
+    """Returns LINE_FORMATS, ONE_BYTE_SUFFIXES and TWO_BYTE_SUFFIXES."""
+    suffix_formats = [_suffix_format(index_opcode(index), NAMES[index], OPERANDS[index]) for index in range(0x200)]
+    # Bank prefix and address come first
+    line_formats = ['%s%04x' + suffix_format for suffix_format in suffix_formats]
+
+    one_byte: List[Optional[str]] = [None] * 0x100
+    two_byte: List[Optional[List[str]]] = [None] * 0x100
+    for byte in range(0x100):
+        kind = OPERANDS[byte]
+        if byte == 0xcb:
+            two_byte[byte] = [suffix_formats[0x100 | second] % () for second in range(0x100)]
+        elif FLOWS[byte] == FLOW_INVALID:
+            one_byte[byte] = f'            db ${byte:02x}'
+        elif kind == OPERAND_NONE:
+            one_byte[byte] = suffix_formats[byte] % ()
+        elif kind == OPERAND_U8:
+            two_byte[byte] = [suffix_formats[byte] % (value, value) for value in range(0x100)]
+        elif kind != OPERAND_U16 and kind != OPERAND_RELATIVE:
+            two_byte[byte] = [
+                suffix_formats[byte] % (value, value - 0x100 if value & 0x80 else value) for value in range(0x100)
+            ]
+
+    return line_formats, one_byte, two_byte
+
+
+# %-format of a whole disassembly line, indexed by opcode_index(), the arguments depend on the operand kind.
+# Then what follows the address on the line of each instruction fully known from its first two bytes, so
+# that the linear disassembly formats most lines with one lookup. Indexed by the first byte, then by the
+# second one for two-byte instructions, None for the others (u16 operands and relative jumps).
+LINE_FORMATS, ONE_BYTE_SUFFIXES, TWO_BYTE_SUFFIXES = _build_tables()
+
+
+def format_instruction(rom: memoryview, offset: int, index: int, operand: int) -> str:
+    bank, address = to_address(offset)
+    return _format_line(f'{bank:02x}:', address, index, operand)
+
+
+def _format_line(prefix: str, address: int, index: int, operand: int) -> str:
+    kind = OPERANDS[index]
+    line_format = LINE_FORMATS[index]
+
+    if kind == OPERAND_NONE:
+        return line_format % (prefix, address)
+    if kind == OPERAND_U8:
+        return line_format % (prefix, address, operand, operand)
+    if kind == OPERAND_U16:
+        return line_format % (prefix, address, operand & 0xff, operand >> 8, operand)
+    if kind == OPERAND_RELATIVE:
+        target = (address + 2 + (operand - 0x100 if operand & 0x80 else operand)) & 0xffff
+        return line_format % (prefix, address, operand, target)
+    return line_format % (prefix, address, operand, operand - 0x100 if operand & 0x80 else operand)
+
+
+def format_data(rom: memoryview, offset: int, end: int) -> List[str]:
+    lines = []
+    for start in range(offset, end, DATA_BYTES_PER_LINE):
+        bank, address = to_address(start)
+        chunk = rom[start:min(start + DATA_BYTES_PER_LINE, end)]
+        lines.append(f'{bank:02x}:{address:04x}            db {",".join(f"${byte:02x}" for byte in chunk)}')
+    return lines
+
+
+def linear_lines(rom: memoryview) -> Iterable[List[str]]:
+    """Disassembles every byte in order, yields chunks of lines."""
+    size = len(rom)
+    formats = LINE_FORMATS
+    kinds = OPERANDS
+    lengths = LENGTHS
+    one_byte = ONE_BYTE_SUFFIXES
+    addresses = [f'{address:04x}' for address in range(2 * BANK_SIZE)]
+    two_byte = TWO_BYTE_SUFFIXES
+    offset = 0
+
+    for bank_start in range(0, size, BANK_SIZE):
+        bank, base = to_address(bank_start)
+        prefix = f'{bank:02x}:'
+        # The last instruction of the previous bank may have spilled into this one
+        end = min(bank_start + BANK_SIZE, size)
+        lines = []
+        append = lines.append
+        delta = base - bank_start
+
+        # Away from the end of the ROM every instruction fits, most lines are a lookup away
+        fast_end = min(end, size - 2)
+        while offset < fast_end:
+            byte = rom[offset]
+            suffix = one_byte[byte]
+            if suffix is not None:
+                append(prefix + addresses[offset + delta] + suffix)
+                offset += 1
+                continue
+
+            suffixes = two_byte[byte]
+            if suffixes is not None:
+                append(prefix + addresses[offset + delta] + suffixes[rom[offset + 1]])
+                offset += 2
+            elif kinds[byte] == OPERAND_U16:
+                append(_format_line(prefix, offset + delta, byte, rom[offset + 1] | rom[offset + 2] << 8))
+                offset += 3
+            else:
+                append(_format_line(prefix, offset + delta, byte, rom[offset + 1]))
+                offset += 2
+
+        while offset < end:
+            index = rom[offset]
+            if index == 0xcb and offset + 1 < size:
+                index = 0x100 | rom[offset + 1]
+
+            kind = kinds[index]
+            address = base + offset - bank_start
+
+            if kind == OPERAND_NONE:
+                if FLOWS[index] == FLOW_INVALID:
+                    append(f'{prefix}{address:04x}            db ${rom[offset]:02x}')
+                    offset += 1
+                else:
+                    append(formats[index] % (prefix, address))
+                    offset += lengths[index]
+            elif offset + lengths[index] > size:
+                lines.extend(format_data(rom, offset, size))
+                offset = size
+            elif kind == OPERAND_U8:
+                operand = rom[offset + 1]
+                append(formats[index] % (prefix, address, operand, operand))
+                offset += 2
+            else:
+                operand = rom[offset + 1] if kind != OPERAND_U16 else rom[offset + 1] | rom[offset + 2] << 8
+                append(_format_line(prefix, address, index, operand))
+                offset += lengths[index]
+
+        yield lines
+
+
+def recursive_lines(rom: memoryview, starts: bytearray) -> Iterable[List[str]]:
+    """Disassembles the instructions found by recursive_descent(), the rest as data, yields chunks of lines."""
+    offset = 0
+    lines = []
+
+    while offset < len(rom):
+        if starts[offset]:
+            index, operand = decode(rom, offset)
+            lines.append(format_instruction(rom, offset, index, operand))
+            offset += LENGTHS[index]
         else:
-            print(instruction)
+            # Everything up to the next instruction is data
+            end = starts.find(1, offset)
+            end = len(rom) if end < 0 else end
+            lines.extend(format_data(rom, offset, end))
+            offset = end
+
+        if len(lines) >= OUTPUT_CHUNK_LINES:
+            yield lines
+            lines = []
+
+    yield lines
 
 
-def is_prefixed_opcode(byte: u8) -> bool:
-    return byte == 0xcb
+def write_chunked(chunks: Iterable[List[str]], output: TextIO) -> None:
+    for lines in chunks:
+        if lines:
+            lines.append('')
+            output.write('\n'.join(lines))
+
+
+def decompile(data: bytes, output: TextIO, recursive: bool = False, entries: Iterable[Tuple[int, int]] = ()) -> None:
+    with memoryview(data) as rom:
+        if recursive:
+            starts = recursive_descent(rom, [(0, address) for address in ENTRY_POINTS] + list(entries))
+            write_chunked(recursive_lines(rom, starts), output)
+        else:
+            write_chunked(linear_lines(rom), output)
 
 
-def read_operands(arg: bytes) -> int:
-    return int.from_bytes(arg, byteorder='little')
+def parse_entry(value: str) -> Tuple[int, int]:
+    bank, _, address = value.rpartition(':')
+    return int(bank or '0', 16), int(address, 16)
 
 
 if __name__ == '__main__':
-    parser = argparse.ArgumentParser(description='Decompiles a GameBoy ROM.')
+    parser = argparse.ArgumentParser(description='Disassembles a GameBoy ROM.')
     parser.add_argument('filename', help='the filename of the ROM to decompile')
+    parser.add_argument(
+        '-r', '--recursive', action='store_true',
+        help='follow the control flow from the entry points and vectors, everything else is shown as data',
+    )
+    parser.add_argument(
+        '-e', '--entry', action='append', type=parse_entry, default=[], metavar='BANK:ADDRESS',
+        help='additional entry point for the recursive mode, in hexadecimal',
+    )
+    parser.add_argument('-o', '--output', help='write the disassembly to this file instead of stdout')
     args = parser.parse_args()
 
     file_data = read_binary_file(args.filename)
-    decompile(iter(file_data))
+    output_file = open(args.output, 'w', buffering=1 << 20) if args.output else sys.stdout
+    try:
+        decompile(file_data, output_file, args.recursive, args.entry)
+    finally:
+        if args.output:
+            output_file.close()
@@ -0,0 +1,125 @@
+import argparse
+import multiprocessing
+import os
+import sys
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from apu.apu import APU
+from cpu.cpu import CPU
+from mmu.memory import Memory
+from ppu.hashing import FrameHashes
+from ppu.hashing import read_golden
+from ppu.hashing import write_golden
+from ppu.output import write_png
+from ppu.ppu import FRAME_CYCLES
+from utils.files import read_binary_file
+
+DEFAULT_FRAMES = '60,300,600'
+# Frames are not counted while the LCD is off, give up on the missing ones after that many frames of cycles
+TIMEOUT_FACTOR = 2
+
+
+def golden_filename(directory: str, rom: str) -> str:
+    return os.path.join(directory, os.path.basename(rom) + '.frames')
+
+
+def run_frames(rom: str, hashes: FrameHashes, translate: bool = False) -> None:
+    """Runs the ROM headlessly until the last frame hashes wants."""
+    memory = Memory()
+    rom_data = read_binary_file(rom)
+    memory.load_rom(rom_data)
+
+    cpu = CPU(memory, enable_debugger=False)
+    if translate:
+        cpu.enable_translation(rom_data)
+    APU(memory)
+    cpu.ppu.add_output(hashes)
+
+    timeout = cpu.cycles + hashes.last * FRAME_CYCLES * TIMEOUT_FACTOR
+    while not hashes.done and cpu.cycles < timeout:
+        cpu.run(FRAME_CYCLES)
+    cpu.ppu.close()
+
+
+def record(arguments: Tuple[str, str, List[int], bool]) -> List[str]:
+    rom, directory, frames, translate = arguments
+    hashes = FrameHashes(frames)
+    try:
+        run_frames(rom, hashes, translate)
+    except Exception as e:
+        return [f'{rom}: {type(e).__name__}: {e}']
+
+    write_golden(golden_filename(directory, rom), hashes.golden())
+    missing = sorted(set(frames) - hashes.hashes.keys())
+    return [f'{rom}: frame {number} was never displayed' for number in missing]
+
+
+def check(arguments: Tuple[str, str, Optional[str], bool]) -> List[str]:
+    rom, directory, diff_directory, translate = arguments
+    try:
+        expected = read_golden(golden_filename(directory, rom))
+    except OSError as e:
+        return [f'{rom}: no golden file, {e.strerror}']
+
+    hashes = FrameHashes(expected.frames, expected)
+    try:
+        run_frames(rom, hashes, translate)
+    except Exception as e:
+        return [f'{rom}: {type(e).__name__}: {e}']
+
+    failures = []
+    for number in sorted(expected.frames.keys() - hashes.hashes.keys()):
+        failures.append(f'{rom}: frame {number} was never displayed')
+
+    # Images are only written for the frames that changed
+    for number, framebuffer in sorted(hashes.mismatches.items()):
+        message = f'{rom}: frame {number} differs'
+        if diff_directory:
+            filename = os.path.join(diff_directory, f'{os.path.basename(rom)}-{number}.png')
+            write_png(filename, memoryview(framebuffer))
+            message += f', see {filename}'
+        failures.append(message)
+
+    if not failures and hashes.golden().sequence != expected.sequence:
+        failures.append(f'{rom}: the chosen frames match but frames in between differ')
+    return failures
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description='Compares the frames ROMs display with golden hashes, recorded by an earlier version.'
+    )
+    parser.add_argument('command', choices=('record', 'check'))
+    parser.add_argument('roms', nargs='+', help='ROMs to run')
+    parser.add_argument('-g', '--golden', required=True, help='directory of the golden files, one per ROM')
+    parser.add_argument('-f', '--frames', default=DEFAULT_FRAMES, help='frames to hash when recording, comma separated')
+    parser.add_argument('-d', '--diff-dir', help='directory to write the frames which differ to, as PNG')
+    parser.add_argument('-t', '--translate', action='store_true', help='run the translated ROMs')
+    parser.add_argument('-j', '--jobs', type=int, default=multiprocessing.cpu_count(), help='parallel processes')
+    args = parser.parse_args()
+
+    if args.command == 'record':
+        os.makedirs(args.golden, exist_ok=True)
+        frames = [int(number) for number in args.frames.split(',')]
+        worker, cases = record, [(rom, args.golden, frames, args.translate) for rom in args.roms]
+    else:
+        if args.diff_dir:
+            os.makedirs(args.diff_dir, exist_ok=True)
+        worker, cases = check, [(rom, args.golden, args.diff_dir, args.translate) for rom in args.roms]
+
+    failed_roms = 0
+    with multiprocessing.Pool(args.jobs) as pool:
+        for failures in pool.imap_unordered(worker, cases):
+            if failures:
+                failed_roms += 1
+                print('\n'.join(failures))
+
+    verb = 'recorded' if args.command == 'record' else 'match their golden hashes'
+    print(f'{len(args.roms) - failed_roms}/{len(args.roms)} ROMs {verb}')
+    return 1 if failed_roms else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
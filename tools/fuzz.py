@@ -0,0 +1,199 @@
+import argparse
+import multiprocessing
+import random
+import sys
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from cpu.cpu import CPU
+from cpu.instrumentation import OpcodeStats
+from cpu.opcodes import instruction_table
+from mmu.memory import Memory
+
+ROM_SIZE = 0x8000
+OAM_START = 0xfe00
+CODE_START = 0x100
+DEFAULT_CASES = 1000
+DEFAULT_BLOCKS = 8
+DEFAULT_BLOCK_CYCLES = 2000
+
+REGISTERS = ['a', 'f', 'b', 'c', 'd', 'e', 'h', 'l', 'sp', 'pc', 'ime', 'halted', 'halt_bug']
+
+# Encodings of the instructions that can appear in the generated code, CB-prefixed ones included, and
+# the length of their operands. Everything but the unimplemented opcodes, the 0xcb prefix being one.
+VALID_INSTRUCTIONS: List[Tuple[bytes, int]] = [
+    (opcode.to_bytes(2 if opcode > 0xff else 1, 'big'), instruction.args_length)
+    for opcode, instruction in instruction_table().items()
+    if instruction.run.__name__ != '_default_operation'
+]
+
+State = Tuple[tuple, bytes, int]
+
+# An engine runs the CPU for at least the given number of cycles, like CPU.run does
+Engine = Callable[[CPU, int], None]
+
+
+def run_reference(cpu: CPU, cycles: int) -> None:
+    # One instruction at a time through CPU.step, the plain interpreter every engine must agree with
+    until = cpu.cycles + cycles
+    while cpu.cycles < until:
+        cpu.step()
+
+
+def run_interpreter(cpu: CPU, cycles: int) -> None:
+    cpu.run(cycles)
+
+
+def run_opcode_stats(cpu: CPU, cycles: int) -> None:
+    if not cpu.opcode_stats:
+        cpu.enable_opcode_stats(OpcodeStats(sample_rate=1))
+    cpu.run(cycles)
+
+
+def run_translated(cpu: CPU, cycles: int) -> None:
+    if not cpu.is_translated:
+        cpu.enable_translation(bytes(cpu.memory.content[:ROM_SIZE]), use_cache=False)
+    cpu.run(cycles)
+
+
+ENGINES: Dict[str, Engine] = {
+    'interpreter': run_interpreter,
+    'opcode-stats': run_opcode_stats,
+    'translated': run_translated,
+}
+
+
+def random_program(rng: random.Random, size: int) -> bytearray:
+    program = bytearray()
+
+    while len(program) < size:
+        encoding, args_length = rng.choice(VALID_INSTRUCTIONS)
+        program += encoding
+        program += rng.randbytes(args_length)
+
+    return program[:size]
+
+
+def random_machine(seed: int) -> Tuple[bytes, dict]:
+    rng = random.Random(seed)
+
+    # Code everywhere up to OAM so that random jumps keep executing instructions,
+    # I/O registers and HRAM get random values
+    content = bytearray(rng.randbytes(0x10000))
+    content[:OAM_START] = random_program(rng, OAM_START)
+
+    registers = {name: rng.randrange(0x100) for name in 'abcdehl'}
+    registers['f'] = rng.randrange(0x10) << 4
+    registers['sp'] = rng.randrange(0xc100, 0xdf00)
+    registers['pc'] = rng.choice([CODE_START, rng.randrange(ROM_SIZE)])
+    registers['ime'] = rng.random() < 0.5
+
+    return bytes(content), registers
+
+
+def create_cpu(content: bytes, registers: dict) -> CPU:
+    memory = Memory()
+    memory.content[:] = content
+    cpu = CPU(memory, False)
+
+    for name, value in registers.items():
+        setattr(cpu.registers, name, value)
+
+    return cpu
+
+
+def capture(cpu: CPU, error: Optional[Exception]) -> State:
+    registers = tuple(getattr(cpu.registers, name) for name in REGISTERS)
+    error_type = type(error).__name__ if error else None
+    return registers + (error_type,), bytes(cpu.memory.content), cpu.cycles
+
+
+def run_blocks(engine: Engine, seed: int, blocks: int, block_cycles: int) -> List[State]:
+    content, registers = random_machine(seed)
+    cpu = create_cpu(content, registers)
+    states = []
+
+    for _ in range(blocks):
+        try:
+            engine(cpu, block_cycles)
+        except Exception as e:
+            states.append(capture(cpu, e))
+            break
+        states.append(capture(cpu, None))
+
+    return states
+
+
+def describe_difference(expected: State, actual: State) -> str:
+    expected_registers, expected_memory, expected_cycles = expected
+    actual_registers, actual_memory, actual_cycles = actual
+    differences = []
+
+    for name, ours, theirs in zip(REGISTERS + ['error'], actual_registers, expected_registers):
+        if ours != theirs:
+            differences.append(f'{name}={ours!r} (expected {theirs!r})')
+
+    if actual_cycles != expected_cycles:
+        differences.append(f'cycles={actual_cycles} (expected {expected_cycles})')
+
+    if actual_memory != expected_memory:
+        address = next(i for i, (ours, theirs) in enumerate(zip(actual_memory, expected_memory)) if ours != theirs)
+        differences.append(
+            f'memory[{address:#06x}]={actual_memory[address]:#04x} (expected {expected_memory[address]:#04x})'
+        )
+
+    return ', '.join(differences)
+
+
+def check_case(arguments: Tuple[int, List[str], int, int]) -> List[str]:
+    seed, engines, blocks, block_cycles = arguments
+    expected = run_blocks(run_reference, seed, blocks, block_cycles)
+    failures = []
+
+    for name in engines:
+        actual = run_blocks(ENGINES[name], seed, blocks, block_cycles)
+
+        for block, (expected_state, actual_state) in enumerate(zip(expected, actual)):
+            if expected_state != actual_state:
+                failures.append(
+                    f'seed {seed}, engine {name}, block {block}: {describe_difference(expected_state, actual_state)}'
+                )
+                break
+        else:
+            if len(expected) != len(actual):
+                failures.append(f'seed {seed}, engine {name}: ran {len(actual)} blocks instead of {len(expected)}')
+
+    return failures
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description='Runs random programs on the reference interpreter and on every engine, and compares them.'
+    )
+    parser.add_argument('-n', '--cases', type=int, default=DEFAULT_CASES, help='number of random programs')
+    parser.add_argument('-s', '--seed', type=int, default=0, help='seed of the first program')
+    parser.add_argument('-e', '--engine', action='append', choices=sorted(ENGINES), help='engines to check, all by default')
+    parser.add_argument('-b', '--blocks', type=int, default=DEFAULT_BLOCKS, help='comparisons per program')
+    parser.add_argument('-c', '--block-cycles', type=int, default=DEFAULT_BLOCK_CYCLES, help='cycles between comparisons')
+    parser.add_argument('-j', '--jobs', type=int, default=multiprocessing.cpu_count(), help='parallel processes')
+    args = parser.parse_args()
+
+    engines = args.engine or sorted(ENGINES)
+    cases = [(seed, engines, args.blocks, args.block_cycles) for seed in range(args.seed, args.seed + args.cases)]
+    failed_cases = 0
+
+    with multiprocessing.Pool(args.jobs) as pool:
+        for failures in pool.imap_unordered(check_case, cases, chunksize=4):
+            if failures:
+                failed_cases += 1
+                print('\n'.join(failures))
+
+    print(f'{args.cases - failed_cases}/{args.cases} programs behave like the reference interpreter')
+    return 1 if failed_cases else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
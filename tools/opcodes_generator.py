@@ -1,37 +1,120 @@
 import argparse
 import json
+import sys
+from typing import List
 
+from cpu.instruction import FLOW_BRANCH
+from cpu.instruction import FLOW_CALL
+from cpu.instruction import FLOW_INDIRECT
+from cpu.instruction import FLOW_INVALID
+from cpu.instruction import FLOW_JUMP
+from cpu.instruction import FLOW_NONE
+from cpu.instruction import FLOW_RETURN
+from cpu.instruction import FLOW_RETURN_CONDITIONAL
+from cpu.instruction import OPERAND_I8
+from cpu.instruction import OPERAND_NONE
+from cpu.instruction import OPERAND_RELATIVE
+from cpu.instruction import OPERAND_U16
+from cpu.instruction import OPERAND_U8
+
+HEADER = '''\
+# Generated by tools/opcodes_generator.py from tools/data/dmgops.json, do not edit.
+#
+# Flat tables indexed by cpu.instruction.opcode_index(): the 256 unprefixed opcodes
+# followed by the 256 CB-prefixed ones. Importing them builds no objects, see
+# cpu.opcodes.instruction_table() for the CPUInstruction definitions.
+'''
+
+
+def _instructions(data: dict) -> List[dict]:
+    return data['Unprefixed'] + data['CBPrefixed']
+
+
+def _opcode(index: int) -> int:
+    return 0xcb00 | (index & 0xff) if index > 0xff else index
+
+
+def flow(name: str) -> int:
+    if name == 'UNUSED' or name == 'PREFIX CB':
+        return FLOW_INVALID
+    if name == 'JP HL':
+        return FLOW_INDIRECT
+    if name.startswith(('JP', 'JR')):
+        return FLOW_BRANCH if ',' in name else FLOW_JUMP
+    if name.startswith(('CALL', 'RST')):
+        return FLOW_CALL
+    if name in ('RET', 'RETI'):
+        return FLOW_RETURN
+    if name.startswith('RET'):
+        return FLOW_RETURN_CONDITIONAL
+    return FLOW_NONE
 
-def to_dict_entry(value: int, json_object: dict) -> str:
-    hex_repr = f'0x{value:02x}'
-    return (
-        f"{hex_repr}: CPUInstruction(\n"
-        f"    name='{json_object['Name']}\',\n"
-        f"    length={json_object['Length']},\n"
-        f"    cycles_no_branch={json_object['TCyclesNoBranch']},\n"
-        f"    cycles_branch={json_object['TCyclesBranch']},\n"
-        f"    opcode={hex_repr},\n"
-        f"),"
-    )
 
+def operand(name: str) -> int:
+    if flow(name) == FLOW_INVALID:
+        return OPERAND_NONE
+    if name.startswith('JR'):
+        return OPERAND_RELATIVE
+    if 'u16' in name:
+        return OPERAND_U16
+    if 'u8' in name:
+        return OPERAND_U8
+    if 'i8' in name:
+        return OPERAND_I8
+    return OPERAND_NONE
 
-def process_file(filename: str) -> None:
-    with open(filename) as f:
-        data = json.load(f)
 
-    for i, instruction in enumerate(data['Unprefixed']):
-        entry = to_dict_entry(i, instruction)
-        print(entry)
+def _bytes_literal(values: List[int]) -> str:
+    lines = [
+        "    b'" + ''.join(f'\\x{value:02x}' for value in values[start:start + 16]) + "'"
+        for start in range(0, len(values), 16)
+    ]
+    return '(\n' + '\n'.join(lines) + '\n)'
 
-    for i, instruction in enumerate(data['CBPrefixed']):
-        value = (0xcb << 8) + i
-        entry = to_dict_entry(value, instruction)
-        print(entry)
+
+def table_module(data: dict) -> str:
+    instructions = _instructions(data)
+    lengths = [instruction['Length'] for instruction in instructions]
+    args_lengths = [length - (2 if index > 0xff else 1) for index, length in enumerate(lengths)]
+
+    names = [instruction['Name'] for instruction in instructions]
+    names_literal = '(\n' + '\n'.join(f'    {name!r},' for name in names) + '\n)'
+    return (
+        f'{HEADER}\n'
+        f'NAMES = {names_literal}\n\n'
+        f'LENGTHS = {_bytes_literal(lengths)}\n\n'
+        '# Operand bytes following the opcode\n'
+        f'ARGS_LENGTHS = {_bytes_literal(args_lengths)}\n\n'
+        f"CYCLES_NO_BRANCH = {_bytes_literal([instruction['TCyclesNoBranch'] for instruction in instructions])}\n\n"
+        f"CYCLES_BRANCH = {_bytes_literal([instruction['TCyclesBranch'] for instruction in instructions])}\n\n"
+        '# Operand kinds, see OPERAND_* in cpu.instruction\n'
+        f'OPERANDS = {_bytes_literal([operand(name) for name in names])}\n\n'
+        '# Control flow kinds, see FLOW_* in cpu.instruction\n'
+        f'FLOWS = {_bytes_literal([flow(name) for name in names])}\n'
+    )
+
+
+def handler_stubs(data: dict) -> str:
+    # Boilerplate for new entries of cpu.opcodes.handlers
+    return '\n'.join(
+        f"    # {instruction['Name']}\n    {_opcode(index):#04x}: None,"
+        for index, instruction in enumerate(_instructions(data))
+    )
 
 
 if __name__ == '__main__':
-    parser = argparse.ArgumentParser(description='Generates boilerplate code for opcodes.')
+    parser = argparse.ArgumentParser(description='Generates the opcode table module (cpu/opcode_table.py).')
     parser.add_argument('filename', help='the path of the JSON file containing the opcode definitions')
+    parser.add_argument('--handlers', action='store_true', help='print boilerplate for the handlers table instead')
+    parser.add_argument('-o', '--output', help='write to this file instead of stdout')
     args = parser.parse_args()
 
-    process_file(args.filename)
+    with open(args.filename) as f:
+        opcode_data = json.load(f)
+
+    result = handler_stubs(opcode_data) + '\n' if args.handlers else table_module(opcode_data)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(result)
+    else:
+        sys.stdout.write(result)
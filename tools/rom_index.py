@@ -0,0 +1,161 @@
+import argparse
+import hashlib
+import json
+import os
+import sys
+from dataclasses import asdict
+from dataclasses import dataclass
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+
+from mmu.cartridge import CartridgeHeader
+from mmu.cartridge import parse_header
+from utils import files
+from utils.files import read_binary_file
+
+CACHE_VERSION = 1
+ROM_EXTENSIONS = ('.gb', '.gbc', '.sgb')
+
+
+def cache_path() -> str:
+    return os.path.join(files.cache_directory('roms'), 'index.json')
+
+
+@dataclass
+class RomEntry:
+    path: str
+    size: int
+    mtime_ns: int
+    rom_hash: str
+    header: Optional[CartridgeHeader]  # None when the file is too small to hold one
+
+
+class RomIndex:
+    """Metadata of the ROMs of some directories, cached on disk across runs.
+
+    Headers are cached by content hash, so copies and renamed files are parsed once. A file is only read
+    again once its size or modification time changes.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self._path = path
+        self._files: Dict[str, dict] = {}  # path -> size, mtime_ns and hash
+        self._headers: Dict[str, Optional[dict]] = {}  # hash -> header
+        self.read_count = 0
+        if path:
+            self._load()
+
+    def scan(self, directory: str) -> List[RomEntry]:
+        directory = os.path.abspath(directory)
+        seen = set()
+        entries = []
+
+        for entry in _rom_files(directory):
+            stat = entry.stat()
+            cached = self._files.get(entry.path)
+            if not cached or cached['size'] != stat.st_size or cached['mtime_ns'] != stat.st_mtime_ns:
+                rom = read_binary_file(entry.path)
+                self.read_count += 1
+                rom_hash = hashlib.sha1(rom).hexdigest()
+                if rom_hash not in self._headers:
+                    self._headers[rom_hash] = _parse(rom)
+                cached = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'hash': rom_hash}
+                self._files[entry.path] = cached
+
+            seen.add(entry.path)
+            header = self._headers[cached['hash']]
+            entries.append(RomEntry(
+                entry.path,
+                cached['size'],
+                cached['mtime_ns'],
+                cached['hash'],
+                CartridgeHeader(**header) if header else None,
+            ))
+
+        # Forget the files which are gone
+        prefix = os.path.join(directory, '')
+        for path in [path for path in self._files if path.startswith(prefix) and path not in seen]:
+            del self._files[path]
+
+        return sorted(entries, key=lambda rom: rom.path)
+
+    def save(self) -> None:
+        if not self._path:
+            return
+
+        # Headers no file refers to anymore are dropped
+        hashes = {cached['hash'] for cached in self._files.values()}
+        data = {
+            'version': CACHE_VERSION,
+            'files': self._files,
+            'headers': {rom_hash: header for rom_hash, header in self._headers.items() if rom_hash in hashes},
+        }
+        files.write_atomic(self._path, json.dumps(data).encode())
+
+    def _load(self) -> None:
+        try:
+            with open(self._path) as f:
+                data = json.load(f)
+            if data.get('version') == CACHE_VERSION:
+                self._files = data['files']
+                self._headers = data['headers']
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+
+def _rom_files(directory: str) -> Iterator[os.DirEntry]:
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                yield from _rom_files(entry.path)
+            elif entry.name.lower().endswith(ROM_EXTENSIONS):
+                yield entry
+
+
+def _parse(rom: bytes) -> Optional[dict]:
+    try:
+        return asdict(parse_header(rom))
+    except ValueError:
+        return None
+
+
+def matches(rom: RomEntry, args: argparse.Namespace) -> bool:
+    header = rom.header
+    if header is None:
+        return not (args.mbc or args.min_rom_size or args.max_rom_size or args.ram or args.valid)
+    return (
+        (not args.mbc or header.mbc in args.mbc)
+        and header.rom_size >= args.min_rom_size
+        and (not args.max_rom_size or header.rom_size <= args.max_rom_size)
+        and (not args.ram or header.ram_size > 0)
+        and (not args.valid or header.header_checksum_valid and header.global_checksum_valid)
+    )
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Lists the ROMs of directories and their cartridge headers, from a cache of their metadata.'
+    )
+    parser.add_argument('directories', nargs='+', help='directories to search for ROMs, recursively')
+    parser.add_argument('-m', '--mbc', action='append', type=str.upper, help='only this MBC, like MBC1 or ROM, can be repeated')
+    parser.add_argument('--min-rom-size', type=int, default=0, metavar='KB', help='only ROMs of at least that size')
+    parser.add_argument('--max-rom-size', type=int, default=0, metavar='KB', help='only ROMs of at most that size')
+    parser.add_argument('--ram', action='store_true', help='only cartridges with RAM')
+    parser.add_argument('--valid', action='store_true', help='only ROMs whose checksums are valid')
+    parser.add_argument('-f', '--format', choices=['paths', 'json'], default='paths', help='output format')
+    parser.add_argument('--no-cache', action='store_true', help=f'do not use the cache in {cache_path()}')
+    args = parser.parse_args()
+    args.min_rom_size *= 1024
+    args.max_rom_size *= 1024
+
+    index = RomIndex(None if args.no_cache else cache_path())
+    roms = [rom for directory in args.directories for rom in index.scan(directory) if matches(rom, args)]
+    index.save()
+
+    if args.format == 'json':
+        json.dump([asdict(rom) for rom in roms], sys.stdout, indent=1)
+        sys.stdout.write('\n')
+    else:
+        sys.stdout.write(''.join(f'{rom.path}\n' for rom in roms))
@@ -0,0 +1,32 @@
+import argparse
+import sys
+from typing import TextIO
+
+from tracer import read_trace
+
+
+def decode(filename: str, output: TextIO) -> None:
+    lines = []
+
+    with open(filename, 'rb') as f:
+        for record in read_trace(f):
+            lines.append(record.to_doctor())
+            if len(lines) == 4096:
+                lines.append('')
+                output.write('\n'.join(lines))
+                lines.clear()
+
+    if lines:
+        lines.append('')
+        output.write('\n'.join(lines))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Prints a binary execution trace in the gameboy-doctor format. '
+                    'Use tools.trace_diff to compare traces.'
+    )
+    parser.add_argument('filename', help='the binary trace to decode')
+    args = parser.parse_args()
+
+    decode(args.filename, sys.stdout)
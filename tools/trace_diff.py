@@ -0,0 +1,202 @@
+import argparse
+import re
+import sys
+from typing import BinaryIO
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import TextIO
+
+from tracer import MAGIC
+from tracer import RECORD
+
+# Both traces are converted to this layout before being compared:
+# A, F, B, C, D, E, H, L, SP (big endian), PC (big endian), 4 bytes at PC
+STATE_SIZE = 16
+STATE_FIELDS = ['A', 'F', 'B', 'C', 'D', 'E', 'H', 'L', 'SP', 'SP', 'PC', 'PC', 'PCMEM', 'PCMEM', 'PCMEM', 'PCMEM']
+
+# Offsets of the state bytes within a binary trace record, in the order above
+RECORD_OFFSETS = [14, 15, 17, 16, 19, 18, 21, 20, 23, 22, 9, 8, 10, 11, 12, 13]
+
+# gameboy-doctor lines are fixed width, which lets us pick hex digits by column
+DOCTOR_LINE_SIZE = 74
+DOCTOR_DIGIT_COLUMNS = [
+    2, 3, 7, 8, 12, 13, 17, 18, 22, 23, 27, 28, 32, 33, 37, 38,
+    43, 44, 45, 46, 51, 52, 53, 54, 62, 63, 65, 66, 68, 69, 71, 72,
+]
+DOCTOR_LINE = re.compile(
+    rb'A:(\w\w) F:(\w\w) B:(\w\w) C:(\w\w) D:(\w\w) E:(\w\w) H:(\w\w) L:(\w\w) '
+    rb'SP:(\w{4}) PC:(\w{4}) PCMEM:(\w\w),(\w\w),(\w\w),(\w\w)'
+)
+
+CHUNK_SIZE = 1 << 22
+CONTEXT_RECORDS = 5
+
+
+def _gather(chunk: bytes, record_size: int, offsets: List[int]) -> bytearray:
+    # Strided slices move whole columns at once instead of unpacking record by record
+    count = len(chunk) // record_size
+    gathered = bytearray(count * len(offsets))
+    for position, offset in enumerate(offsets):
+        gathered[position::len(offsets)] = chunk[offset::record_size][:count]
+    return gathered
+
+
+def _binary_states(f: BinaryIO) -> Iterator[bytes]:
+    chunk_size = CHUNK_SIZE - CHUNK_SIZE % RECORD.size
+
+    while True:
+        chunk = f.read(chunk_size)
+        if not chunk:
+            return
+        yield bytes(_gather(chunk, RECORD.size, RECORD_OFFSETS))
+
+
+def _parse_doctor_lines(block: bytes) -> bytes:
+    if (
+        len(block) % DOCTOR_LINE_SIZE == 0
+        and block.count(b'\n') == len(block) // DOCTOR_LINE_SIZE
+        and block[DOCTOR_LINE_SIZE - 1::DOCTOR_LINE_SIZE].count(b'\n') == len(block) // DOCTOR_LINE_SIZE
+    ):
+        return bytes.fromhex(_gather(block, DOCTOR_LINE_SIZE, DOCTOR_DIGIT_COLUMNS).decode())
+
+    # Not the canonical layout (CRLF, extra columns...), fall back to parsing each line
+    states = bytearray()
+    for line in block.splitlines():
+        match = DOCTOR_LINE.search(line)
+        if match:
+            states += bytes.fromhex(b''.join(match.groups()).decode())
+    return bytes(states)
+
+
+def _doctor_states(f: BinaryIO) -> Iterator[bytes]:
+    remainder = b''
+
+    while True:
+        chunk = f.read(CHUNK_SIZE)
+        if not chunk:
+            if remainder.strip():
+                yield _parse_doctor_lines(remainder.upper() + b'\n')
+            return
+
+        data = remainder + chunk
+        end = data.rfind(b'\n') + 1
+        remainder = data[end:]
+        if end:
+            yield _parse_doctor_lines(data[:end].upper())
+
+
+def read_states(f: BinaryIO) -> Iterator[bytes]:
+    """Streams the CPU states of a binary trace or a gameboy-doctor log, in chunks of packed states."""
+    if f.read(len(MAGIC)) == MAGIC:
+        return _binary_states(f)
+
+    f.seek(0)
+    return _doctor_states(f)
+
+
+def format_state(state: bytes) -> str:
+    return (
+        f'A:{state[0]:02X} F:{state[1]:02X} B:{state[2]:02X} C:{state[3]:02X} D:{state[4]:02X} '
+        f'E:{state[5]:02X} H:{state[6]:02X} L:{state[7]:02X} SP:{state[8]:02X}{state[9]:02X} '
+        f'PC:{state[10]:02X}{state[11]:02X} PCMEM:{",".join(f"{byte:02X}" for byte in state[12:16])}'
+    )
+
+
+def _first_difference(ours: bytes, theirs: bytes) -> int:
+    # Binary search for the longest matching prefix, in number of states
+    low, high = 0, min(len(ours), len(theirs)) // STATE_SIZE
+    while low < high:
+        middle = (low + high + 1) // 2
+        if ours[:middle * STATE_SIZE] == theirs[:middle * STATE_SIZE]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def _cycle_of(filename: str, index: int) -> Optional[int]:
+    with open(filename, 'rb') as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            return None
+        f.seek(len(MAGIC) + index * RECORD.size)
+        data = f.read(RECORD.size)
+        return RECORD.unpack(data)[0] if len(data) == RECORD.size else None
+
+
+def _next_states(chunks: Iterator[bytes]) -> bytes:
+    # Blocks of blank or unrecognized lines parse to no states, only the end of the file ends a trace
+    return next((states for states in chunks if states), b'')
+
+
+def diff(filename: str, reference: str, output: TextIO) -> bool:
+    """Reports the first instruction where our trace and the reference disagree.
+
+    Both files are streamed in large chunks and matching spans are skipped with
+    a single comparison of the whole window.
+    """
+    with open(filename, 'rb') as ours_file, open(reference, 'rb') as theirs_file:
+        ours_chunks = read_states(ours_file)
+        theirs_chunks = read_states(theirs_file)
+        ours = theirs = b''
+        history = b''
+        index = 0
+
+        while True:
+            if not ours:
+                ours = _next_states(ours_chunks)
+            if not theirs:
+                theirs = _next_states(theirs_chunks)
+
+            size = min(len(ours), len(theirs))
+            if not size:
+                if ours or theirs:
+                    break
+                output.write(f'traces are identical ({index} instructions)\n')
+                return True
+
+            if ours[:size] != theirs[:size]:
+                matching = _first_difference(ours, theirs)
+                history = (history + ours[:matching * STATE_SIZE])[-CONTEXT_RECORDS * STATE_SIZE:]
+                index += matching
+                ours = ours[matching * STATE_SIZE:]
+                theirs = theirs[matching * STATE_SIZE:]
+                break
+
+            history = (history + ours[:size])[-CONTEXT_RECORDS * STATE_SIZE:]
+            index += size // STATE_SIZE
+            ours = ours[size:]
+            theirs = theirs[size:]
+
+    output.write(f'traces diverge at instruction {index + 1}')
+    cycle = _cycle_of(filename, index)
+    if cycle is not None:
+        output.write(f' (cycle {cycle})')
+    output.write('\n')
+
+    for offset in range(0, len(history), STATE_SIZE):
+        output.write(f'  {format_state(history[offset:offset + STATE_SIZE])}\n')
+
+    ours_state = ours[:STATE_SIZE]
+    theirs_state = theirs[:STATE_SIZE]
+    output.write(f'- {format_state(theirs_state) if theirs_state else "<end of reference>"}\n')
+    output.write(f'+ {format_state(ours_state) if ours_state else "<end of trace>"}\n')
+
+    if ours_state and theirs_state:
+        fields = sorted(
+            {STATE_FIELDS[i] for i in range(STATE_SIZE) if ours_state[i] != theirs_state[i]},
+            key=STATE_FIELDS.index,
+        )
+        output.write(f'differing: {", ".join(fields)}\n')
+
+    return False
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Finds the first divergence between two execution traces.')
+    parser.add_argument('filename', help='our trace, binary or gameboy-doctor text')
+    parser.add_argument('reference', help='the reference trace, binary or gameboy-doctor text')
+    args = parser.parse_args()
+
+    if not diff(args.filename, args.reference, sys.stdout):
+        sys.exit(1)
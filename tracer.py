@@ -0,0 +1,105 @@
+import struct
+from typing import BinaryIO
+from typing import Iterator
+from typing import NamedTuple
+
+from cpu.registers import Registers
+from cpu.timer import Timer
+from mmu.memory import Memory
+
+MAGIC = b'GBTRACE1'
+
+# cycle, PC, 4 bytes at PC (opcode and operands), A, F, BC, DE, HL, SP
+RECORD = struct.Struct('<QH4sBBHHHH')
+DEFAULT_BUFFER_RECORDS = 1 << 16
+
+
+class TraceRecord(NamedTuple):
+    cycle: int
+    pc: int
+    pcmem: bytes
+    a: int
+    f: int
+    bc: int
+    de: int
+    hl: int
+    sp: int
+
+    def to_doctor(self) -> str:
+        # Log line format of gameboy-doctor, which most reference emulators can produce
+        return (
+            f'A:{self.a:02X} F:{self.f:02X} B:{self.bc >> 8:02X} C:{self.bc & 0xff:02X} '
+            f'D:{self.de >> 8:02X} E:{self.de & 0xff:02X} H:{self.hl >> 8:02X} L:{self.hl & 0xff:02X} '
+            f'SP:{self.sp:04X} PC:{self.pc:04X} PCMEM:{",".join(f"{byte:02X}" for byte in self.pcmem)}'
+        )
+
+
+class TraceRecorder:
+    """Writes the CPU state before each instruction as fixed-size binary records.
+
+    Records are packed into a preallocated buffer which is only written out
+    once full, so the output file sees a few large writes instead of one per
+    instruction.
+    """
+
+    def __init__(
+        self,
+        registers: Registers,
+        memory: Memory,
+        timer: Timer,
+        output: BinaryIO,
+        buffer_records: int = DEFAULT_BUFFER_RECORDS,
+    ):
+        self._registers = registers
+        self._memory = memory
+        self._timer = timer
+        self._output = output
+        self._buffer = bytearray(RECORD.size * buffer_records)
+        self._offset = 0
+
+        self._output.write(MAGIC)
+
+    def record(self, pc: int) -> None:
+        registers = self._registers
+        RECORD.pack_into(
+            self._buffer,
+            self._offset,
+            self._timer.cycles,
+            pc,
+            self._memory.content[pc:pc + 4],
+            registers.a,
+            registers.f,
+            registers.bc,
+            registers.de,
+            registers.hl,
+            registers.sp,
+        )
+        self._offset += RECORD.size
+
+        if self._offset == len(self._buffer):
+            self.flush()
+
+    def flush(self) -> None:
+        with memoryview(self._buffer) as view:
+            self._output.write(view[:self._offset])
+        self._offset = 0
+        self._output.flush()
+
+
+def read_trace(trace: BinaryIO, chunk_records: int = DEFAULT_BUFFER_RECORDS) -> Iterator[TraceRecord]:
+    if trace.read(len(MAGIC)) != MAGIC:
+        raise ValueError('Not a binary execution trace')
+
+    chunk_size = RECORD.size * chunk_records
+
+    while True:
+        chunk = trace.read(chunk_size)
+        if not chunk:
+            return
+
+        if len(chunk) % RECORD.size:
+            # The emulator was killed in the middle of a flush, drop the partial record
+            chunk = chunk[:len(chunk) - len(chunk) % RECORD.size]
+
+        for fields in RECORD.iter_unpack(chunk):
+            yield TraceRecord(*fields)
@@ -1,3 +1,21 @@
+import os
+
+
 def read_binary_file(filename: str) -> bytes:
     with open(filename, 'rb') as f:
         return f.read()
+
+
+def cache_directory(name: str) -> str:
+    """Directory of a cache, whose entries carry a version bumped whenever their format changes."""
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'gameboy-emulator', name)
+
+
+def write_atomic(path: str, data: bytes) -> None:
+    """Writes a file through a temporary one, so that concurrent readers never see it half written."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temporary_path = f'{path}.{os.getpid()}.tmp'
+    with open(temporary_path, 'wb') as f:
+        f.write(data)
+    os.replace(temporary_path, path)